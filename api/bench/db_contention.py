@@ -0,0 +1,269 @@
+"""Database contention benchmark: the old engine setup against the tuned one.
+
+Runs the same mixed workload against each setup for a fixed time, each in
+its own scratch database:
+
+    workspace  create a workspace with its job and activity, then report
+               job progress a few times (one commit each), like an ingest job
+    chatter    append agent messages (one commit each), like a streaming chat
+    poll       read job status and an agent's recent messages, like the UI
+
+Setups:
+
+    legacy     the engine this app used to create: rollback journal, default
+               synchronous, the driver's 5s lock wait, default pool
+    tuned      database.create_db_engine: WAL, busy_timeout,
+               synchronous=NORMAL, foreign keys, DB_POOL_SIZE/DB_MAX_OVERFLOW
+
+For each setup it reports operations/second and p50/p95/p99/max latency
+per operation, plus "database is locked" failures.
+
+    python -m bench.db_contention --seconds 10 --workspace 4 --chatter 8 --poll 8
+    python -m bench.db_contention --postgres postgresql+psycopg://ken@localhost/ken_bench
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import tempfile
+import threading
+import time
+from collections import defaultdict
+
+from sqlalchemy import create_engine, desc
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+import database
+from models import Activity, Agent, AgentMessage, Job, Workspace, generate_workspace_id
+
+PROGRESS_UPDATES = 5
+MESSAGE_SIZE = 600
+
+
+def legacy_engine(url: str):
+    """The engine database.py created before it was configurable"""
+    return create_engine(url, connect_args={"check_same_thread": False})
+
+
+def _percentile(values, fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class Recorder:
+    """Thread-safe latencies (ms) and failures per operation"""
+
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.locked = defaultdict(int)
+        self.failed = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def run(self, operation: str, func):
+        start = time.perf_counter()
+        try:
+            func()
+        except OperationalError as e:
+            with self._lock:
+                if "locked" in str(e):
+                    self.locked[operation] += 1
+                else:
+                    self.failed[operation] += 1
+            return
+        elapsed = (time.perf_counter() - start) * 1000
+        with self._lock:
+            self.latencies[operation].append(elapsed)
+
+    def report(self, seconds: float) -> dict:
+        operations = sorted(set(self.latencies) | set(self.locked) | set(self.failed))
+        result = {}
+        for operation in operations:
+            latencies = self.latencies[operation]
+            result[operation] = {
+                "ops": len(latencies),
+                "ops_per_second": round(len(latencies) / seconds, 1),
+                "p50_ms": round(_percentile(latencies, 0.50), 2),
+                "p95_ms": round(_percentile(latencies, 0.95), 2),
+                "p99_ms": round(_percentile(latencies, 0.99), 2),
+                "max_ms": round(max(latencies), 2) if latencies else 0.0,
+                "locked": self.locked[operation],
+                "failed": self.failed[operation],
+            }
+        return result
+
+
+def _seed(SessionLocal, workspaces: int) -> list:
+    """Workspaces with one agent each; returns the agent ids"""
+    db = SessionLocal()
+    try:
+        agent_ids = []
+        for _ in range(workspaces):
+            workspace = Workspace(id=generate_workspace_id(), name="Bench Space", ticker="BNCH")
+            agent = Agent(workspace_id=workspace.id, name="Analyst Ken")
+            db.add_all([workspace, agent])
+            db.flush()
+            agent_ids.append(agent.id)
+        db.commit()
+        return agent_ids
+    finally:
+        db.rollback()
+        db.close()
+
+
+def _create_workspace(SessionLocal, recorder: Recorder, job_ids: list, job_ids_lock: threading.Lock):
+    db = SessionLocal()
+    try:
+        job = {}
+
+        def create():
+            workspace = Workspace(id=generate_workspace_id(), name="Bench Space", ticker="BNCH")
+            db.add(workspace)
+            db.flush()
+            record = Job(workspace_id=workspace.id, kind="ticker_ingest", progress={})
+            db.add_all([record, Activity(
+                workspace_id=workspace.id, category="main", status=0,
+                title="Fetching filings", message="Downloading 10-K and 10-Q filings",
+            )])
+            db.commit()
+            job["id"] = record.id
+
+        recorder.run("workspace", create)
+        if "id" not in job:
+            db.rollback()
+            return
+        with job_ids_lock:
+            job_ids.append(job["id"])
+
+        for done in range(1, PROGRESS_UPDATES + 1):
+            def progress(done=done):
+                record = db.get(Job, job["id"])
+                record.stage = "download"
+                record.progress = {"download": {"status": "running", "total": PROGRESS_UPDATES, "done": done}}
+                db.commit()
+
+            recorder.run("job_progress", progress)
+            db.rollback()
+    finally:
+        db.close()
+
+
+def _chatter(SessionLocal, recorder: Recorder, agent_id: str, text: str):
+    db = SessionLocal()
+    try:
+        def append():
+            db.add(AgentMessage(agent_id=agent_id, role="assistant", message=text))
+            db.commit()
+
+        recorder.run("chatter", append)
+        db.rollback()
+    finally:
+        db.close()
+
+
+def _poll(SessionLocal, recorder: Recorder, agent_id: str, job_id):
+    db = SessionLocal()
+    try:
+        def read():
+            if job_id is not None:
+                db.get(Job, job_id)
+            db.query(AgentMessage).filter(AgentMessage.agent_id == agent_id).order_by(
+                desc(AgentMessage.timestamp)
+            ).limit(50).all()
+
+        recorder.run("poll", read)
+    finally:
+        db.close()
+
+
+def run_setup(engine, seconds: float, threads: dict, seed_workspaces: int) -> dict:
+    """Run the workload for `seconds` against engine; return the setup report"""
+    database.Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    agent_ids = _seed(SessionLocal, seed_workspaces)
+    recorder = Recorder()
+    job_ids, job_ids_lock = [], threading.Lock()
+    text = "x" * MESSAGE_SIZE
+    deadline = time.perf_counter() + seconds
+
+    def worker(role: str, seed: int):
+        rng = random.Random(seed)
+        while time.perf_counter() < deadline:
+            if role == "workspace":
+                _create_workspace(SessionLocal, recorder, job_ids, job_ids_lock)
+            elif role == "chatter":
+                _chatter(SessionLocal, recorder, rng.choice(agent_ids), text)
+            else:
+                with job_ids_lock:
+                    job_id = rng.choice(job_ids) if job_ids else None
+                _poll(SessionLocal, recorder, rng.choice(agent_ids), job_id)
+
+    workers = [
+        threading.Thread(target=worker, args=(role, n), daemon=True)
+        for role, count in threads.items()
+        for n in range(count)
+    ]
+    start = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    engine.dispose()
+    return {"seconds": round(elapsed, 3), "operations": recorder.report(elapsed)}
+
+
+def _print_report(name: str, report: dict):
+    print(f"\n{name} ({report['seconds']}s)")
+    print(f"  {'operation':<13}{'ops/s':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>10}{'locked':>8}{'failed':>8}")
+    for operation, stats in report["operations"].items():
+        print(f"  {operation:<13}{stats['ops_per_second']:>9}{stats['p50_ms']:>9}{stats['p95_ms']:>9}"
+              f"{stats['p99_ms']:>9}{stats['max_ms']:>10}{stats['locked']:>8}{stats['failed']:>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=10, help="run time per setup")
+    parser.add_argument("--workspace", type=int, default=4, help="workspace creation threads")
+    parser.add_argument("--chatter", type=int, default=8, help="agent message threads")
+    parser.add_argument("--poll", type=int, default=8, help="reader threads")
+    parser.add_argument("--seed-workspaces", type=int, default=20, help="workspaces/agents created up front")
+    parser.add_argument("--setups", nargs="+", default=["legacy", "tuned"], choices=["legacy", "tuned"])
+    parser.add_argument("--postgres", help="also run the tuned engine against this (empty) database URL")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    parser.add_argument("--keep", action="store_true", help="keep the scratch directory")
+    args = parser.parse_args()
+
+    threads = {"workspace": args.workspace, "chatter": args.chatter, "poll": args.poll}
+    work_dir = tempfile.mkdtemp(prefix="db-contention-")
+    reports = {}
+    try:
+        for setup in args.setups:
+            url = f"sqlite:///{os.path.join(work_dir, f'{setup}.db')}"
+            engine = legacy_engine(url) if setup == "legacy" else database.create_db_engine(url)
+            reports[setup] = run_setup(engine, args.seconds, threads, args.seed_workspaces)
+        if args.postgres:
+            reports["postgres"] = run_setup(
+                database.create_db_engine(args.postgres), args.seconds, threads, args.seed_workspaces,
+            )
+    finally:
+        if not args.keep:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    if args.json:
+        print(json.dumps(reports, indent=2))
+    else:
+        print(f"threads: {args.workspace} workspace, {args.chatter} chatter, {args.poll} poll; "
+              f"pool {database.DB_POOL_SIZE}+{database.DB_MAX_OVERFLOW}, "
+              f"busy timeout {database.SQLITE_BUSY_TIMEOUT_MS}ms")
+        for name, report in reports.items():
+            _print_report(name, report)
+        if args.keep:
+            print(f"\nScratch directory kept at {work_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,340 @@
+"""Local stand-in for the SEC EDGAR endpoints used by services/sec_client.py.
+
+Serves a corpus directory laid out like the SEC's URL space:
+
+    files/company_tickers_exchange.json
+    submissions/CIK##########.json            (and older pages it lists)
+    Archives/edgar/data/{cik}/{acc_nodash}/{accession}.txt
+
+Point the API at it with SEC_WWW_URL and SEC_DATA_URL (both the www and the
+data host paths are served from one port). Latency and error injection are
+configurable, and `release_until` hides filings newer than a date so an
+incremental sync can be replayed against the same corpus.
+
+    python -m bench.edgar_stub generate bench/corpus --tickers 5
+    python -m bench.edgar_stub record bench/corpus AAPL MSFT --since 2020-01-01
+    python -m bench.edgar_stub serve bench/corpus --port 8765 --latency-ms 40
+"""
+import argparse
+import json
+import os
+import random
+import threading
+import time
+from collections import Counter
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional
+
+
+class EdgarStub:
+    """Threaded HTTP server over a corpus directory.
+
+    Each request sleeps latency_ms (plus up to jitter_ms), then fails with
+    503 at error_rate and 429 at throttle_rate before serving the file.
+    """
+
+    def __init__(self, corpus_dir: str, host: str = "127.0.0.1", port: int = 0,
+                 latency_ms: float = 0, jitter_ms: float = 0,
+                 error_rate: float = 0, throttle_rate: float = 0, seed: Optional[int] = None):
+        self.corpus_dir = os.path.abspath(corpus_dir)
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.release_until: Optional[str] = None
+        self.requests = Counter()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._thread = None
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                stub._handle(self)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "EdgarStub":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def reset_counts(self):
+        with self._lock:
+            self.requests.clear()
+
+    def _kind(self, path: str) -> str:
+        if path.startswith("/submissions/"):
+            return "submissions"
+        if path.startswith("/Archives/"):
+            return "filing"
+        return "other"
+
+    def _resolve(self, path: str) -> Optional[str]:
+        path = path.split("?", 1)[0]
+        full = os.path.abspath(os.path.join(self.corpus_dir, path.lstrip("/")))
+        if not full.startswith(self.corpus_dir + os.sep) or not os.path.isfile(full):
+            return None
+        return full
+
+    def _submissions(self, full_path: str) -> bytes:
+        """Submissions JSON with filings after release_until removed"""
+        with open(full_path, "rb") as f:
+            data = json.load(f)
+        page = data["filings"]["recent"] if "filings" in data else data
+        keep = [i for i, d in enumerate(page["filingDate"]) if d <= self.release_until]
+        for key, values in page.items():
+            if isinstance(values, list):
+                page[key] = [values[i] for i in keep]
+        return json.dumps(data).encode()
+
+    def _handle(self, request: BaseHTTPRequestHandler):
+        kind = self._kind(request.path)
+        with self._lock:
+            self.requests[kind] += 1
+            delay = self.latency_ms + self._random.uniform(0, self.jitter_ms)
+            roll = self._random.random()
+        if delay > 0:
+            time.sleep(delay / 1000.0)
+
+        if roll < self.error_rate:
+            return self._send(request, 503, b"Service Unavailable")
+        if roll < self.error_rate + self.throttle_rate:
+            with self._lock:
+                self.requests["throttled"] += 1
+            return self._send(request, 429, b"Too Many Requests")
+
+        full_path = self._resolve(request.path)
+        if full_path is None:
+            return self._send(request, 404, b"Not Found")
+        if kind == "submissions" and self.release_until:
+            body = self._submissions(full_path)
+        else:
+            with open(full_path, "rb") as f:
+                body = f.read()
+        content_type = "application/json" if full_path.endswith(".json") else "text/plain"
+        self._send(request, 200, body, content_type)
+
+    def _send(self, request, status: int, body: bytes, content_type: str = "text/plain"):
+        request.send_response(status)
+        request.send_header("Content-Type", content_type)
+        request.send_header("Content-Length", str(len(body)))
+        request.end_headers()
+        request.wfile.write(body)
+
+
+def _accession(cik: int, year: int, seq: int) -> str:
+    return f"{cik:010d}-{year % 100:02d}-{seq:06d}"
+
+
+def _filing_text(accession: str, cik: int, company: str, form_type: str,
+                 period: date, filed: date, size_kb: int) -> str:
+    header = (
+        f"<SEC-DOCUMENT>{accession}.txt : {filed:%Y%m%d}\n"
+        f"<SEC-HEADER>{accession}.hdr.sgml : {filed:%Y%m%d}\n"
+        f"ACCESSION NUMBER:\t\t{accession}\n"
+        f"CONFORMED SUBMISSION TYPE:\t{form_type}\n"
+        f"PUBLIC DOCUMENT COUNT:\t\t2\n"
+        f"CONFORMED PERIOD OF REPORT:\t{period:%Y%m%d}\n"
+        f"FILED AS OF DATE:\t\t{filed:%Y%m%d}\n"
+        f"DATE AS OF CHANGE:\t\t{filed:%Y%m%d}\n\n"
+        f"FILER:\n\n\tCOMPANY DATA:\t\n"
+        f"\t\tCOMPANY CONFORMED NAME:\t\t\t{company}\n"
+        f"\t\tCENTRAL INDEX KEY:\t\t\t{cik:010d}\n"
+        f"\t\tFISCAL YEAR END:\t\t\t1231\n"
+        f"</SEC-HEADER>\n"
+    )
+    line = f"<p>{company} {form_type} for the period ended {period:%B %d, %Y}.</p>\n"
+    body = line * max(1, size_kb * 1024 // len(line))
+    return (
+        f"{header}"
+        f"<DOCUMENT>\n<TYPE>{form_type}\n<SEQUENCE>1\n<FILENAME>report.htm\n<TEXT>\n"
+        f"<html><body>\n{body}</body></html>\n</TEXT>\n</DOCUMENT>\n"
+        f"<DOCUMENT>\n<TYPE>EX-31.1\n<SEQUENCE>2\n<FILENAME>ex31.htm\n<TEXT>\n"
+        f"<html><body><p>Certification</p></body></html>\n</TEXT>\n</DOCUMENT>\n"
+        f"</SEC-DOCUMENT>\n"
+    )
+
+
+def _write(path: str, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    mode = "wb" if isinstance(content, bytes) else "w"
+    with open(path, mode) as f:
+        f.write(content)
+
+
+def _write_submissions(corpus_dir: str, cik: int, ticker: str, company: str,
+                       filings: List[dict], page_size: int):
+    """Write the submissions JSON, newest first, splitting old filings into pages"""
+    filings = sorted(filings, key=lambda f: f["filingDate"], reverse=True)
+    fields = ["accessionNumber", "filingDate", "reportDate", "form", "primaryDocument"]
+
+    def columns(rows):
+        return {field: [row[field] for row in rows] for field in fields}
+
+    pages = [filings[i:i + page_size] for i in range(0, len(filings), page_size)] or [[]]
+    files = []
+    for number, rows in enumerate(pages[1:], start=1):
+        name = f"CIK{cik:010d}-submissions-{number:03d}.json"
+        _write(os.path.join(corpus_dir, "submissions", name), json.dumps(columns(rows)))
+        files.append({
+            "name": name,
+            "filingCount": len(rows),
+            "filingFrom": rows[-1]["filingDate"],
+            "filingTo": rows[0]["filingDate"],
+        })
+    submissions = {
+        "cik": str(cik),
+        "name": company,
+        "tickers": [ticker],
+        "filings": {"recent": columns(pages[0]), "files": files},
+    }
+    _write(os.path.join(corpus_dir, "submissions", f"CIK{cik:010d}.json"), json.dumps(submissions))
+
+
+def generate_corpus(corpus_dir: str, tickers: int = 5, start_year: int = 2015,
+                    end_year: int = 2024, size_kb: int = 64, page_size: int = 1000,
+                    seed: int = 0) -> List[str]:
+    """Write a synthetic corpus: one 10-K and three 10-Qs per ticker per year.
+
+    Returns the ticker symbols.
+    """
+    rng = random.Random(seed)
+    symbols = []
+    rows = []
+    for n in range(tickers):
+        cik = 1000000 + n
+        ticker = f"TST{n}"
+        company = f"Test Company {n} Inc"
+        symbols.append(ticker)
+        rows.append([cik, company, ticker, "Nasdaq"])
+
+        filings = []
+        seq = 1
+        for year in range(start_year, end_year + 1):
+            for quarter in range(1, 5):
+                form_type = "10-K" if quarter == 4 else "10-Q"
+                period = date(year, quarter * 3, 28)
+                filed = period + timedelta(days=(60 if form_type == "10-K" else 35) + rng.randint(0, 9))
+                accession = _accession(cik, filed.year, seq)
+                seq += 1
+                _write(
+                    os.path.join(
+                        corpus_dir, "Archives", "edgar", "data", str(cik),
+                        accession.replace("-", ""), f"{accession}.txt",
+                    ),
+                    _filing_text(accession, cik, company, form_type, period, filed, size_kb),
+                )
+                filings.append({
+                    "accessionNumber": accession,
+                    "filingDate": filed.isoformat(),
+                    "reportDate": period.isoformat(),
+                    "form": form_type,
+                    "primaryDocument": "report.htm",
+                })
+        _write_submissions(corpus_dir, cik, ticker, company, filings, page_size)
+
+    _write(
+        os.path.join(corpus_dir, "files", "company_tickers_exchange.json"),
+        json.dumps({"fields": ["cik", "name", "ticker", "exchange"], "data": rows}),
+    )
+    return symbols
+
+
+def record_corpus(corpus_dir: str, tickers: List[str], since: str,
+                  form_types: List[str] = ("10-Q", "10-K")):
+    """Capture the live SEC responses the client needs for tickers into corpus_dir"""
+    from config import SEC_WWW_URL, SEC_DATA_URL
+    from services import sec_client
+
+    mapping = sec_client._get(f"{SEC_WWW_URL}/files/company_tickers_exchange.json")
+    _write(os.path.join(corpus_dir, "files", "company_tickers_exchange.json"), mapping.content)
+
+    for ticker in tickers:
+        cik = sec_client.get_cik(ticker)
+        submissions = sec_client._get(f"{SEC_DATA_URL}/submissions/CIK{cik}.json")
+        _write(os.path.join(corpus_dir, "submissions", f"CIK{cik}.json"), submissions.content)
+        for page in submissions.json()["filings"].get("files", []):
+            if page.get("filingTo", "") < since:
+                continue
+            content = sec_client._get(f"{SEC_DATA_URL}/submissions/{page['name']}").content
+            _write(os.path.join(corpus_dir, "submissions", page["name"]), content)
+
+        for form_type in form_types:
+            for filing in sec_client.list_filings(cik, form_type, since):
+                accession = filing["accession"]
+                _write(
+                    os.path.join(
+                        corpus_dir, "Archives", "edgar", "data", cik.lstrip("0"),
+                        accession.replace("-", ""), f"{accession}.txt",
+                    ),
+                    sec_client.download_filing(cik, accession),
+                )
+        print(f"Recorded {ticker}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    generate = commands.add_parser("generate", help="write a synthetic corpus")
+    generate.add_argument("corpus")
+    generate.add_argument("--tickers", type=int, default=5)
+    generate.add_argument("--start-year", type=int, default=2015)
+    generate.add_argument("--end-year", type=int, default=2024)
+    generate.add_argument("--size-kb", type=int, default=64)
+    generate.add_argument("--page-size", type=int, default=1000)
+
+    record = commands.add_parser("record", help="capture live SEC responses")
+    record.add_argument("corpus")
+    record.add_argument("tickers", nargs="+")
+    record.add_argument("--since", default="2015-01-01")
+
+    serve = commands.add_parser("serve", help="serve a corpus")
+    serve.add_argument("corpus")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument("--latency-ms", type=float, default=0)
+    serve.add_argument("--jitter-ms", type=float, default=0)
+    serve.add_argument("--error-rate", type=float, default=0)
+    serve.add_argument("--throttle-rate", type=float, default=0)
+    serve.add_argument("--release-until", help="hide filings filed after this date (YYYY-MM-DD)")
+
+    args = parser.parse_args()
+    if args.command == "generate":
+        symbols = generate_corpus(
+            args.corpus, args.tickers, args.start_year, args.end_year, args.size_kb, args.page_size
+        )
+        print(f"Wrote {len(symbols)} tickers to {args.corpus}: {', '.join(symbols)}")
+    elif args.command == "record":
+        record_corpus(args.corpus, [t.upper() for t in args.tickers], args.since)
+    else:
+        stub = EdgarStub(
+            args.corpus, args.host, args.port, args.latency_ms, args.jitter_ms,
+            args.error_rate, args.throttle_rate,
+        )
+        stub.release_until = args.release_until
+        print(f"Serving {args.corpus} at {stub.url}; set SEC_WWW_URL and SEC_DATA_URL to it")
+        try:
+            stub._server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
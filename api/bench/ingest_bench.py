@@ -0,0 +1,247 @@
+"""Filing ingest benchmark against the local EDGAR stand-in.
+
+Generates (or reuses) a corpus, serves it with bench.edgar_stub and runs the
+same sync + register path a workspace job uses, in an isolated data
+directory and database. Three passes are timed:
+
+    full         first sync of every ticker, newest filings held back
+    incremental  the held-back filings are released and synced
+    noop         a resync with nothing new
+
+For each pass it reports filings/second, SEC requests by kind and per-stage
+timings. Stage times for cik/list/download/header are summed over threads,
+sync and register are wall-clock.
+
+    python -m bench.ingest_bench --tickers 5 --latency-ms 30
+    python -m bench.ingest_bench --corpus bench/corpus --tickers-list AAPL MSFT
+"""
+import argparse
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from collections import defaultdict
+
+from bench.edgar_stub import EdgarStub, generate_corpus
+
+FILING_FORMS = ["10-Q", "10-K"]
+
+
+class StageTimer:
+    """Thread-safe accumulator of seconds and calls per stage"""
+
+    def __init__(self):
+        self.seconds = defaultdict(float)
+        self.calls = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def add(self, stage: str, seconds: float):
+        with self._lock:
+            self.seconds[stage] += seconds
+            self.calls[stage] += 1
+
+    def wrap(self, stage: str, func):
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.add(stage, time.perf_counter() - start)
+        return timed
+
+    def reset(self):
+        with self._lock:
+            self.seconds.clear()
+            self.calls.clear()
+
+
+def _configure_env(work_dir: str, sec_url: str, rate_limit: float, concurrency: int):
+    """Point config at the stub and a scratch data directory (before importing it)"""
+    os.environ["SEC_WWW_URL"] = sec_url
+    os.environ["SEC_DATA_URL"] = sec_url
+    os.environ["SEC_RATE_LIMIT"] = str(rate_limit)
+    os.environ["SEC_RATE_LIMIT_FILE"] = os.path.join(work_dir, ".sec_rate_limit")
+    os.environ["SEC_DOWNLOAD_CONCURRENCY"] = str(concurrency)
+    os.environ["FILING_STORE_DIR"] = os.path.join(work_dir, "store")
+    os.environ["PARSE_CACHE_DIR"] = os.path.join(work_dir, "parse_cache")
+
+
+def _bind_database(work_dir: str):
+    """Use a scratch SQLite database instead of data/ken-analyst.db"""
+    import database
+
+    database.engine = database.create_db_engine(f"sqlite:///{os.path.join(work_dir, 'bench.db')}")
+    database.SessionLocal.configure(bind=database.engine)
+    database.init_db()
+    return database.SessionLocal
+
+
+def _release_dates(corpus_dir: str, tickers, hold_back: int):
+    """Latest filing date that still leaves hold_back filings per ticker unreleased"""
+    from services import sec_client
+
+    cutoff = None
+    for ticker in tickers:
+        cik = sec_client.get_cik(ticker)
+        with open(os.path.join(corpus_dir, "submissions", f"CIK{cik}.json")) as f:
+            dates = sorted(json.load(f)["filings"]["recent"]["filingDate"])
+        if len(dates) > hold_back:
+            ticker_cutoff = dates[-hold_back - 1]
+            cutoff = ticker_cutoff if cutoff is None else min(cutoff, ticker_cutoff)
+    return cutoff
+
+
+def run_pass(SessionLocal, stub: EdgarStub, timer: StageTimer, workspaces: dict) -> dict:
+    """Sync and register every ticker into its workspace; return the pass report"""
+    from routers.create_workspace import REGISTER_BATCH_SIZE, register_filings
+    from services import documents_service
+    from services.filings_service import sync_many
+
+    stub.reset_counts()
+    timer.reset()
+    registered = 0
+    errors = []
+    start = time.perf_counter()
+
+    db = SessionLocal()
+    try:
+        for ticker, workspace_id in workspaces.items():
+            existing = {
+                doc.doc_id for doc in documents_service.get_documents_by_workspace(db, workspace_id)
+            }
+
+            sync_start = time.perf_counter()
+            synced, sync_errors, failures = sync_many(db, ticker, FILING_FORMS)
+            timer.add("sync", time.perf_counter() - sync_start)
+            errors.extend(f"{ticker} {form}: {e}" for form, e in sync_errors.items())
+            errors.extend(
+                f"{ticker} {accession}: {e}"
+                for failed in failures.values()
+                for accession, e in failed.items()
+            )
+
+            register_start = time.perf_counter()
+            new_filings = [
+                (form_type, filing)
+                for form_type, filings in synced.items()
+                for filing in filings
+                if filing["accession"] not in existing
+            ]
+            for batch in range(0, len(new_filings), REGISTER_BATCH_SIZE):
+                added, failed = register_filings(
+                    new_filings[batch:batch + REGISTER_BATCH_SIZE], workspace_id, db,
+                )
+                registered += len(added)
+                errors.extend(f"{ticker} {accession}: {e}" for accession, e in failed.items())
+            timer.add("register", time.perf_counter() - register_start)
+    finally:
+        db.close()
+
+    elapsed = time.perf_counter() - start
+    return {
+        "filings": registered,
+        "seconds": round(elapsed, 3),
+        "filings_per_second": round(registered / elapsed, 2) if elapsed else 0.0,
+        "requests": dict(stub.requests),
+        "stages": {
+            stage: {"seconds": round(seconds, 3), "calls": timer.calls[stage]}
+            for stage, seconds in sorted(timer.seconds.items())
+        },
+        "errors": errors,
+    }
+
+
+def _print_report(name: str, report: dict):
+    print(f"\n{name}: {report['filings']} filings in {report['seconds']}s "
+          f"({report['filings_per_second']} filings/s)")
+    print("  requests: " + ", ".join(f"{k}={v}" for k, v in sorted(report["requests"].items())))
+    for stage, timing in report["stages"].items():
+        print(f"  {stage:<10} {timing['seconds']:>8.3f}s  {timing['calls']:>5} calls")
+    for error in report["errors"]:
+        print(f"  error: {error}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", help="corpus directory (a synthetic one is generated if omitted)")
+    parser.add_argument("--tickers", type=int, default=3, help="synthetic tickers to generate")
+    parser.add_argument("--tickers-list", nargs="+", help="tickers to ingest from --corpus")
+    parser.add_argument("--size-kb", type=int, default=64, help="synthetic filing size")
+    parser.add_argument("--hold-back", type=int, default=2, help="newest filings per ticker left for the incremental pass")
+    parser.add_argument("--latency-ms", type=float, default=20)
+    parser.add_argument("--jitter-ms", type=float, default=10)
+    parser.add_argument("--error-rate", type=float, default=0)
+    parser.add_argument("--throttle-rate", type=float, default=0)
+    parser.add_argument("--rate-limit", type=float, default=10, help="SEC_RATE_LIMIT for the run")
+    parser.add_argument("--concurrency", type=int, default=8, help="SEC_DOWNLOAD_CONCURRENCY for the run")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    parser.add_argument("--keep", action="store_true", help="keep the scratch directory")
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="ingest-bench-")
+    corpus_dir = args.corpus
+    if corpus_dir:
+        tickers = [t.upper() for t in args.tickers_list or []]
+        if not tickers:
+            parser.error("--tickers-list is required with --corpus")
+    else:
+        corpus_dir = os.path.join(work_dir, "corpus")
+        tickers = generate_corpus(corpus_dir, tickers=args.tickers, size_kb=args.size_kb)
+
+    stub = EdgarStub(
+        corpus_dir, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate, throttle_rate=args.throttle_rate, seed=0,
+    ).start()
+    _configure_env(work_dir, stub.url, args.rate_limit, args.concurrency)
+
+    SessionLocal = _bind_database(work_dir)
+    from services import filings_service, sec_client, workspace_service
+    from models import WorkspaceCreate
+
+    timer = StageTimer()
+    sec_client.get_cik = timer.wrap("cik", sec_client.get_cik)
+    sec_client.list_filings = timer.wrap("list", sec_client.list_filings)
+    sec_client.download_filing = timer.wrap("download", sec_client.download_filing)
+    filings_service.parse_header = timer.wrap("header", filings_service.parse_header)
+
+    workspaces = {}
+    db = SessionLocal()
+    try:
+        for ticker in tickers:
+            workspace = workspace_service.create_workspace(db, WorkspaceCreate(ticker=ticker))
+            workspaces[ticker] = workspace.id
+    finally:
+        db.close()
+
+    reports = {}
+    try:
+        stub.release_until = _release_dates(corpus_dir, tickers, args.hold_back)
+        reports["full"] = run_pass(SessionLocal, stub, timer, workspaces)
+        stub.release_until = None
+        reports["incremental"] = run_pass(SessionLocal, stub, timer, workspaces)
+        reports["noop"] = run_pass(SessionLocal, stub, timer, workspaces)
+    finally:
+        stub.stop()
+        for workspace_id in workspaces.values():
+            shutil.rmtree(
+                os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", workspace_id),
+                ignore_errors=True,
+            )
+        if not args.keep:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    if args.json:
+        print(json.dumps(reports, indent=2))
+    else:
+        print(f"{len(tickers)} tickers, latency {args.latency_ms}ms (+{args.jitter_ms}ms jitter), "
+              f"rate limit {args.rate_limit}/s, concurrency {args.concurrency}")
+        for name, report in reports.items():
+            _print_report(name, report)
+        if args.keep:
+            print(f"\nScratch directory kept at {work_dir}")
+
+
+if __name__ == "__main__":
+    main()
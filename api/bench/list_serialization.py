@@ -0,0 +1,177 @@
+"""List endpoint benchmark: the ORM + APIResponse path against the fast path.
+
+Seeds a scratch database with activity rows and times requests through the
+ASGI app (in-process, no network) for each path:
+
+    legacy     ORM objects, to_dict, APIResponse validation and FastAPI's
+               jsonable_encoder + json.dumps (how /data lists used to answer)
+    fast       Core select of the columns, dict rows encoded with
+               responses.dumps (orjson when installed)
+
+Scenarios are one page of 100 and of 1000 rows, a 1000-row page with
+fields=id,title (legacy has no fields= and returns whole rows), and a full
+export: every 1000-row page in turn for legacy, one format=ndjson stream
+for fast. Reports p50/p95 per request and bytes.
+
+    python -m bench.list_serialization --rows 100000 --repeat 30
+"""
+import argparse
+import json
+import os
+import shutil
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from fastapi import Depends, FastAPI, Query
+from fastapi.testclient import TestClient
+from sqlalchemy import insert, tuple_
+from sqlalchemy.orm import Session
+
+import database
+import responses
+from models import Activity, APIResponse, Workspace, generate_id, generate_workspace_id
+from routers import activity
+from services.pagination import MAX_LIMIT, decode_cursor, encode_cursor
+
+
+def _seed(db: Session, rows: int):
+    workspace = Workspace(id=generate_workspace_id(), name="Bench Space", ticker="BNCH")
+    db.add(workspace)
+    db.flush()
+    start = datetime(2026, 1, 1)
+    batch = []
+    for n in range(rows):
+        batch.append({
+            "id": generate_id(),
+            "workspace_id": workspace.id,
+            "category": "main",
+            "created_at": start + timedelta(milliseconds=250 * n),
+            "status": n % 3,
+            "title": f"Parsed filing {n}",
+            "message": "Extracted sections and tables from the 10-Q filing for the quarter",
+        })
+        if len(batch) == 5000:
+            db.execute(insert(Activity), batch)
+            batch = []
+    if batch:
+        db.execute(insert(Activity), batch)
+    db.commit()
+
+
+def _legacy_page(db: Session, limit: int, cursor: str = None) -> dict:
+    """The /data/activity page as it was built before the fast path"""
+    query = db.query(Activity)
+    key = tuple_(Activity.created_at, Activity.id)
+    if cursor:
+        query = query.filter(key < tuple_(*decode_cursor(cursor)))
+    rows = query.order_by(Activity.created_at.desc(), Activity.id.desc()).limit(limit + 1).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    return {
+        "items": [row.to_dict() for row in rows],
+        "next_cursor": encode_cursor(rows[-1].created_at, rows[-1].id) if has_more else None,
+        "latest_cursor": encode_cursor(rows[0].created_at, rows[0].id) if rows else None,
+    }
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(activity.router)
+
+    @app.get("/legacy/activity", response_model=APIResponse)
+    def legacy_activities(
+        limit: int = Query(100, ge=1, le=MAX_LIMIT),
+        cursor: str = Query(None),
+        db: Session = Depends(database.get_db),
+    ):
+        return APIResponse(status=200, response=_legacy_page(db, limit, cursor))
+
+    return app
+
+
+def _percentile(values, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def _time(func, repeat: int) -> dict:
+    func()  # warm up
+    timings, size = [], 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        size = func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return {"p50_ms": round(_percentile(timings, 0.5), 2), "p95_ms": round(_percentile(timings, 0.95), 2),
+            "bytes": size}
+
+
+def _legacy_export(client: TestClient) -> int:
+    size, cursor = 0, None
+    while True:
+        params = {"limit": MAX_LIMIT, **({"cursor": cursor} if cursor else {})}
+        response = client.get("/legacy/activity", params=params)
+        size += len(response.content)
+        cursor = response.json()["response"]["next_cursor"]
+        if not cursor:
+            return size
+
+
+def _get(client: TestClient, path: str, **params):
+    return lambda: len(client.get(path, params=params).content)
+
+
+def run(client: TestClient, rows: int, repeat: int) -> dict:
+    scenarios = {
+        "page 100": ({"limit": 100}, repeat),
+        "page 1000": ({"limit": 1000}, repeat),
+        "page 1000 fields=id,title": ({"limit": 1000, "fields": "id,title"}, repeat),
+    }
+    report = {}
+    for name, (params, count) in scenarios.items():
+        legacy_params = {k: v for k, v in params.items() if k != "fields"}
+        report[name] = {
+            "legacy": _time(_get(client, "/legacy/activity", **legacy_params), count),
+            "fast": _time(_get(client, "/data/activity", **params), count),
+        }
+    exports = max(1, repeat // 10)
+    report[f"export {rows} rows"] = {
+        "legacy": _time(lambda: _legacy_export(client), exports),
+        "fast": _time(_get(client, "/data/activity", format="ndjson"), exports),
+    }
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100000, help="activity rows to seed")
+    parser.add_argument("--repeat", type=int, default=30, help="requests per page scenario")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="list-serialization-")
+    engine = database.create_db_engine(f"sqlite:///{os.path.join(work_dir, 'bench.db')}")
+    try:
+        database.Base.metadata.create_all(bind=engine)
+        # get_db and the NDJSON stream both open sessions from SessionLocal
+        database.SessionLocal.configure(bind=engine)
+        with database.SessionLocal() as db:
+            _seed(db, args.rows)
+        with TestClient(build_app()) as client:
+            report = run(client, args.rows, args.repeat)
+    finally:
+        engine.dispose()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    print(f"{args.rows} rows, encoder: {'orjson' if responses.orjson is not None else 'json'}")
+    print(f"  {'scenario':<28}{'path':<8}{'p50 ms':>10}{'p95 ms':>10}{'bytes':>12}")
+    for scenario, paths in report.items():
+        for path, stats in paths.items():
+            print(f"  {scenario:<28}{path:<8}{stats['p50_ms']:>10}{stats['p95_ms']:>10}{stats['bytes']:>12}")
+
+
+if __name__ == "__main__":
+    main()
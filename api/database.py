@@ -1,19 +1,134 @@
 import os
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from config import (
+    DATABASE_URL, ASYNC_DATABASE_URL, DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_RECYCLE, SQLITE_BUSY_TIMEOUT_MS,
+)
 
 DATABASE_DIR = os.path.join(os.path.dirname(__file__), "data")
-DATABASE_URL = f"sqlite:///{os.path.join(DATABASE_DIR, 'ken-analyst.db')}"
 
 # Ensure data directory exists
 os.makedirs(DATABASE_DIR, exist_ok=True)
 
-engine = create_engine(
-    DATABASE_URL, connect_args={"check_same_thread": False}
+# Applied to every SQLite connection: readers don't block the writer (WAL),
+# writers queue for the lock instead of failing, fsync only at checkpoints
+SQLITE_PRAGMAS = (
+    "journal_mode=WAL",
+    f"busy_timeout={SQLITE_BUSY_TIMEOUT_MS}",
+    "synchronous=NORMAL",
+    "foreign_keys=ON",
 )
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(f"PRAGMA {pragma}")
+    finally:
+        cursor.close()
+
+def create_db_engine(url: str = DATABASE_URL, pool_size: int = DB_POOL_SIZE, max_overflow: int = DB_MAX_OVERFLOW):
+    """Engine for a database URL; SQLite files get SQLITE_PRAGMAS on connect"""
+    url = make_url(url)
+    if url.get_backend_name() != "sqlite":
+        return create_engine(
+            url,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=DB_POOL_TIMEOUT,
+            pool_recycle=DB_POOL_RECYCLE,
+            pool_pre_ping=True,
+        )
+
+    connect_args = {"check_same_thread": False, "timeout": SQLITE_BUSY_TIMEOUT_MS / 1000}
+    if url.database in (None, "", ":memory:"):
+        # One connection shared by every thread (the default pool opens one
+        # per thread, each its own empty database); pool sizing doesn't apply
+        engine = create_engine(url, connect_args=connect_args, poolclass=StaticPool)
+    else:
+        engine = create_engine(
+            url,
+            connect_args=connect_args,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=DB_POOL_TIMEOUT,
+        )
+    event.listen(engine, "connect", _set_sqlite_pragmas)
+    return engine
+
+# Async drivers for the backends DATABASE_URL may name
+ASYNC_DRIVERS = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+asyncpg"}
+
+def async_url(url: str) -> URL:
+    """The async-driver form of a database URL"""
+    url = make_url(url)
+    if url.get_dialect().is_async:
+        return url
+    driver = ASYNC_DRIVERS.get(url.get_backend_name())
+    if driver is None:
+        raise ValueError(f"No async driver for '{url.get_backend_name()}'; set ASYNC_DATABASE_URL")
+    return url.set(drivername=driver)
+
+def create_async_db_engine(
+    url: str = ASYNC_DATABASE_URL or DATABASE_URL,
+    pool_size: int = DB_POOL_SIZE,
+    max_overflow: int = DB_MAX_OVERFLOW,
+):
+    """Async engine for a database URL, configured like create_db_engine"""
+    url = async_url(url)
+    if url.get_backend_name() != "sqlite":
+        return create_async_engine(
+            url,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=DB_POOL_TIMEOUT,
+            pool_recycle=DB_POOL_RECYCLE,
+            pool_pre_ping=True,
+        )
+
+    connect_args = {"timeout": SQLITE_BUSY_TIMEOUT_MS / 1000}
+    if url.database in (None, "", ":memory:"):
+        engine = create_async_engine(url, connect_args=connect_args)
+    else:
+        engine = create_async_engine(
+            url,
+            connect_args=connect_args,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=DB_POOL_TIMEOUT,
+        )
+    event.listen(engine.sync_engine, "connect", _set_sqlite_pragmas)
+    return engine
+
+engine = create_db_engine()
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# For async def routes: queries run on the driver's own thread or socket, never
+# on the event loop. Objects stay loaded after commit (no lazy reloads). The
+# engine is created by init_async_db, so importing this module never needs an
+# async driver.
+async_engine = None
+AsyncSessionLocal = async_sessionmaker(autoflush=False, expire_on_commit=False)
+
+def init_async_db():
+    """Create the async engine and bind AsyncSessionLocal to it (once)"""
+    global async_engine
+    if async_engine is not None:
+        return async_engine
+    try:
+        async_engine = create_async_db_engine()
+    except (ValueError, ImportError) as e:
+        raise RuntimeError(
+            f"Cannot create the async database engine for {make_url(ASYNC_DATABASE_URL or DATABASE_URL)!r} "
+            f"({e}). Async routes need the driver installed: aiosqlite for SQLite, asyncpg for PostgreSQL"
+        ) from e
+    AsyncSessionLocal.configure(bind=async_engine)
+    return async_engine
+
 Base = declarative_base()
 
 def get_db():
@@ -24,7 +139,45 @@ def get_db():
     finally:
         db.close()
 
+async def get_async_db():
+    """Dependency to get an async database session (for async def routes)"""
+    init_async_db()
+    async with AsyncSessionLocal() as db:
+        yield db
+
+ALEMBIC_INI = os.path.join(os.path.dirname(__file__), "alembic.ini")
+
+def upgrade_schema(revision: str = "head"):
+    """Apply the migrations in migrations/versions up to revision"""
+    from alembic import command
+    from alembic.config import Config
+
+    config = Config(ALEMBIC_INI)
+    config.attributes["configure_logger"] = False
+    with engine.begin() as conn:
+        config.attributes["connection"] = conn
+        command.upgrade(config, revision)
+
+def _missing_header_columns() -> bool:
+    """Whether documents predates the SEC header columns (added by migration 0001)"""
+    inspector = inspect(engine)
+    if not inspector.has_table("documents"):
+        return False
+    return "accession_number" not in {column["name"] for column in inspector.get_columns("documents")}
+
 def init_db():
-    """Initialize database tables"""
-    from models import Workspace, Document, ParsedDocument
-    Base.metadata.create_all(bind=engine)
+    """Bring the database schema up to date"""
+    backfill = _missing_header_columns()
+    upgrade_schema()
+
+    from services import workspace_search
+    with engine.begin() as conn:
+        workspace_search.ensure_schema(conn)
+
+    if backfill:
+        from services import documents_service
+        db = SessionLocal()
+        try:
+            documents_service.backfill_header_fields(db)
+        finally:
+            db.close()
@@ -1,16 +1,29 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
-from services.data_loader import load_data
-from routers import search, filings, workspace, documents, parsed_documents, create_workspace, activity, agent, agent_message, agent_query
+from services.data_loader import load_data, start_watcher, stop_watcher
+from routers import search, filings, workspace, documents, parsed_documents, create_workspace, activity, agent, agent_message, agent_query, jobs
 from routers.documents import documents_router
-from database import init_db
+from database import SessionLocal, init_db, init_async_db
+from services import job_runner, jobs_service
+from services.parse_executor import parse_executor
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     init_db()
+    init_async_db()
+    # Jobs run on in-process threads, so none survive a restart
+    db = SessionLocal()
+    try:
+        jobs_service.fail_interrupted_jobs(db)
+    finally:
+        db.close()
     load_data()
+    start_watcher()
     yield
+    stop_watcher()
+    job_runner.shutdown()
+    parse_executor.shutdown()
 
 app = FastAPI(lifespan=lifespan)
 
@@ -33,3 +46,4 @@ app.include_router(activity.router)
 app.include_router(agent.router)
 app.include_router(agent_message.router)
 app.include_router(agent_query.router)
+app.include_router(jobs.router)
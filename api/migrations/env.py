@@ -0,0 +1,57 @@
+"""Alembic environment: migrates the app database (config.DATABASE_URL).
+
+init_db passes its own connection in config.attributes["connection"]; the
+alembic command line connects through database.engine.
+"""
+from logging.config import fileConfig
+
+from alembic import context
+
+import database
+import models  # noqa: F401  (registers the tables on Base.metadata)
+
+config = context.config
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+target_metadata = database.Base.metadata
+
+
+def include_object(obj, name, type_, reflected, compare_to):
+    # The FTS5 search table and its shadow tables are managed by workspace_search
+    return not (type_ == "table" and name.startswith("search_chunks"))
+
+
+def _configure(**kwargs):
+    context.configure(
+        target_metadata=target_metadata,
+        include_object=include_object,
+        render_as_batch=True,  # SQLite can't ALTER most constraints in place
+        **kwargs,
+    )
+
+
+def run_migrations_offline():
+    _configure(url=str(database.engine.url), literal_binds=True, dialect_opts={"paramstyle": "named"})
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online():
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        _configure(connection=connection)
+        with context.begin_transaction():
+            context.run_migrations()
+        return
+
+    with database.engine.connect() as connection:
+        _configure(connection=connection)
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
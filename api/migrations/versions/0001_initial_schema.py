@@ -0,0 +1,133 @@
+"""Initial schema
+
+The schema as create_all built it before migrations were introduced.
+Databases from that time have no alembic_version table, so this revision
+also adopts them: missing tables are created and the SEC header columns
+are added to an older documents table.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+HEADER_COLUMNS = ["accession_number", "cik", "company_name", "form_type", "sic_code", "fiscal_year_end"]
+HEADER_INDEXES = ["accession_number", "cik", "form_type", "sic_code"]
+
+
+def _tables():
+    return {
+        "workspaces": lambda: op.create_table(
+            "workspaces",
+            sa.Column("id", sa.String(length=8), primary_key=True),
+            sa.Column("name", sa.String(), nullable=False),
+            sa.Column("ticker", sa.String(), nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+        ),
+        "documents": lambda: op.create_table(
+            "documents",
+            sa.Column("id", sa.String(length=12), primary_key=True),
+            sa.Column("workspace_id", sa.String(length=8),
+                      sa.ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False),
+            sa.Column("doc_type", sa.String(), nullable=False),
+            sa.Column("file_path", sa.String(), nullable=False),
+            sa.Column("filing_date", sa.String(), nullable=True),
+            sa.Column("reporting_date", sa.String(), nullable=True),
+            sa.Column("doc_id", sa.String(), nullable=True),
+            *[sa.Column(name, sa.String(), nullable=True) for name in HEADER_COLUMNS],
+        ),
+        "parsed_documents": lambda: op.create_table(
+            "parsed_documents",
+            sa.Column("id", sa.String(length=12), primary_key=True),
+            sa.Column("workspace_id", sa.String(length=8),
+                      sa.ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False),
+            sa.Column("documents_id", sa.String(length=12),
+                      sa.ForeignKey("documents.id", ondelete="CASCADE"), nullable=False),
+            sa.Column("filepath", sa.String(), nullable=False),
+            sa.Column("status", sa.Boolean(), nullable=False),
+        ),
+        "activity": lambda: op.create_table(
+            "activity",
+            sa.Column("id", sa.String(length=12), primary_key=True),
+            sa.Column("workspace_id", sa.String(length=8),
+                      sa.ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False),
+            sa.Column("category", sa.String(), nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.Column("status", sa.Integer(), nullable=False),
+            sa.Column("title", sa.String(), nullable=False),
+            sa.Column("message", sa.String(), nullable=False),
+        ),
+        "agents": lambda: op.create_table(
+            "agents",
+            sa.Column("id", sa.String(length=12), primary_key=True),
+            sa.Column("workspace_id", sa.String(length=8),
+                      sa.ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False),
+            sa.Column("name", sa.String(), nullable=False),
+            sa.Column("status", sa.String(), nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=False),
+        ),
+        "agent_messages": lambda: op.create_table(
+            "agent_messages",
+            sa.Column("id", sa.String(length=12), primary_key=True),
+            sa.Column("agent_id", sa.String(length=12),
+                      sa.ForeignKey("agents.id", ondelete="CASCADE"), nullable=False),
+            sa.Column("role", sa.String(), nullable=False),
+            sa.Column("message", sa.String(), nullable=False),
+            sa.Column("timestamp", sa.DateTime(), nullable=False),
+        ),
+        "jobs": lambda: op.create_table(
+            "jobs",
+            sa.Column("id", sa.String(length=12), primary_key=True),
+            sa.Column("workspace_id", sa.String(length=8),
+                      sa.ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False),
+            sa.Column("kind", sa.String(), nullable=False),
+            sa.Column("status", sa.String(), nullable=False),
+            sa.Column("stage", sa.String(), nullable=True),
+            sa.Column("progress", sa.JSON(), nullable=False),
+            sa.Column("error", sa.String(), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=False),
+        ),
+        "filing_sync": lambda: op.create_table(
+            "filing_sync",
+            sa.Column("ticker", sa.String(), primary_key=True),
+            sa.Column("form_type", sa.String(), primary_key=True),
+            sa.Column("latest_filing_date", sa.String(), nullable=True),
+            sa.Column("filings", sa.JSON(), nullable=False),
+            sa.Column("synced_at", sa.DateTime(), nullable=False),
+        ),
+    }
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    inspector = sa.inspect(op.get_bind())
+    if inspector.has_table("documents"):
+        existing = {column["name"] for column in inspector.get_columns("documents")}
+        for name in HEADER_COLUMNS:
+            if name not in existing:
+                op.add_column("documents", sa.Column(name, sa.String(), nullable=True))
+
+    for name, create in _tables().items():
+        if not inspector.has_table(name):
+            create()
+    for name in HEADER_INDEXES:
+        op.create_index(f"ix_documents_{name}", "documents", [name], if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name in reversed(list(_tables())):
+        op.drop_table(name)
@@ -0,0 +1,40 @@
+"""Index foreign keys together with the column their lists sort by
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, Sequence[str], None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# index name -> (table, columns); matches __table_args__ in models.py
+INDEXES = {
+    "ix_documents_workspace_id_filing_date": ("documents", ["workspace_id", "filing_date"]),
+    "ix_parsed_documents_workspace_id": ("parsed_documents", ["workspace_id"]),
+    "ix_parsed_documents_documents_id": ("parsed_documents", ["documents_id"]),
+    "ix_activity_workspace_id_created_at": ("activity", ["workspace_id", "created_at"]),
+    "ix_agents_workspace_id_created_at": ("agents", ["workspace_id", "created_at"]),
+    "ix_agent_messages_agent_id_timestamp": ("agent_messages", ["agent_id", "timestamp"]),
+    "ix_jobs_workspace_id_created_at": ("jobs", ["workspace_id", "created_at"]),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, (table, columns) in INDEXES.items():
+        op.create_index(name, table, columns, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, (table, _) in INDEXES.items():
+        op.drop_index(name, table_name=table, if_exists=True)
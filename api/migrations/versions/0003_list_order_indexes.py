@@ -0,0 +1,61 @@
+"""Creation times on documents and parsed documents; (time, id) list indexes
+
+Keyset pagination orders every list by a time column and the id. Documents
+and parsed documents get a created_at (existing rows are stamped with the
+migration time), and each table an index on (time, id) for the unfiltered
+lists.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, Sequence[str], None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+NEW_COLUMNS = ["documents", "parsed_documents"]
+
+# index name -> (table, columns); matches __table_args__ in models.py
+INDEXES = {
+    "ix_workspaces_created_at_id": ("workspaces", ["created_at", "id"]),
+    "ix_documents_created_at_id": ("documents", ["created_at", "id"]),
+    "ix_parsed_documents_created_at_id": ("parsed_documents", ["created_at", "id"]),
+    "ix_activity_created_at_id": ("activity", ["created_at", "id"]),
+    "ix_agents_created_at_id": ("agents", ["created_at", "id"]),
+    "ix_agent_messages_timestamp_id": ("agent_messages", ["timestamp", "id"]),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Nullable: SQLite can only add NOT NULL columns with a constant default,
+    # and rebuilding these tables would cascade deletes to their children
+    for table in NEW_COLUMNS:
+        op.add_column(table, sa.Column("created_at", sa.DateTime(), nullable=True))
+        if op.get_bind().dialect.name == "sqlite":
+            # Same text format SQLAlchemy writes, so stored values compare correctly
+            now = sa.text("strftime('%Y-%m-%d %H:%M:%f000', 'now')")
+        else:
+            now = sa.func.current_timestamp()
+        op.execute(sa.table(table, sa.column("created_at")).update().values(created_at=now))
+
+    for name, (table, columns) in INDEXES.items():
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, (table, _) in INDEXES.items():
+        op.drop_index(name, table_name=table)
+    for table in NEW_COLUMNS:
+        with op.batch_alter_table(table) as batch:
+            batch.drop_column("created_at")
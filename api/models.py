@@ -1,6 +1,6 @@
 from typing import Any, Optional
 from pydantic import BaseModel
-from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, Enum, Boolean
+from sqlalchemy import Column, String, DateTime, ForeignKey, Index, Integer, Enum, Boolean, JSON
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from database import Base
@@ -30,8 +30,20 @@ class ActivityCategory(str, enum.Enum):
     MAIN = "main"
     SUB = "sub"
 
+class JobStatus(str, enum.Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+class JobStage(str, enum.Enum):
+    DOWNLOAD = "download"
+    REGISTER = "register"
+    PARSE = "parse"
+
 class Workspace(Base):
     __tablename__ = "workspaces"
+    __table_args__ = (Index("ix_workspaces_created_at_id", "created_at", "id"),)
 
     id = Column(String(8), primary_key=True, default=generate_workspace_id)
     name = Column(String, nullable=False)
@@ -43,6 +55,7 @@ class Workspace(Base):
     parsed_documents = relationship("ParsedDocument", back_populates="workspace", cascade="all, delete-orphan")
     activities = relationship("Activity", back_populates="workspace", cascade="all, delete-orphan")
     agents = relationship("Agent", back_populates="workspace", cascade="all, delete-orphan")
+    jobs = relationship("Job", back_populates="workspace", cascade="all, delete-orphan")
 
     def to_dict(self):
         """Convert model to dictionary"""
@@ -55,6 +68,10 @@ class Workspace(Base):
 
 class Document(Base):
     __tablename__ = "documents"
+    __table_args__ = (
+        Index("ix_documents_workspace_id_filing_date", "workspace_id", "filing_date"),
+        Index("ix_documents_created_at_id", "created_at", "id"),
+    )
 
     id = Column(String(12), primary_key=True, default=generate_id)
     workspace_id = Column(String(8), ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False)
@@ -64,6 +81,15 @@ class Document(Base):
     reporting_date = Column(String, nullable=True)  # YYYY/MM/DD format
     doc_id = Column(String, nullable=True)
 
+    # SEC header fields, parsed once at registration (empty for other uploads)
+    accession_number = Column(String, nullable=True, index=True)
+    cik = Column(String, nullable=True, index=True)
+    company_name = Column(String, nullable=True)
+    form_type = Column(String, nullable=True, index=True)
+    sic_code = Column(String, nullable=True, index=True)
+    fiscal_year_end = Column(String, nullable=True)  # MMDD
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=True)  # set on every row since migration 0003
+
     # Relationships
     workspace = relationship("Workspace", back_populates="documents")
     parsed_documents = relationship("ParsedDocument", back_populates="document", cascade="all, delete-orphan")
@@ -77,17 +103,30 @@ class Document(Base):
             "file_path": self.file_path,
             "filing_date": self.filing_date,
             "reporting_date": self.reporting_date,
-            "doc_id": self.doc_id
+            "doc_id": self.doc_id,
+            "accession_number": self.accession_number,
+            "cik": self.cik,
+            "company_name": self.company_name,
+            "form_type": self.form_type,
+            "sic_code": self.sic_code,
+            "fiscal_year_end": self.fiscal_year_end,
+            "created_at": self.created_at.isoformat() if self.created_at else None
         }
 
 class ParsedDocument(Base):
     __tablename__ = "parsed_documents"
+    __table_args__ = (
+        Index("ix_parsed_documents_workspace_id", "workspace_id"),
+        Index("ix_parsed_documents_documents_id", "documents_id"),
+        Index("ix_parsed_documents_created_at_id", "created_at", "id"),
+    )
 
     id = Column(String(12), primary_key=True, default=generate_id)
     workspace_id = Column(String(8), ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False)
     documents_id = Column(String(12), ForeignKey("documents.id", ondelete="CASCADE"), nullable=False)
     filepath = Column(String, nullable=False)
     status = Column(Boolean, default=False, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=True)  # set on every row since migration 0003
 
     # Relationships
     workspace = relationship("Workspace", back_populates="parsed_documents")
@@ -100,11 +139,16 @@ class ParsedDocument(Base):
             "workspace_id": self.workspace_id,
             "documents_id": self.documents_id,
             "filepath": self.filepath,
-            "status": self.status
+            "status": self.status,
+            "created_at": self.created_at.isoformat() if self.created_at else None
         }
 
 class Activity(Base):
     __tablename__ = "activity"
+    __table_args__ = (
+        Index("ix_activity_workspace_id_created_at", "workspace_id", "created_at"),
+        Index("ix_activity_created_at_id", "created_at", "id"),
+    )
 
     id = Column(String(12), primary_key=True, default=generate_id)
     workspace_id = Column(String(8), ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False)
@@ -131,6 +175,10 @@ class Activity(Base):
 
 class Agent(Base):
     __tablename__ = "agents"
+    __table_args__ = (
+        Index("ix_agents_workspace_id_created_at", "workspace_id", "created_at"),
+        Index("ix_agents_created_at_id", "created_at", "id"),
+    )
 
     id = Column(String(12), primary_key=True, default=generate_id)
     workspace_id = Column(String(8), ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False)
@@ -156,6 +204,10 @@ class Agent(Base):
 
 class AgentMessage(Base):
     __tablename__ = "agent_messages"
+    __table_args__ = (
+        Index("ix_agent_messages_agent_id_timestamp", "agent_id", "timestamp"),
+        Index("ix_agent_messages_timestamp_id", "timestamp", "id"),
+    )
 
     id = Column(String(12), primary_key=True, default=generate_id)
     agent_id = Column(String(12), ForeignKey("agents.id", ondelete="CASCADE"), nullable=False)
@@ -176,6 +228,56 @@ class AgentMessage(Base):
             "timestamp": self.timestamp.isoformat() if self.timestamp else None
         }
 
+class Job(Base):
+    __tablename__ = "jobs"
+    __table_args__ = (Index("ix_jobs_workspace_id_created_at", "workspace_id", "created_at"),)
+
+    id = Column(String(12), primary_key=True, default=generate_id)
+    workspace_id = Column(String(8), ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False)
+    kind = Column(String, nullable=False)
+    status = Column(String, nullable=False, default=JobStatus.QUEUED.value)
+    stage = Column(String, nullable=True)  # stage currently running
+    progress = Column(JSON, nullable=False, default=dict)  # {stage: {status, total, done, failed, errors}}
+    error = Column(String, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    # Relationships
+    workspace = relationship("Workspace", back_populates="jobs")
+
+    def to_dict(self):
+        """Convert model to dictionary"""
+        return {
+            "id": self.id,
+            "workspace_id": self.workspace_id,
+            "kind": self.kind,
+            "status": self.status,
+            "stage": self.stage,
+            "progress": self.progress or {},
+            "error": self.error,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None
+        }
+
+class FilingSync(Base):
+    __tablename__ = "filing_sync"
+
+    ticker = Column(String, primary_key=True)
+    form_type = Column(String, primary_key=True)  # 10-Q, 10-K
+    latest_filing_date = Column(String, nullable=True)  # YYYY-MM-DD
+    filings = Column(JSON, nullable=False, default=dict)  # {accession: {filing_date, reporting_date}}
+    synced_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    def to_dict(self):
+        """Convert model to dictionary"""
+        return {
+            "ticker": self.ticker,
+            "form_type": self.form_type,
+            "latest_filing_date": self.latest_filing_date,
+            "filings_count": len(self.filings or {}),
+            "synced_at": self.synced_at.isoformat() if self.synced_at else None
+        }
+
 # Pydantic models for API
 class WorkspaceCreate(BaseModel):
     id: Optional[str] = None
@@ -193,6 +295,12 @@ class DocumentCreate(BaseModel):
     filing_date: Optional[str] = None
     reporting_date: Optional[str] = None
     doc_id: Optional[str] = None
+    accession_number: Optional[str] = None
+    cik: Optional[str] = None
+    company_name: Optional[str] = None
+    form_type: Optional[str] = None
+    sic_code: Optional[str] = None
+    fiscal_year_end: Optional[str] = None
 
 class DocumentUpdate(BaseModel):
     workspace_id: Optional[str] = None
@@ -0,0 +1,58 @@
+"""Fast JSON and NDJSON responses for list endpoints.
+
+List payloads are dicts of column values, so they are encoded directly
+(orjson when installed) instead of going through APIResponse validation
+and FastAPI's jsonable_encoder. Datetimes come out as isoformat() strings,
+the same as the models' to_dict.
+"""
+import json
+from datetime import date, datetime
+from typing import Any, Iterable, Iterator
+
+from fastapi.responses import Response, StreamingResponse
+
+try:
+    import orjson
+except ImportError:  # stdlib json, slower
+    orjson = None
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+# Rows encoded per chunk written to the client
+NDJSON_CHUNK_ROWS = 500
+
+
+def _default(value: Any):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, default=_default, separators=(",", ":")).encode()
+
+
+def json_response(payload: Any, status_code: int = 200) -> Response:
+    """The APIResponse envelope ({"status", "response"}) encoded in one pass"""
+    return Response(
+        content=dumps({"status": status_code, "response": payload}),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+def _ndjson_chunks(rows: Iterable[dict]) -> Iterator[bytes]:
+    chunk = []
+    for row in rows:
+        chunk.append(dumps(row))
+        if len(chunk) >= NDJSON_CHUNK_ROWS:
+            yield b"\n".join(chunk) + b"\n"
+            chunk = []
+    if chunk:
+        yield b"\n".join(chunk) + b"\n"
+
+
+def ndjson_response(rows: Iterable[dict]) -> StreamingResponse:
+    """One JSON object per line, written as rows are read"""
+    return StreamingResponse(_ndjson_chunks(rows), media_type=NDJSON_MEDIA_TYPE)
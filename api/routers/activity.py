@@ -1,25 +1,35 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
-from database import get_db
+from database import SessionLocal, get_db
 from models import ActivityCreate, ActivityUpdate, APIResponse
 from services import activity_service
+from services.pagination import DEFAULT_LIMIT, MAX_LIMIT, iter_rows
+from responses import json_response, ndjson_response
 
 router = APIRouter(prefix="/data/activity", tags=["activity"])
 
 @router.get("", response_model=APIResponse)
 def get_activities(
     workspace_id: str = Query(None, description="Filter by workspace ID"),
+    limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT, description="Page size"),
+    cursor: str = Query(None, description="next_cursor of the previous page"),
+    since: str = Query(None, description="Only rows newer than this cursor (e.g. a previous latest_cursor)"),
+    fields: str = Query(None, description="Comma-separated columns to return (default all)"),
+    output: str = Query("json", alias="format", pattern="^(json|ndjson)$",
+                        description="ndjson streams every row from cursor/since on, one per line, ignoring limit"),
     db: Session = Depends(get_db)
 ):
-    """Get all activities, optionally filtered by workspace_id"""
+    """Get activities newest first, a page at a time, optionally filtered by workspace_id"""
     try:
-        if workspace_id:
-            activities = activity_service.get_activities_by_workspace(db, workspace_id)
-        else:
-            activities = activity_service.get_all_activities(db)
-        return APIResponse(
-            status=200,
-            response=[activity.to_dict() for activity in activities]
+        if output == "ndjson":
+            listing = activity_service.activity_listing(workspace_id, fields)
+            return ndjson_response(iter_rows(SessionLocal, listing, cursor, since))
+        page = activity_service.list_activities(db, workspace_id, limit, cursor, since, fields)
+        return json_response(page.to_dict())
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
         )
     except Exception as e:
         raise HTTPException(
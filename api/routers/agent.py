@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
-from database import get_db
+from database import SessionLocal, get_db
 from models import AgentCreate, AgentUpdate, APIResponse
 from services import agent_service
+from services.pagination import DEFAULT_LIMIT, MAX_LIMIT, iter_rows
+from responses import json_response, ndjson_response
 
 router = APIRouter(prefix="/data/agent", tags=["agent"])
 
@@ -10,20 +12,25 @@ router = APIRouter(prefix="/data/agent", tags=["agent"])
 def get_agents(
     workspace_id: str = Query(None, description="Filter by workspace ID"),
     active_only: bool = Query(False, description="Get only active agents"),
+    limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT, description="Page size"),
+    cursor: str = Query(None, description="next_cursor of the previous page"),
+    since: str = Query(None, description="Only rows newer than this cursor (e.g. a previous latest_cursor)"),
+    fields: str = Query(None, description="Comma-separated columns to return (default all)"),
+    output: str = Query("json", alias="format", pattern="^(json|ndjson)$",
+                        description="ndjson streams every row from cursor/since on, one per line, ignoring limit"),
     db: Session = Depends(get_db)
 ):
-    """Get all agents, optionally filtered by workspace_id and status"""
+    """Get agents newest first, a page at a time, optionally filtered by workspace_id and status"""
     try:
-        if workspace_id:
-            if active_only:
-                agents = agent_service.get_active_agents_by_workspace(db, workspace_id)
-            else:
-                agents = agent_service.get_agents_by_workspace(db, workspace_id)
-        else:
-            agents = agent_service.get_all_agents(db)
-        return APIResponse(
-            status=200,
-            response=[agent.to_dict() for agent in agents]
+        if output == "ndjson":
+            listing = agent_service.agent_listing(workspace_id, active_only, fields)
+            return ndjson_response(iter_rows(SessionLocal, listing, cursor, since))
+        page = agent_service.list_agents(db, workspace_id, active_only, limit, cursor, since, fields)
+        return json_response(page.to_dict())
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
         )
     except Exception as e:
         raise HTTPException(
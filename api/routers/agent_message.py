@@ -1,25 +1,35 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
-from database import get_db
+from database import SessionLocal, get_db
 from models import AgentMessageCreate, AgentMessageUpdate, APIResponse
 from services import agent_message_service
+from services.pagination import DEFAULT_LIMIT, MAX_LIMIT, iter_rows
+from responses import json_response, ndjson_response
 
 router = APIRouter(prefix="/data/agent_message", tags=["agent_message"])
 
 @router.get("", response_model=APIResponse)
 def get_messages(
     agent_id: str = Query(None, description="Filter by agent ID"),
+    limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT, description="Page size"),
+    cursor: str = Query(None, description="next_cursor of the previous page"),
+    since: str = Query(None, description="Only rows newer than this cursor (e.g. a previous latest_cursor)"),
+    fields: str = Query(None, description="Comma-separated columns to return (default all)"),
+    output: str = Query("json", alias="format", pattern="^(json|ndjson)$",
+                        description="ndjson streams every row from cursor/since on, one per line, ignoring limit"),
     db: Session = Depends(get_db)
 ):
-    """Get all messages, optionally filtered by agent_id"""
+    """Get messages in chat order, a page at a time, optionally filtered by agent_id"""
     try:
-        if agent_id:
-            messages = agent_message_service.get_messages_by_agent(db, agent_id)
-        else:
-            messages = agent_message_service.get_all_messages(db)
-        return APIResponse(
-            status=200,
-            response=[message.to_dict() for message in messages]
+        if output == "ndjson":
+            listing = agent_message_service.message_listing(agent_id, fields)
+            return ndjson_response(iter_rows(SessionLocal, listing, cursor, since))
+        page = agent_message_service.list_messages(db, agent_id, limit, cursor, since, fields)
+        return json_response(page.to_dict())
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
         )
     except Exception as e:
         raise HTTPException(
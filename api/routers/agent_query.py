@@ -2,11 +2,11 @@ import os
 import asyncio
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import StreamingResponse
-from sqlalchemy.orm import Session
-from database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from database import AsyncSessionLocal, get_async_db
 from models import APIResponse
-from services import agent_service, agent_message_service
-from pydantic import BaseModel
+from services import agent_service, agent_message_service, parsed_documents_service
+from pydantic import BaseModel, Field
 from typing import Optional
 from pathlib import Path
 import json
@@ -18,16 +18,46 @@ class AgentQueryRequest(BaseModel):
     agent_id: Optional[str] = None
     prompt: str
     chunk_id: Optional[str] = None
-    chunk_content: Optional[str] = None
+    # Narrows the chunk lookup to one document; otherwise the workspace is searched
+    document_id: Optional[str] = None
+    # Neighbouring chunks to include on each side of chunk_id
+    context_neighbors: int = Field(0, ge=0, le=5)
+
+async def build_prompt(query_request: AgentQueryRequest, db: AsyncSession) -> str:
+    """Prompt with the chunk's content resolved from the workspace's parse outputs"""
+    if not query_request.chunk_id:
+        return query_request.prompt
+    context = await parsed_documents_service.resolve_chunk_context_async(
+        db,
+        query_request.workspace_id,
+        query_request.chunk_id,
+        query_request.document_id,
+        query_request.context_neighbors,
+    )
+    if context is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Chunk '{query_request.chunk_id}' not found in workspace '{query_request.workspace_id}'"
+        )
+    return f"Context from document chunk:\n\n{context}\n\nUser question: {query_request.prompt}"
 
 @router.post("/query/stream")
 async def query_agent_stream(
     query_request: AgentQueryRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Stream agent responses using Claude Agent SDK"""
+    # Resolve the chunk before streaming so an unknown chunk is a plain 404
+    full_prompt = await build_prompt(query_request, db)
 
     async def generate():
+        # The request's session is closed once the response starts; the
+        # stream writes its messages through its own
+        async with AsyncSessionLocal() as stream_db:
+            async for event in stream(stream_db):
+                yield event
+
+    async def stream(db: AsyncSession):
         try:
             # Import here to avoid loading on startup
             from claude_agent_sdk import ClaudeSDKClient, ClaudeAgentOptions, AssistantMessage, TextBlock, ResultMessage
@@ -40,7 +70,7 @@ async def query_agent_stream(
                     workspace_id=query_request.workspace_id,
                     name=f"Analyst Ken - {query_request.chunk_id or 'General'}"
                 )
-                agent = agent_service.create_agent(db, agent_data)
+                agent = await agent_service.create_agent_async(db, agent_data)
                 agent_id = agent.id
 
                 # Send agent_id as first message
@@ -53,7 +83,7 @@ async def query_agent_stream(
                 role="user",
                 message=query_request.prompt
             )
-            agent_message_service.create_message(db, user_msg)
+            await agent_message_service.create_message_async(db, user_msg)
 
             # Set working directory
             workspace_folder = os.path.join(
@@ -72,11 +102,6 @@ async def query_agent_stream(
                 cwd=workspace_folder
             )
 
-            # Build prompt with context
-            full_prompt = query_request.prompt
-            if query_request.chunk_content:
-                full_prompt = f"Context from document chunk:\n\n{query_request.chunk_content}\n\nUser question: {query_request.prompt}"
-
             # Stream response
             async with ClaudeSDKClient(options=options) as client:
                 await client.query(full_prompt)
@@ -100,7 +125,7 @@ async def query_agent_stream(
                                 role="assistant",
                                 message=assistant_message
                             )
-                            agent_message_service.create_message(db, assistant_msg)
+                            await agent_message_service.create_message_async(db, assistant_msg)
 
                         # Send completion message
                         yield f"data: {json.dumps({'type': 'done'})}\n\n"
@@ -123,13 +148,16 @@ async def query_agent_stream(
 @router.post("/query")
 async def query_agent(
     query_request: AgentQueryRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Non-streaming agent query"""
     try:
         # Import here to avoid loading on startup
         from claude_agent_sdk import query as claude_query, ClaudeAgentOptions, AssistantMessage, TextBlock
 
+        # Build prompt with context from the stored parse
+        full_prompt = await build_prompt(query_request, db)
+
         # Create or get agent
         agent_id = query_request.agent_id
         if not agent_id:
@@ -138,7 +166,7 @@ async def query_agent(
                 workspace_id=query_request.workspace_id,
                 name=f"Analyst Ken - {query_request.chunk_id or 'General'}"
             )
-            agent = agent_service.create_agent(db, agent_data)
+            agent = await agent_service.create_agent_async(db, agent_data)
             agent_id = agent.id
 
         # Save user message
@@ -148,7 +176,7 @@ async def query_agent(
             role="user",
             message=query_request.prompt
         )
-        agent_message_service.create_message(db, user_msg)
+        await agent_message_service.create_message_async(db, user_msg)
 
         # Set working directory
         workspace_folder = os.path.join(
@@ -167,11 +195,6 @@ async def query_agent(
             cwd=workspace_folder
         )
 
-        # Build prompt with context
-        full_prompt = query_request.prompt
-        if query_request.chunk_content:
-            full_prompt = f"Context from document chunk:\n\n{query_request.chunk_content}\n\nUser question: {query_request.prompt}"
-
         # Get response
         response_text = ""
         async for message in claude_query(prompt=full_prompt, options=options):
@@ -187,7 +210,7 @@ async def query_agent(
                 role="assistant",
                 message=response_text
             )
-            agent_message_service.create_message(db, assistant_msg)
+            await agent_message_service.create_message_async(db, assistant_msg)
 
         return APIResponse(
             status=200,
@@ -197,6 +220,8 @@ async def query_agent(
             }
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
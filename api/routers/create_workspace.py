@@ -1,33 +1,47 @@
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from database import get_db
+from database import get_async_db, SessionLocal
 from models import (
     WorkspaceCreate,
     DocumentCreate,
     ActivityCreate,
     ParsedDocumentCreate,
     APIResponse,
+    JobStage,
+    JobStatus,
 )
 from services import (
     workspace_service,
     documents_service,
     activity_service,
     parsed_documents_service,
+    jobs_service,
+    job_runner,
 )
-from services.filings_service import download_filings, extract_dates
+from services.filings_service import sync_many
+from services.sec_header import parse_header, format_date, document_fields
 import os
 import shutil
 import zipfile
-import json
-from pathlib import Path
-from typing import Optional
-from landingai_ade import LandingAIADE
+from concurrent.futures import Future, as_completed
+from typing import Dict, List, Optional, Tuple
+from services import parse_cache, filing_store, sec_sections, workspace_search
 
 router = APIRouter(tags=["workspace"])
 
+FILING_FORMS = ["10-Q", "10-K"]
+# Filings registered per transaction
+REGISTER_BATCH_SIZE = 50
+
 
 def flatten_and_copy_files(source_dir: str, dest_dir: str):
-    """Recursively flatten directory structure and copy all files to dest_dir"""
+    """Recursively flatten directory structure and link all files into dest_dir
+
+    Files go through the content-addressed upload store, so identical
+    uploads share one copy on disk.
+    """
     files_copied = []
 
     for root, dirs, files in os.walk(source_dir):
@@ -41,7 +55,9 @@ def flatten_and_copy_files(source_dir: str, dest_dir: str):
                 dest_file = os.path.join(dest_dir, f"{base_name}_{counter}{ext}")
                 counter += 1
 
-            shutil.copy2(source_file, dest_file)
+            filing_store.link_into(
+                filing_store.store_upload(source_file, move=True), dest_file
+            )
             files_copied.append(dest_file)
 
     return files_copied
@@ -53,40 +69,40 @@ def extract_zip(zip_path: str, extract_dir: str):
         zip_ref.extractall(extract_dir)
 
 
-def parse_document_with_landingai(
-    file_path: str, workspace_id: str, document_id: str, db: Session
-):
-    """Parse document using LandingAI and save as JSON"""
-    try:
-        # Log parsing start
-        activity_data = ActivityCreate(
-            workspace_id=workspace_id,
-            category="sub",
-            status=200,
-            title="Document Parsing",
-            message=f"Started parsing {os.path.basename(file_path)}",
-        )
-        activity_service.create_activity(db, activity_data)
-
-        # Initialize LandingAI client
-        api_key = os.environ.get("LANDING_API_KEY")
-        if not api_key:
-            print(f"Warning: LANDING_API_KEY not found, skipping parse for {file_path}")
-            return None
+def log_parse_started(db: Session, workspace_id: str, file_path: str):
+    """Log the parsing start activity for a document"""
+    activity_data = ActivityCreate(
+        workspace_id=workspace_id,
+        category="sub",
+        status=200,
+        title="Document Parsing",
+        message=f"Started parsing {os.path.basename(file_path)}",
+    )
+    activity_service.create_activity(db, activity_data)
 
-        client = LandingAIADE(
-            apikey=api_key,
-        )
 
-        # Parse the document
-        response = client.parse(document=Path(file_path), model="dpt-2-latest")
+def parse_document_with_landingai(
+    file_path: str,
+    workspace_id: str,
+    document_id: str,
+    db: Session,
+    pending: Optional[Future] = None,
+):
+    """Parse document using LandingAI and link the JSON output
 
-        # Save response as JSON
-        json_filename = os.path.splitext(file_path)[0] + ".json"
-        with open(json_filename, "w") as f:
-            json.dump(response.to_json())
+    Outputs live in the shared content-addressed parse cache, so a file
+    parsed before (by any workspace) is linked without calling the API.
+    pending is the future from parse_cache.parse_cached() when the parse was
+    already queued (and its start logged); otherwise it is queued here.
+    """
+    try:
+        if pending is None:
+            # Log parsing start
+            log_parse_started(db, workspace_id, file_path)
+            pending = parse_cache.parse_cached(file_path)
 
-        pdfdata = response.to_dict()
+        # Wait for the cached or freshly parsed output
+        json_filename = pending.result()
 
         # Create parsed document entry with status=False initially
         parsed_doc_data = ParsedDocumentCreate(
@@ -105,6 +121,9 @@ def parse_document_with_landingai(
         update_data = ParsedDocumentUpdate(status=True)
         parsed_documents_service.update_parsed_document(db, parsed_doc.id, update_data)
 
+        # Index the chunks for workspace search
+        workspace_search.index_parse(db, document_id)
+
         # Log parsing completion
         activity_data = ActivityCreate(
             workspace_id=workspace_id,
@@ -131,109 +150,317 @@ def parse_document_with_landingai(
         return None
 
 
-def process_filings_for_workspace(
-    ticker: str, workspace_id: str, form_type: str, db: Session
-):
-    """Download filings and add to workspace"""
-    ticker = ticker.upper()
+def prepare_filing(
+    full_submission: str,
+    filing_dir: str,
+    workspace_id: str,
+    form_type: str,
+    header: Optional[dict] = None,
+) -> DocumentCreate:
+    """Link one downloaded filing into the workspace and return its document row.
 
-    # Download filings to temp location
-    temp_base_path = os.path.join(
-        os.path.dirname(os.path.dirname(__file__)), "data", f"temp_{ticker}"
+    header holds the parsed SEC header fields (as kept in the sync state);
+    the file is only parsed when they are missing.
+    """
+    workspace_folder = os.path.join(
+        os.path.dirname(os.path.dirname(__file__)), "data", workspace_id
     )
-    os.makedirs(temp_base_path, exist_ok=True)
 
-    from sec_edgar_downloader import Downloader
+    if not header or "accession_number" not in header:
+        header = {**parse_header(full_submission), **(header or {})}
 
-    dl = Downloader("CompanyName", "email@example.com", temp_base_path)
+    # Keep one canonical copy per accession number and link it into the workspace
+    dest_file = os.path.join(
+        workspace_folder,
+        f"{form_type}_{filing_dir}_full-submission.txt",
+    )
+    store_path = filing_store.store_filing(filing_dir, full_submission)
+    filing_store.link_into(store_path, dest_file)
+    sec_sections.load_index(store_path, filing_dir)
+
+    return DocumentCreate(
+        workspace_id=workspace_id,
+        doc_type=form_type.replace(
+            "-", "_"
+        ),  # 10-Q -> 10_Q, 10-K -> 10_K
+        file_path=dest_file,
+        filing_date=format_date(header.get("filing_date")),
+        reporting_date=format_date(header.get("reporting_date")),
+        doc_id=filing_dir,
+        **document_fields(header, form_type),
+    )
 
-    # Download based on form type
-    if form_type == "10-K":
-        dl.get("10-K", ticker, after="2015-01-01")
-    else:
-        dl.get("10-Q", ticker, after="2015-01-01")
 
-    temp_form_folder = os.path.join(
-        temp_base_path, "sec-edgar-filings", ticker, form_type
-    )
+def register_filings(
+    filings: List[Tuple[str, dict]], workspace_id: str, db: Session
+) -> Tuple[List[dict], Dict[str, str]]:
+    """Add a batch of downloaded filings to documents in one transaction.
+
+    filings are (form_type, filing) pairs as returned by the sync. Files are
+    linked and search passages extracted first; the documents, their
+    activities and search rows are then written with a single commit.
+    Returns the new documents and {accession: error} for the ones that failed.
+    """
+    prepared = []
+    errors = {}
+    for form_type, filing in filings:
+        try:
+            doc_data = prepare_filing(
+                filing["file_path"], filing["accession"], workspace_id, form_type, filing
+            )
+            rows = workspace_search.filing_rows(doc_data.file_path, filing["accession"])
+            prepared.append((doc_data, rows))
+        except Exception as e:
+            errors[filing["accession"]] = str(e)
+    if not prepared:
+        return [], errors
+
+    try:
+        documents = documents_service.create_documents(
+            db, [doc_data for doc_data, _ in prepared], commit=False
+        )
+
+        # Log download activity
+        activity_service.create_activities(
+            db,
+            [
+                ActivityCreate(
+                    workspace_id=workspace_id,
+                    category="sub",
+                    status=200,
+                    title="Filing Downloaded",
+                    message=f"{document.doc_id} downloaded",
+                )
+                for document in documents
+            ],
+            commit=False,
+        )
+
+        # Searchable right away; replaced by chunk rows once parsed
+        for document, (_, rows) in zip(documents, prepared):
+            workspace_search.index_filing(db, document, rows, commit=False)
+
+        added = [document.to_dict() for document in documents]
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        errors.update({doc_data.doc_id: str(e) for doc_data, _ in prepared})
+        return [], errors
+
+    return added, errors
+
+
+def register_upload(upload_path: str, workspace_id: str, db: Session):
+    """Unzip/copy an uploaded file into the workspace and add it to documents"""
     workspace_folder = os.path.join(
         os.path.dirname(os.path.dirname(__file__)), "data", workspace_id
     )
+    temp_dir = os.path.dirname(upload_path)
+    filename = os.path.basename(upload_path)
 
-    documents_added = []
-
-    if os.path.exists(temp_form_folder):
-        for filing_dir in os.listdir(temp_form_folder):
-            filing_path = os.path.join(temp_form_folder, filing_dir)
-            if os.path.isdir(filing_path):
-                full_submission = os.path.join(filing_path, "full-submission.txt")
-                if os.path.exists(full_submission):
-                    # Extract dates
-                    filing_date, reporting_date = extract_dates(full_submission)
-
-                    # Copy file to workspace
-                    dest_file = os.path.join(
-                        workspace_folder,
-                        f"{form_type}_{filing_dir}_full-submission.txt",
-                    )
-                    shutil.copy2(full_submission, dest_file)
+    # Check if it's a zip file
+    if filename.endswith(".zip"):
+        # Extract zip
+        extract_dir = os.path.join(temp_dir, "extracted")
+        os.makedirs(extract_dir, exist_ok=True)
+        extract_zip(upload_path, extract_dir)
 
-                    # Format dates to YYYY/MM/DD
-                    filing_date_formatted = (
-                        f"{filing_date[:4]}/{filing_date[4:6]}/{filing_date[6:]}"
-                        if filing_date
-                        else None
-                    )
-                    reporting_date_formatted = (
-                        f"{reporting_date[:4]}/{reporting_date[4:6]}/{reporting_date[6:]}"
-                        if reporting_date
-                        else None
-                    )
+        # Log unzip activity
+        activity_data = ActivityCreate(
+            workspace_id=workspace_id,
+            category="sub",
+            status=200,
+            title="File Processing",
+            message=f"Unzipped {filename}",
+        )
+        activity_service.create_activity(db, activity_data)
 
-                    # Add to documents table
-                    doc_data = DocumentCreate(
-                        workspace_id=workspace_id,
-                        doc_type=form_type.replace(
-                            "-", "_"
-                        ),  # 10-Q -> 10_Q, 10-K -> 10_K
-                        file_path=dest_file,
-                        filing_date=filing_date_formatted,
-                        reporting_date=reporting_date_formatted,
-                        doc_id=filing_dir,
-                    )
-                    document = documents_service.create_document(db, doc_data)
-                    documents_added.append(document.to_dict())
-
-                    # Log download activity
-                    activity_data = ActivityCreate(
-                        workspace_id=workspace_id,
-                        category="sub",
-                        status=200,
-                        title="Filing Downloaded",
-                        message=f"{filing_dir} downloaded",
-                    )
-                    activity_service.create_activity(db, activity_data)
+        # Flatten and copy all files
+        files_copied = flatten_and_copy_files(extract_dir, workspace_folder)
+    else:
+        # Single file - link into workspace folder
+        dest_file = os.path.join(workspace_folder, filename)
+        filing_store.link_into(filing_store.store_upload(upload_path, move=True), dest_file)
+        files_copied = [dest_file]
+
+    # Add all files to documents table in one transaction
+    documents_data = []
+    search_rows = []
+    for file_path in files_copied:
+        # Uploaded EDGAR submissions keep their header fields and are
+        # searchable right away, like downloaded filings
+        header = parse_header(file_path) if file_path.lower().endswith(".txt") else {}
+        if header:
+            sec_sections.load_index(file_path)
+        search_rows.append(workspace_search.filing_rows(file_path) if header else [])
+        doc_data = DocumentCreate(
+            workspace_id=workspace_id,
+            doc_type="other",
+            file_path=file_path,
+            filing_date=format_date(header.get("filing_date")),
+            reporting_date=format_date(header.get("reporting_date")),
+            **(document_fields(header) if header else {}),
+        )
+        documents_data.append(doc_data)
+    created = documents_service.create_documents(db, documents_data, commit=False)
+    for document, rows in zip(created, search_rows):
+        if rows:
+            workspace_search.index_filing(db, document, rows, commit=False)
+    documents = [document.to_dict() for document in created]
+    db.commit()
 
     # Cleanup temp directory
-    if os.path.exists(temp_base_path):
-        shutil.rmtree(temp_base_path)
+    if os.path.exists(temp_dir):
+        shutil.rmtree(temp_dir)
+
+    return documents
 
-    return documents_added
 
+def run_workspace_job(
+    job_id: str, workspace_id: str, ticker: Optional[str], upload_path: Optional[str]
+):
+    """Background pipeline: sync filings, register new documents, parse them"""
+    db = SessionLocal()
+    job = None
+    try:
+        job = jobs_service.get_job_by_id(db, job_id)
+        jobs_service.set_job_status(db, job, JobStatus.RUNNING)
 
-@router.post("/create_workspace", response_model=APIResponse)
+        # Stage 1: sync 10-Q and 10-K filings concurrently (only newer ones
+        # are downloaded, under the host-wide SEC rate limit)
+        downloaded = []
+        if ticker:
+            jobs_service.start_stage(db, job, JobStage.DOWNLOAD, total=len(FILING_FORMS))
+            existing = {
+                doc.doc_id
+                for doc in documents_service.get_documents_by_workspace(db, workspace_id)
+            }
+            synced, errors, failures = sync_many(db, ticker, FILING_FORMS)
+            for form_type in FILING_FORMS:
+                if form_type in errors:
+                    jobs_service.advance_stage(
+                        db, job, JobStage.DOWNLOAD, failed=1,
+                        error=f"{form_type}: {str(errors[form_type])}"
+                    )
+                    continue
+                # Failed filings are retried by the next sync; the form
+                # itself still counts as done
+                for accession, error in failures.get(form_type, {}).items():
+                    jobs_service.advance_stage(
+                        db, job, JobStage.DOWNLOAD, error=f"{form_type} {accession}: {str(error)}"
+                    )
+                downloaded.extend(
+                    (form_type, filing)
+                    for filing in synced[form_type]
+                    if filing["accession"] not in existing
+                )
+                jobs_service.advance_stage(db, job, JobStage.DOWNLOAD, done=1)
+            jobs_service.finish_stage(db, job, JobStage.DOWNLOAD)
+
+        # Stage 2: register uploaded files and downloaded filings as documents
+        documents = []
+        jobs_service.start_stage(db, job, JobStage.REGISTER, total=len(downloaded))
+        if upload_path:
+            jobs_service.add_stage_total(db, job, JobStage.REGISTER, 1)
+            try:
+                documents.extend(register_upload(upload_path, workspace_id, db))
+                jobs_service.advance_stage(db, job, JobStage.REGISTER, done=1)
+            except Exception as e:
+                jobs_service.advance_stage(
+                    db, job, JobStage.REGISTER, failed=1,
+                    error=f"{os.path.basename(upload_path)}: {str(e)}"
+                )
+        for start in range(0, len(downloaded), REGISTER_BATCH_SIZE):
+            added, failed = register_filings(
+                downloaded[start:start + REGISTER_BATCH_SIZE], workspace_id, db
+            )
+            documents.extend(added)
+            for accession, error in failed.items():
+                jobs_service.advance_stage(
+                    db, job, JobStage.REGISTER, failed=1, error=f"{accession}: {error}"
+                )
+            if added:
+                jobs_service.advance_stage(db, job, JobStage.REGISTER, done=len(added))
+        jobs_service.finish_stage(db, job, JobStage.REGISTER)
+
+        # Stage 3: parse all documents using LandingAI (or the shared parse
+        # cache), up to PARSE_CONCURRENCY at a time; rows are saved as they finish
+        jobs_service.start_stage(db, job, JobStage.PARSE, total=len(documents))
+        pending = {}
+        for doc in documents:
+            doc_id = doc.get("id")
+            doc_file_path = doc.get("file_path")
+            if doc_id and doc_file_path and os.path.exists(doc_file_path):
+                log_parse_started(db, workspace_id, doc_file_path)
+                pending[parse_cache.parse_cached(doc_file_path)] = doc
+            else:
+                jobs_service.advance_stage(
+                    db, job, JobStage.PARSE, failed=1,
+                    error=f"{os.path.basename(doc_file_path or '')}: file not found"
+                )
+        for future in as_completed(pending):
+            doc = pending[future]
+            name = os.path.basename(doc["file_path"])
+            try:
+                parsed = parse_document_with_landingai(
+                    doc["file_path"], workspace_id, doc["id"], db, pending=future
+                )
+                if parsed:
+                    jobs_service.advance_stage(db, job, JobStage.PARSE, done=1)
+                else:
+                    jobs_service.advance_stage(
+                        db, job, JobStage.PARSE, failed=1, error=f"{name}: not parsed"
+                    )
+            except Exception as e:
+                db.rollback()
+                jobs_service.advance_stage(
+                    db, job, JobStage.PARSE, failed=1, error=f"{name}: {str(e)}"
+                )
+        jobs_service.finish_stage(db, job, JobStage.PARSE)
+
+        jobs_service.set_job_status(db, job, JobStatus.COMPLETED)
+
+    except Exception as e:
+        print(f"Error running job {job_id}: {str(e)}")
+        db.rollback()
+        if job is not None:
+            if job.stage:
+                jobs_service.finish_stage(db, job, JobStage(job.stage), status="failed")
+            jobs_service.set_job_status(db, job, JobStatus.FAILED, error=str(e))
+    finally:
+        db.close()
+
+
+def save_upload(file: UploadFile, workspace_folder: str) -> str:
+    """Persist an uploaded file to the workspace temp folder"""
+    temp_dir = os.path.join(workspace_folder, "temp")
+    os.makedirs(temp_dir, exist_ok=True)
+
+    file_path = os.path.join(temp_dir, os.path.basename(file.filename))
+    with open(file_path, "wb") as buffer:
+        shutil.copyfileobj(file.file, buffer)
+    return file_path
+
+
+@router.post(
+    "/create_workspace",
+    response_model=APIResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
 async def create_workspace_endpoint(
     workspace_id: Optional[str] = Form(None),
     ticker: Optional[str] = Form(None),
     file: Optional[UploadFile] = File(None),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
-    Create workspace with optional file upload and/or ticker-based filings
+    Create workspace and queue a job to fill it
 
     - workspace_id: Optional workspace ID (auto-generated if not provided)
     - ticker: Optional ticker symbol to download 10-Q and 10-K filings
     - file: Optional file upload (can be zip or single file)
+
+    Returns 202 with the workspace and a job; poll /jobs/{id} for progress.
     """
     try:
         # Step 1: Create workspace via internal API
@@ -242,7 +469,7 @@ async def create_workspace_endpoint(
             name=None,  # Will be auto-generated
             ticker=ticker or "UNKNOWN",
         )
-        workspace = workspace_service.create_workspace(db, workspace_data)
+        workspace = await workspace_service.create_workspace_async(db, workspace_data)
         created_workspace_id = workspace.id
 
         # Log main activity
@@ -253,92 +480,79 @@ async def create_workspace_endpoint(
             title="Workspace Creation",
             message="Creating workspace",
         )
-        activity_service.create_activity(db, activity_data)
+        await activity_service.create_activity_async(db, activity_data)
 
         workspace_folder = os.path.join(
             os.path.dirname(os.path.dirname(__file__)), "data", created_workspace_id
         )
 
-        result = {"workspace": workspace.to_dict(), "documents": []}
-
-        # Step 2: Handle file upload if present
+        # Step 2: Save the upload now; the request body is gone once we return
+        upload_path = None
         if file:
-            temp_dir = os.path.join(workspace_folder, "temp")
-            os.makedirs(temp_dir, exist_ok=True)
-
-            # Save uploaded file
-            file_path = os.path.join(temp_dir, file.filename)
-            with open(file_path, "wb") as buffer:
-                shutil.copyfileobj(file.file, buffer)
-
-            # Check if it's a zip file
-            if file.filename.endswith(".zip"):
-                # Extract zip
-                extract_dir = os.path.join(temp_dir, "extracted")
-                os.makedirs(extract_dir, exist_ok=True)
-                extract_zip(file_path, extract_dir)
-
-                # Log unzip activity
-                activity_data = ActivityCreate(
-                    workspace_id=created_workspace_id,
-                    category="sub",
-                    status=200,
-                    title="File Processing",
-                    message=f"Unzipped {file.filename}",
-                )
-                activity_service.create_activity(db, activity_data)
+            upload_path = await run_in_threadpool(save_upload, file, workspace_folder)
 
-                # Flatten and copy all files
-                files_copied = flatten_and_copy_files(extract_dir, workspace_folder)
-            else:
-                # Single file - copy to workspace folder
-                dest_file = os.path.join(workspace_folder, file.filename)
-                shutil.copy2(file_path, dest_file)
-                files_copied = [dest_file]
-
-            # Add each file to documents table
-            for file_path in files_copied:
-                doc_data = DocumentCreate(
-                    workspace_id=created_workspace_id,
-                    doc_type="other",
-                    file_path=file_path,
-                )
-                document = documents_service.create_document(db, doc_data)
-                result["documents"].append(document.to_dict())
+        # Step 3: Queue download, register and parse stages
+        stages = [JobStage.REGISTER, JobStage.PARSE]
+        if ticker:
+            stages.insert(0, JobStage.DOWNLOAD)
+        job = await jobs_service.create_job_async(
+            db, created_workspace_id, "create_workspace", stages
+        )
+        job_runner.submit(
+            run_workspace_job, job.id, created_workspace_id, ticker, upload_path
+        )
 
-            # Cleanup temp directory
-            if os.path.exists(temp_dir):
-                shutil.rmtree(temp_dir)
+        return APIResponse(
+            status=202,
+            response={"workspace": workspace.to_dict(), "job": job.to_dict()},
+        )
 
-        # Step 3: Handle ticker-based filings if present
-        if ticker:
-            # Download and process 10-Q filings
-            docs_10q = process_filings_for_workspace(
-                ticker, created_workspace_id, "10-Q", db
-            )
-            result["documents"].extend(docs_10q)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
+        )
 
-            # Download and process 10-K filings
-            docs_10k = process_filings_for_workspace(
-                ticker, created_workspace_id, "10-K", db
-            )
-            result["documents"].extend(docs_10k)
 
-        # Step 4: Parse all documents using LandingAI
-        for doc in result["documents"]:
-            try:
-                doc_id = doc.get("id")
-                doc_file_path = doc.get("file_path")
-                if doc_id and doc_file_path and os.path.exists(doc_file_path):
-                    parse_document_with_landingai(
-                        doc_file_path, created_workspace_id, doc_id, db
-                    )
-            except Exception as e:
-                print(f"Error parsing document {doc.get('file_path')}: {str(e)}")
-                continue
+@router.post(
+    "/sync_workspace",
+    response_model=APIResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def sync_workspace_endpoint(
+    workspace_id: str = Form(...),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Queue a job that pulls filings newer than the last sync for the
+    workspace's ticker, registers the ones it lacks and parses them
+    """
+    try:
+        workspace = await workspace_service.get_workspace_by_id_async(db, workspace_id)
+        if not workspace:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Workspace with ID '{workspace_id}' not found",
+            )
+        if not workspace.ticker or workspace.ticker == "UNKNOWN":
+            raise ValueError(f"Workspace '{workspace_id}' has no ticker to sync")
+
+        job = await jobs_service.create_job_async(
+            db,
+            workspace_id,
+            "sync_workspace",
+            [JobStage.DOWNLOAD, JobStage.REGISTER, JobStage.PARSE],
+        )
+        job_runner.submit(run_workspace_job, job.id, workspace_id, workspace.ticker, None)
 
-        return APIResponse(status=201, response=result)
+        return APIResponse(
+            status=202,
+            response={"workspace": workspace.to_dict(), "job": job.to_dict()},
+        )
 
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
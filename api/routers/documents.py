@@ -1,9 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
 from fastapi.responses import FileResponse, Response
 from sqlalchemy.orm import Session
-from database import get_db
+from database import SessionLocal, get_db
 from models import DocumentCreate, DocumentUpdate, APIResponse
 from services import documents_service
+from services.pagination import DEFAULT_LIMIT, MAX_LIMIT, iter_rows
+from responses import json_response, ndjson_response
 from typing import Optional
 import os
 import mimetypes
@@ -12,14 +14,95 @@ router = APIRouter(prefix="/data/documents", tags=["documents"])
 
 documents_router = APIRouter(prefix="/documents", tags=["documents"])
 
+# Clients may keep files but must revalidate (a cheap 304) before reuse
+FILE_CACHE_CONTROL = "private, no-cache"
+
+def file_etag(stat_result: os.stat_result, suffix: str = "") -> str:
+    """Strong ETag from a file's inode, size and mtime"""
+    return f'"{stat_result.st_ino:x}-{stat_result.st_size:x}-{stat_result.st_mtime_ns:x}{suffix}"'
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """True if the request's If-None-Match covers etag"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    tags = [tag.strip() for tag in header.split(",")]
+    return "*" in tags or etag in tags or f"W/{etag}" in tags
+
+def not_modified(etag: str) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": FILE_CACHE_CONTROL}
+    )
+
+def conditional_file_response(
+    request: Request,
+    path: str,
+    media_type: str,
+    filename: Optional[str] = None,
+    headers: Optional[dict] = None
+) -> Response:
+    """Stream a file from disk with Range support, a strong ETag and 304s"""
+    stat_result = os.stat(path)
+    etag = file_etag(stat_result)
+    if etag_matches(request, etag):
+        response = not_modified(etag)
+        response.headers.update(headers or {})
+        return response
+    return FileResponse(
+        path,
+        media_type=media_type,
+        stat_result=stat_result,
+        content_disposition_type="inline",
+        filename=filename,
+        headers={"ETag": etag, "Cache-Control": FILE_CACHE_CONTROL, **(headers or {})}
+    )
+
+def accepted_encodings(request: Request) -> set:
+    """Content-codings the client accepts (q > 0)"""
+    accepted = set()
+    for part in request.headers.get("accept-encoding", "").split(","):
+        coding, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if coding and q > 0:
+            accepted.add(coding.strip().lower())
+    return accepted
+
+def parsed_json_response(request: Request, path: str) -> Response:
+    """Serve a parse output as stored, from its br/gzip sidecar when accepted"""
+    from services import parse_cache
+
+    parse_cache.ensure_sidecars(path)
+    accepted = accepted_encodings(request)
+    headers = {"Vary": "Accept-Encoding", "Content-Disposition": "inline"}
+    for encoding in parse_cache.sidecar_encodings():
+        sidecar = parse_cache.sidecar_path(path, encoding)
+        if (encoding in accepted or "*" in accepted) and os.path.exists(sidecar):
+            headers["Content-Encoding"] = encoding
+            return conditional_file_response(request, sidecar, "application/json", headers=headers)
+    return conditional_file_response(request, path, "application/json", headers=headers)
+
 @documents_router.get("", response_model=APIResponse)
 def get_documents_by_workspace_id(
     workspace_id: str = Query(..., description="Workspace ID to filter documents"),
+    form_type: Optional[str] = Query(None, description="SEC form type, e.g. 10-Q"),
+    cik: Optional[str] = Query(None, description="Filer CIK"),
+    sic_code: Optional[str] = Query(None, description="Standard Industrial Classification code"),
+    filed_from: Optional[str] = Query(None, description="Earliest filing date (YYYY/MM/DD)"),
+    filed_to: Optional[str] = Query(None, description="Latest filing date (YYYY/MM/DD)"),
     db: Session = Depends(get_db)
 ):
     """Get all documents for a specific workspace"""
     try:
-        documents = documents_service.get_documents_by_workspace(db, workspace_id)
+        documents = documents_service.get_documents_by_workspace(
+            db, workspace_id, form_type, cik, sic_code, filed_from, filed_to
+        )
         return APIResponse(
             status=200,
             response=[document.to_dict() for document in documents]
@@ -33,12 +116,12 @@ def get_documents_by_workspace_id(
 @documents_router.get("/{document_id}/download")
 def download_document(
     document_id: str,
+    request: Request,
     db: Session = Depends(get_db)
 ):
     """Serve document file for viewing (not downloading)"""
     try:
         from services import parsed_documents_service
-        import json
 
         document = documents_service.get_document_by_id(db, document_id)
         if not document:
@@ -52,18 +135,8 @@ def download_document(
         if parsed_docs and len(parsed_docs) > 0:
             parsed_doc = parsed_docs[0]
             if parsed_doc.status and os.path.exists(parsed_doc.filepath):
-                # Return parsed JSON content
-                with open(parsed_doc.filepath, 'r') as f:
-                    json_content = json.load(f)
-
-                return Response(
-                    content=json.dumps(json_content),
-                    media_type='application/json',
-                    headers={
-                        'Content-Disposition': 'inline',
-                        'Cache-Control': 'no-cache'
-                    }
-                )
+                # Return the stored JSON bytes, precompressed when accepted
+                return parsed_json_response(request, parsed_doc.filepath)
 
         # Fall back to original document
         file_path = document.file_path
@@ -73,10 +146,6 @@ def download_document(
                 detail=f"File not found at path: {file_path}"
             )
 
-        # Read file content
-        with open(file_path, 'rb') as f:
-            content = f.read()
-
         # Determine content type
         filename = os.path.basename(file_path)
         ext = os.path.splitext(filename)[1].lower()
@@ -90,14 +159,97 @@ def download_document(
             guessed_type = mimetypes.guess_type(filename)[0]
             media_type = guessed_type if guessed_type else 'text/plain'
 
-        # Return file content with proper headers for inline display
-        return Response(
-            content=content,
+        # Stream from disk for inline display (Range, ETag, If-None-Match)
+        return conditional_file_response(request, file_path, media_type, filename)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+def _sections_for(document_id: str, db: Session):
+    """Document and its <DOCUMENT> section index, or 404"""
+    from services import sec_sections
+
+    document = documents_service.get_document_by_id(db, document_id)
+    if not document:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Document with ID '{document_id}' not found"
+        )
+    if not os.path.exists(document.file_path):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"File not found at path: {document.file_path}"
+        )
+    if not document.file_path.lower().endswith(".txt"):
+        return document, []
+    return document, sec_sections.load_index(document.file_path, document.accession_number)
+
+@documents_router.get("/{document_id}/sections", response_model=APIResponse)
+def get_document_sections(
+    document_id: str,
+    db: Session = Depends(get_db)
+):
+    """List the <DOCUMENT> sections of a filing (type, filename, offset, length)"""
+    try:
+        _, sections = _sections_for(document_id, db)
+        return APIResponse(status=200, response=sections)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+@documents_router.get("/{document_id}/sections/{sequence}")
+def get_document_section(
+    document_id: str,
+    sequence: int,
+    request: Request,
+    db: Session = Depends(get_db)
+):
+    """Serve one section of a filing, read by seeking to its offset"""
+    try:
+        from fastapi.responses import StreamingResponse
+        from services import sec_sections
+
+        document, sections = _sections_for(document_id, db)
+        section = sec_sections.find_section(sections, sequence)
+        if not section:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Section {sequence} not found in document '{document_id}'"
+            )
+
+        filename = section["filename"] or f"section-{sequence}.txt"
+        media_type = mimetypes.guess_type(filename)[0] or 'text/plain'
+        if media_type.startswith('text/'):
+            media_type = f'{media_type}; charset=utf-8'
+        etag = file_etag(os.stat(document.file_path), f"-{sequence}")
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        headers = {
+            'Content-Disposition': f'inline; filename="{filename}"',
+            'Cache-Control': FILE_CACHE_CONTROL,
+            'ETag': etag
+        }
+
+        if section["encoding"] == "uuencode":
+            # Graphics and PDFs are small; decode them for the browser
+            return Response(
+                content=sec_sections.read_section(document.file_path, section),
+                media_type=media_type,
+                headers=headers
+            )
+        headers['Content-Length'] = str(section["length"])
+        return StreamingResponse(
+            sec_sections.iter_section(document.file_path, section),
             media_type=media_type,
-            headers={
-                'Content-Disposition': f'inline; filename="{filename}"',
-                'Cache-Control': 'no-cache'
-            }
+            headers=headers
         )
     except HTTPException:
         raise
@@ -107,14 +259,146 @@ def download_document(
             detail=str(e)
         )
 
-@router.get("", response_model=APIResponse)
-def get_documents(db: Session = Depends(get_db)):
-    """Get all documents"""
+def _parse_output_for(document_id: str, db: Session) -> str:
+    """Path of a document's completed parse output, or 404"""
+    from services import parsed_documents_service
+
+    if not documents_service.get_document_by_id(db, document_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Document with ID '{document_id}' not found"
+        )
+    for parsed_doc in parsed_documents_service.get_parsed_documents_by_document(db, document_id):
+        if parsed_doc.status and os.path.exists(parsed_doc.filepath):
+            return parsed_doc.filepath
+    raise HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=f"Document '{document_id}' has not been parsed"
+    )
+
+def _chunk_response(request: Request, entry_path: str, suffix: str, read) -> Response:
+    """JSON bytes from the chunk index, with an ETag tied to the index file"""
+    from services import chunk_index
+
+    etag = file_etag(os.stat(chunk_index.index_path(entry_path)), suffix)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    return Response(
+        content=read(),
+        media_type='application/json',
+        headers={'ETag': etag, 'Cache-Control': FILE_CACHE_CONTROL}
+    )
+
+@documents_router.get("/{document_id}/chunks", response_model=APIResponse)
+def get_document_chunks(
+    document_id: str,
+    page: Optional[int] = Query(None, description="Only chunks on this page"),
+    offset: int = Query(0, ge=0),
+    limit: int = Query(100, ge=0, le=1000),
+    db: Session = Depends(get_db)
+):
+    """List chunk metadata (id, index, page, type, bbox) of a parsed document"""
     try:
-        documents = documents_service.get_all_documents(db)
+        from services import chunk_index
+
+        index = chunk_index.load(_parse_output_for(document_id, db))
         return APIResponse(
             status=200,
-            response=[document.to_dict() for document in documents]
+            response=chunk_index.metadata(index, page, offset, limit)
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+@documents_router.get("/{document_id}/chunks/range")
+def get_document_chunk_range(
+    document_id: str,
+    request: Request,
+    start: Optional[int] = Query(None, ge=0, description="First chunk index"),
+    end: Optional[int] = Query(None, ge=0, description="Chunk index to stop before"),
+    page: Optional[int] = Query(None, description="All chunks on this page"),
+    db: Session = Depends(get_db)
+):
+    """Full chunks [start, end) or of one page, as a JSON array"""
+    try:
+        from services import chunk_index
+
+        entry_path = _parse_output_for(document_id, db)
+        index = chunk_index.load(entry_path)
+        if page is not None:
+            start, end = chunk_index.page_range(index, page) or (0, 0)
+        elif start is None or end is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Pass either page or start and end"
+            )
+        return _chunk_response(
+            request, entry_path, f"-{start}-{end}",
+            lambda: chunk_index.read_range(entry_path, index, start, end)
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+@documents_router.get("/{document_id}/chunks/{chunk_id}")
+def get_document_chunk(
+    document_id: str,
+    chunk_id: str,
+    request: Request,
+    db: Session = Depends(get_db)
+):
+    """One chunk of a parsed document"""
+    try:
+        from services import chunk_index
+
+        entry_path = _parse_output_for(document_id, db)
+        index = chunk_index.load(entry_path)
+        if chunk_id not in index["positions"]:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Chunk '{chunk_id}' not found in document '{document_id}'"
+            )
+        return _chunk_response(
+            request, entry_path, f"-{index['positions'][chunk_id]}",
+            lambda: chunk_index.read_chunk(entry_path, index, chunk_id)
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+@router.get("", response_model=APIResponse)
+def get_documents(
+    limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT, description="Page size"),
+    cursor: str = Query(None, description="next_cursor of the previous page"),
+    since: str = Query(None, description="Only rows newer than this cursor (e.g. a previous latest_cursor)"),
+    fields: str = Query(None, description="Comma-separated columns to return (default all)"),
+    output: str = Query("json", alias="format", pattern="^(json|ndjson)$",
+                        description="ndjson streams every row from cursor/since on, one per line, ignoring limit"),
+    db: Session = Depends(get_db)
+):
+    """Get documents newest first, a page at a time"""
+    try:
+        if output == "ndjson":
+            listing = documents_service.document_listing(fields)
+            return ndjson_response(iter_rows(SessionLocal, listing, cursor, since))
+        page = documents_service.list_documents(db, limit, cursor, since, fields)
+        return json_response(page.to_dict())
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
         )
     except Exception as e:
         raise HTTPException(
@@ -1,18 +1,20 @@
 from fastapi import APIRouter, Depends, Response
+from sqlalchemy.orm import Session
 from auth import verify_token
+from database import get_db
 from services.filings_service import download_filings
 from models import APIResponse
 
 router = APIRouter()
 
 @router.get("/filings", response_model=APIResponse)
-def get_filings(tick: str, inter: str = "quarterly", response: Response = None, _: bool = Depends(verify_token)):
+def get_filings(tick: str, inter: str = "quarterly", response: Response = None, db: Session = Depends(get_db), _: bool = Depends(verify_token)):
     if inter not in ["quarterly", "yearly"]:
         response.status_code = 400
         return APIResponse(status=400, response={"error": "Invalid interval. Use 'quarterly' or 'yearly'"})
 
     try:
-        result = download_filings(tick, inter)
+        result = download_filings(db, tick, inter)
         response.status_code = 200
         return APIResponse(status=200, response=result)
     except Exception as e:
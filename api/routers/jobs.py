@@ -0,0 +1,56 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.orm import Session
+from database import get_db
+from models import APIResponse
+from services import jobs_service
+from services.parse_executor import parse_executor
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+@router.get("", response_model=APIResponse)
+def get_jobs(
+    workspace_id: str = Query(..., description="Workspace ID to filter jobs"),
+    db: Session = Depends(get_db)
+):
+    """Get all jobs for a workspace"""
+    try:
+        jobs = jobs_service.get_jobs_by_workspace(db, workspace_id)
+        return APIResponse(
+            status=200,
+            response=[job.to_dict() for job in jobs]
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+@router.get("/stats", response_model=APIResponse)
+def get_job_stats():
+    """Get LandingAI parse executor queue depth and in-flight counts"""
+    return APIResponse(
+        status=200,
+        response={"parse": parse_executor.stats()}
+    )
+
+@router.get("/{job_id}", response_model=APIResponse)
+def get_job(job_id: str, db: Session = Depends(get_db)):
+    """Get job status with per-stage progress"""
+    try:
+        job = jobs_service.get_job_by_id(db, job_id)
+        if not job:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Job with ID '{job_id}' not found"
+            )
+        return APIResponse(
+            status=200,
+            response=job.to_dict()
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
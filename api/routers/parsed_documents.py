@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
-from database import get_db
+from database import SessionLocal, get_db
 from models import ParsedDocumentCreate, ParsedDocumentUpdate, APIResponse
 from services import parsed_documents_service
+from services.pagination import DEFAULT_LIMIT, MAX_LIMIT, iter_rows
+from responses import json_response, ndjson_response
 
 router = APIRouter(prefix="/data/parsed_documents", tags=["parsed_documents"])
 
@@ -10,20 +12,27 @@ router = APIRouter(prefix="/data/parsed_documents", tags=["parsed_documents"])
 def get_parsed_documents(
     workspace_id: str = Query(None, description="Filter by workspace ID"),
     document_id: str = Query(None, description="Filter by document ID"),
+    limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT, description="Page size"),
+    cursor: str = Query(None, description="next_cursor of the previous page"),
+    since: str = Query(None, description="Only rows newer than this cursor (e.g. a previous latest_cursor)"),
+    fields: str = Query(None, description="Comma-separated columns to return (default all)"),
+    output: str = Query("json", alias="format", pattern="^(json|ndjson)$",
+                        description="ndjson streams every row from cursor/since on, one per line, ignoring limit"),
     db: Session = Depends(get_db)
 ):
-    """Get all parsed documents, optionally filtered by workspace_id or document_id"""
+    """Get parsed documents newest first, a page at a time, optionally filtered by workspace_id or document_id"""
     try:
-        if workspace_id:
-            parsed_documents = parsed_documents_service.get_parsed_documents_by_workspace(db, workspace_id)
-        elif document_id:
-            parsed_documents = parsed_documents_service.get_parsed_documents_by_document(db, document_id)
-        else:
-            parsed_documents = parsed_documents_service.get_all_parsed_documents(db)
-
-        return APIResponse(
-            status=200,
-            response=[parsed_doc.to_dict() for parsed_doc in parsed_documents]
+        if output == "ndjson":
+            listing = parsed_documents_service.parsed_document_listing(workspace_id, document_id, fields)
+            return ndjson_response(iter_rows(SessionLocal, listing, cursor, since))
+        page = parsed_documents_service.list_parsed_documents(
+            db, workspace_id, document_id, limit, cursor, since, fields
+        )
+        return json_response(page.to_dict())
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
         )
     except Exception as e:
         raise HTTPException(
@@ -1,27 +1,76 @@
-from fastapi import APIRouter, Depends, Response
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.orm import Session
 from auth import verify_token
-from services.data_loader import get_dataframe
+from database import get_db
+from config import FUZZY_BUDGET_MS
+from services.data_loader import get_search_index, get_generation
+from services.search_cache import search_cache
+from services.search_sessions import typeahead_sessions
+from services import workspace_search
 from models import APIResponse
 
 router = APIRouter()
 
 @router.get("/search_listed", response_model=APIResponse)
-def search_listed(query: str, etf: bool = False, response: Response = None, _: bool = Depends(verify_token)):
-    df = get_dataframe()
-    query_lower = query.lower()
+def search_listed(
+    query: str,
+    etf: bool = False,
+    limit: int = Query(20, ge=1, le=200, description="Maximum number of results"),
+    fuzzy: bool = Query(False, description="Append typo-tolerant name matches when exact matching runs short"),
+    session: Optional[str] = Query(None, max_length=64, description="Typeahead session token; queries extending the previous one narrow its matches"),
+    _: bool = Depends(verify_token)
+):
+    # Generation is read before the index so a concurrent reload can only
+    # make this entry stale, never wrong for its key
+    generation = get_generation()
+    index = get_search_index()
+    normalized = " ".join(query.lower().split())
+    key = (generation, normalized, etf, limit, fuzzy)
 
-    results = df[
-        df['symbol_lower'].str.contains(query_lower, na=False) |
-        df['name_lower'].str.contains(query_lower, na=False)
-    ].copy()
+    body = search_cache.get(key)
+    if body is None:
+        if session:
+            rows = typeahead_sessions.candidates(session, generation, normalized, etf)
+            if rows is None:
+                rows = index.match_all(normalized, etf=etf)
+            data, matched = index.search_within(normalized, rows, limit=limit)
+            typeahead_sessions.update(session, generation, normalized, etf, matched)
+        else:
+            data = index.search(normalized, etf=etf, limit=limit)
+        if fuzzy and len(data) < limit:
+            seen = {item["symbol"] for item in data}
+            for item in index.search_fuzzy(normalized, etf=etf, limit=limit, budget_ms=FUZZY_BUDGET_MS):
+                if item["symbol"] not in seen and len(data) < limit:
+                    data.append(item)
+        body = APIResponse(status=200, response=data).model_dump_json().encode()
+        search_cache.put(key, body)
 
-    if not etf:
-        results = results[results['ETF'] == 'N']
+    return Response(content=body, media_type="application/json")
 
-    results['exact_match'] = results['symbol_lower'] == query_lower
-    results = results.sort_values(['exact_match', 'symbol'], ascending=[False, True])
+@router.get("/search_listed/stats", response_model=APIResponse)
+def search_listed_stats(_: bool = Depends(verify_token)):
+    stats = search_cache.stats()
+    stats["generation"] = get_generation()
+    stats["rows"] = len(get_search_index())
+    stats["sessions"] = len(typeahead_sessions)
+    return APIResponse(status=200, response=stats)
 
-    data = results[['symbol', 'name']].to_dict('records')
-    response.status_code = 200
-
-    return APIResponse(status=200, response=data)
+@router.get("/search_workspace", response_model=APIResponse)
+def search_workspace(
+    workspace_id: str,
+    query: str,
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of hits"),
+    form_type: Optional[str] = Query(None, description="Only hits from this form type, e.g. 10-K"),
+    db: Session = Depends(get_db),
+    _: bool = Depends(verify_token)
+):
+    """BM25-ranked full-text hits across a workspace's filings and parsed chunks"""
+    try:
+        hits = workspace_search.search(db, workspace_id, query, limit=limit, form_type=form_type)
+        return APIResponse(status=200, response=hits)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
@@ -1,19 +1,34 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
-from database import get_db
+from database import SessionLocal, get_db
 from models import WorkspaceCreate, WorkspaceUpdate, APIResponse
 from services import workspace_service
+from services.pagination import DEFAULT_LIMIT, MAX_LIMIT, iter_rows
+from responses import json_response, ndjson_response
 
 router = APIRouter(prefix="/data/workspace", tags=["workspace"])
 
 @router.get("", response_model=APIResponse)
-def get_workspaces(db: Session = Depends(get_db)):
-    """Get all workspaces"""
+def get_workspaces(
+    limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT, description="Page size"),
+    cursor: str = Query(None, description="next_cursor of the previous page"),
+    since: str = Query(None, description="Only rows newer than this cursor (e.g. a previous latest_cursor)"),
+    fields: str = Query(None, description="Comma-separated columns to return (default all)"),
+    output: str = Query("json", alias="format", pattern="^(json|ndjson)$",
+                        description="ndjson streams every row from cursor/since on, one per line, ignoring limit"),
+    db: Session = Depends(get_db)
+):
+    """Get workspaces newest first, a page at a time"""
     try:
-        workspaces = workspace_service.get_all_workspaces(db)
-        return APIResponse(
-            status=200,
-            response=[workspace.to_dict() for workspace in workspaces]
+        if output == "ndjson":
+            listing = workspace_service.workspace_listing(fields)
+            return ndjson_response(iter_rows(SessionLocal, listing, cursor, since))
+        page = workspace_service.list_workspaces(db, limit, cursor, since, fields)
+        return json_response(page.to_dict())
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
         )
     except Exception as e:
         raise HTTPException(
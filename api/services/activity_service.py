@@ -1,11 +1,30 @@
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from models import Activity, ActivityCreate, ActivityUpdate
 from typing import List, Optional
+from services.pagination import DEFAULT_LIMIT, Listing, Page, listing, paginate
 
 def get_all_activities(db: Session) -> List[Activity]:
     """Get all activities"""
     return db.query(Activity).order_by(Activity.created_at.desc()).all()
 
+def activity_listing(workspace_id: Optional[str] = None, fields: Optional[str] = None) -> Listing:
+    """Activities newest first, optionally for one workspace"""
+    filters = [Activity.workspace_id == workspace_id] if workspace_id else []
+    return listing(Activity, Activity.created_at, fields, filters, descending=True)
+
+def list_activities(
+    db: Session,
+    workspace_id: Optional[str] = None,
+    limit: int = DEFAULT_LIMIT,
+    cursor: Optional[str] = None,
+    since: Optional[str] = None,
+    fields: Optional[str] = None,
+) -> Page:
+    """A page of activities, newest first, optionally for one workspace"""
+    return paginate(db, activity_listing(workspace_id, fields), limit, cursor, since)
+
 def get_activity_by_id(db: Session, activity_id: str) -> Optional[Activity]:
     """Get activity by ID"""
     return db.query(Activity).filter(Activity.id == activity_id).first()
@@ -28,6 +47,22 @@ def create_activity(db: Session, activity_data: ActivityCreate) -> Activity:
     db.refresh(activity)
     return activity
 
+async def create_activity_async(db: AsyncSession, activity_data: ActivityCreate) -> Activity:
+    """Create a new activity (async)"""
+    activity = Activity(**activity_data.model_dump())
+    db.add(activity)
+    await db.commit()
+    return activity
+
+def create_activities(db: Session, activities_data: List[ActivityCreate], commit: bool = True) -> int:
+    """Create many activities with one executemany INSERT; returns the count"""
+    if not activities_data:
+        return 0
+    db.execute(insert(Activity), [data.model_dump() for data in activities_data])
+    if commit:
+        db.commit()
+    return len(activities_data)
+
 def update_activity(db: Session, activity_id: str, activity_data: ActivityUpdate) -> Optional[Activity]:
     """Update activity by ID"""
     activity = get_activity_by_id(db, activity_id)
@@ -1,11 +1,30 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from models import AgentMessage, AgentMessageCreate, AgentMessageUpdate
 from typing import List, Optional
+from services.pagination import DEFAULT_LIMIT, Listing, Page, listing, paginate
 
 def get_all_messages(db: Session) -> List[AgentMessage]:
     """Get all agent messages"""
     return db.query(AgentMessage).order_by(AgentMessage.timestamp.asc()).all()
 
+def message_listing(agent_id: Optional[str] = None, fields: Optional[str] = None) -> Listing:
+    """Messages in chat order, optionally for one agent"""
+    filters = [AgentMessage.agent_id == agent_id] if agent_id else []
+    return listing(AgentMessage, AgentMessage.timestamp, fields, filters)
+
+def list_messages(
+    db: Session,
+    agent_id: Optional[str] = None,
+    limit: int = DEFAULT_LIMIT,
+    cursor: Optional[str] = None,
+    since: Optional[str] = None,
+    fields: Optional[str] = None,
+) -> Page:
+    """A page of messages in chat order, optionally for one agent"""
+    return paginate(db, message_listing(agent_id, fields), limit, cursor, since)
+
 def get_message_by_id(db: Session, message_id: str) -> Optional[AgentMessage]:
     """Get message by ID"""
     return db.query(AgentMessage).filter(AgentMessage.id == message_id).first()
@@ -26,6 +45,24 @@ def create_message(db: Session, message_data: AgentMessageCreate) -> AgentMessag
     db.refresh(message)
     return message
 
+async def get_messages_by_agent_async(db: AsyncSession, agent_id: str) -> List[AgentMessage]:
+    """Get all messages for an agent (async)"""
+    result = await db.scalars(
+        select(AgentMessage).where(AgentMessage.agent_id == agent_id).order_by(AgentMessage.timestamp.asc())
+    )
+    return list(result)
+
+async def create_message_async(db: AsyncSession, message_data: AgentMessageCreate) -> AgentMessage:
+    """Create a new agent message (async)"""
+    message = AgentMessage(
+        agent_id=message_data.agent_id,
+        role=message_data.role,
+        message=message_data.message
+    )
+    db.add(message)
+    await db.commit()
+    return message
+
 def update_message(db: Session, message_id: str, message_data: AgentMessageUpdate) -> Optional[AgentMessage]:
     """Update message by ID"""
     message = get_message_by_id(db, message_id)
@@ -1,11 +1,38 @@
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from models import Agent, AgentCreate, AgentUpdate
 from typing import List, Optional
+from services.pagination import DEFAULT_LIMIT, Listing, Page, listing, paginate
 
 def get_all_agents(db: Session) -> List[Agent]:
     """Get all agents"""
     return db.query(Agent).order_by(Agent.created_at.desc()).all()
 
+def agent_listing(
+    workspace_id: Optional[str] = None,
+    active_only: bool = False,
+    fields: Optional[str] = None,
+) -> Listing:
+    """Agents newest first, optionally for one workspace"""
+    filters = []
+    if workspace_id:
+        filters.append(Agent.workspace_id == workspace_id)
+        if active_only:
+            filters.append(Agent.status == "active")
+    return listing(Agent, Agent.created_at, fields, filters, descending=True)
+
+def list_agents(
+    db: Session,
+    workspace_id: Optional[str] = None,
+    active_only: bool = False,
+    limit: int = DEFAULT_LIMIT,
+    cursor: Optional[str] = None,
+    since: Optional[str] = None,
+    fields: Optional[str] = None,
+) -> Page:
+    """A page of agents, newest first, optionally for one workspace"""
+    return paginate(db, agent_listing(workspace_id, active_only, fields), limit, cursor, since)
+
 def get_agent_by_id(db: Session, agent_id: str) -> Optional[Agent]:
     """Get agent by ID"""
     return db.query(Agent).filter(Agent.id == agent_id).first()
@@ -33,6 +60,21 @@ def create_agent(db: Session, agent_data: AgentCreate) -> Agent:
     db.refresh(agent)
     return agent
 
+async def get_agent_by_id_async(db: AsyncSession, agent_id: str) -> Optional[Agent]:
+    """Get agent by ID (async)"""
+    return await db.get(Agent, agent_id)
+
+async def create_agent_async(db: AsyncSession, agent_data: AgentCreate) -> Agent:
+    """Create a new agent (async)"""
+    agent = Agent(
+        workspace_id=agent_data.workspace_id,
+        name=agent_data.name,
+        status=agent_data.status if agent_data.status else "active"
+    )
+    db.add(agent)
+    await db.commit()
+    return agent
+
 def update_agent(db: Session, agent_id: str, agent_data: AgentUpdate) -> Optional[Agent]:
     """Update agent by ID"""
     agent = get_agent_by_id(db, agent_id)
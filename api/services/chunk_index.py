@@ -0,0 +1,161 @@
+"""Per-chunk index over a LandingAI parse output.
+
+Next to a parse cache entry ``{sha}.json`` two files are written:
+
+``{sha}.json.chunks``      every chunk's JSON, in document order, separated
+                           by ``,\\n`` so any contiguous run of chunks read
+                           from disk is a valid JSON array body
+``{sha}.json.chunks.idx``  id, page, type, bbox, byte offset and length of
+                           each chunk
+
+Single chunks and ranges are then served with one seek and one read,
+without loading the parse output.
+"""
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import List, Optional
+
+INDEX_VERSION = 1
+SEPARATOR = b",\n"
+
+_loaded: "OrderedDict[tuple, dict]" = OrderedDict()
+_loaded_lock = threading.Lock()
+_LOADED_LIMIT = 64
+
+
+def data_path(entry_path: str) -> str:
+    return f"{entry_path}.chunks"
+
+
+def index_path(entry_path: str) -> str:
+    return f"{entry_path}.chunks.idx"
+
+
+def _bbox(grounding: dict) -> Optional[List[float]]:
+    box = grounding.get("box") or {}
+    if not box:
+        return None
+    return [box.get("left"), box.get("top"), box.get("right"), box.get("bottom")]
+
+
+def _write_atomic(path: str, data: bytes):
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def build(entry_path: str, parsed: Optional[dict] = None) -> dict:
+    """Write the chunk data and index files for a parse output"""
+    if parsed is None:
+        with open(entry_path, "rb") as f:
+            parsed = json.load(f)
+
+    parts = []
+    chunks = []
+    offset = 0
+    for position, chunk in enumerate(parsed.get("chunks") or []):
+        encoded = json.dumps(chunk, ensure_ascii=False).encode("utf-8")
+        if parts:
+            parts.append(SEPARATOR)
+            offset += len(SEPARATOR)
+        parts.append(encoded)
+        grounding = chunk.get("grounding") or {}
+        chunks.append({
+            "id": chunk.get("id"),
+            "index": position,
+            "page": grounding.get("page"),
+            "type": chunk.get("type"),
+            "bbox": _bbox(grounding),
+            "offset": offset,
+            "length": len(encoded),
+        })
+        offset += len(encoded)
+
+    pages = sorted({c["page"] for c in chunks if c["page"] is not None})
+    index = {
+        "version": INDEX_VERSION,
+        "count": len(chunks),
+        "pages": pages,
+        "chunks": chunks,
+    }
+    _write_atomic(data_path(entry_path), b"".join(parts))
+    _write_atomic(index_path(entry_path), json.dumps(index).encode("utf-8"))
+    return index
+
+
+def load(entry_path: str) -> dict:
+    """Index of a parse output, building it on first use; recent ones stay in memory"""
+    path = index_path(entry_path)
+    try:
+        key = (path, os.stat(path).st_mtime_ns)
+    except OSError:
+        key = None
+
+    if key is not None:
+        with _loaded_lock:
+            index = _loaded.get(key)
+            if index is not None:
+                _loaded.move_to_end(key)
+                return index
+        with open(path, "rb") as f:
+            index = json.load(f)
+        if index.get("version") != INDEX_VERSION or not os.path.exists(data_path(entry_path)):
+            index, key = build(entry_path), (path, os.stat(path).st_mtime_ns)
+    else:
+        index = build(entry_path)
+        key = (path, os.stat(path).st_mtime_ns)
+
+    index["positions"] = {c["id"]: c["index"] for c in index["chunks"]}
+    with _loaded_lock:
+        _loaded[key] = index
+        while len(_loaded) > _LOADED_LIMIT:
+            _loaded.popitem(last=False)
+    return index
+
+
+def metadata(index: dict, page: Optional[int] = None, offset: int = 0, limit: int = 100) -> dict:
+    """A slice of chunk metadata, optionally restricted to one page"""
+    chunks = index["chunks"]
+    if page is not None:
+        chunks = [c for c in chunks if c["page"] == page]
+    return {
+        "total": len(chunks),
+        "pages": index["pages"],
+        "offset": offset,
+        "chunks": [
+            {key: c[key] for key in ("id", "index", "page", "type", "bbox")}
+            for c in chunks[offset:offset + limit]
+        ],
+    }
+
+
+def page_range(index: dict, page: int) -> Optional[tuple]:
+    """[start, end) chunk positions on a page (chunks are in page order)"""
+    positions = [c["index"] for c in index["chunks"] if c["page"] == page]
+    return (positions[0], positions[-1] + 1) if positions else None
+
+
+def read_range(entry_path: str, index: dict, start: int, end: int) -> bytes:
+    """JSON array of chunks [start, end), read with a single seek"""
+    chunks = index["chunks"][max(0, start):max(0, end)]
+    if not chunks:
+        return b"[]"
+    first, last = chunks[0], chunks[-1]
+    with open(data_path(entry_path), "rb") as f:
+        f.seek(first["offset"])
+        body = f.read(last["offset"] + last["length"] - first["offset"])
+    return b"[" + body + b"]"
+
+
+def read_chunk(entry_path: str, index: dict, chunk_id: str) -> Optional[bytes]:
+    """One chunk's JSON, or None if the id is unknown"""
+    position = index["positions"].get(chunk_id)
+    if position is None:
+        return None
+    chunk = index["chunks"][position]
+    with open(data_path(entry_path), "rb") as f:
+        f.seek(chunk["offset"])
+        return f.read(chunk["length"])
@@ -1,13 +1,71 @@
-import pandas as pd
-from config import DATA_PATH
+import os
+import threading
+from config import DATA_PATH, UNIVERSE_PATH, UNIVERSE_RELOAD_INTERVAL
+from services.search_cache import search_cache
+from services.search_index import SearchIndex
+from services.universe_snapshot import open_universe
 
-_df = None
+_universe = None
+_index = None
+_generation = 0
+_csv_stat = None
+_reload_lock = threading.Lock()
+_watcher_stop = threading.Event()
+_watcher = None
+
+def _stat_key(path):
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
 
 def load_data():
-    global _df
-    _df = pd.read_csv(DATA_PATH)
-    _df['symbol_lower'] = _df['symbol'].str.lower()
-    _df['name_lower'] = _df['name'].str.lower()
+    """Map the universe snapshot and swap in a freshly built search index"""
+    global _universe, _index, _generation, _csv_stat
+    with _reload_lock:
+        csv_stat = _stat_key(DATA_PATH)
+        universe = open_universe(DATA_PATH, UNIVERSE_PATH)
+        index = SearchIndex(universe)
+        # Readers take (index, generation) without locking; swap both together
+        _universe, _index, _generation, _csv_stat = universe, index, _generation + 1, csv_stat
+    search_cache.clear()
+
+def reload_if_changed() -> bool:
+    """Reload when listed.csv changed on disk since the last load"""
+    try:
+        changed = _stat_key(DATA_PATH) != _csv_stat
+    except OSError:
+        return False
+    if changed:
+        load_data()
+    return changed
+
+def _watch(interval: float):
+    while not _watcher_stop.wait(interval):
+        try:
+            reload_if_changed()
+        except Exception as e:
+            print(f"Error reloading {DATA_PATH}: {str(e)}")
+
+def start_watcher(interval: float = UNIVERSE_RELOAD_INTERVAL):
+    """Poll listed.csv in a background thread and hot-reload it on change"""
+    global _watcher
+    if _watcher is not None or interval <= 0:
+        return
+    _watcher_stop.clear()
+    _watcher = threading.Thread(target=_watch, args=(interval,), name="universe-watcher", daemon=True)
+    _watcher.start()
+
+def stop_watcher():
+    global _watcher
+    _watcher_stop.set()
+    if _watcher is not None:
+        _watcher.join()
+        _watcher = None
+
+def get_universe():
+    return _universe
+
+def get_search_index():
+    return _index
 
-def get_dataframe():
-    return _df
+def get_generation():
+    return _generation
@@ -1,18 +1,53 @@
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from models import Document, DocumentCreate, DocumentUpdate
 from typing import List, Optional
+from services.pagination import DEFAULT_LIMIT, Listing, Page, listing, paginate
 
 def get_all_documents(db: Session) -> List[Document]:
     """Get all documents"""
     return db.query(Document).all()
 
+def document_listing(fields: Optional[str] = None) -> Listing:
+    """Documents newest first"""
+    return listing(Document, Document.created_at, fields, descending=True)
+
+def list_documents(
+    db: Session,
+    limit: int = DEFAULT_LIMIT,
+    cursor: Optional[str] = None,
+    since: Optional[str] = None,
+    fields: Optional[str] = None,
+) -> Page:
+    """A page of documents, newest first"""
+    return paginate(db, document_listing(fields), limit, cursor, since)
+
 def get_document_by_id(db: Session, document_id: str) -> Optional[Document]:
     """Get document by ID"""
     return db.query(Document).filter(Document.id == document_id).first()
 
-def get_documents_by_workspace(db: Session, workspace_id: str) -> List[Document]:
-    """Get all documents for a workspace"""
-    return db.query(Document).filter(Document.workspace_id == workspace_id).all()
+def get_documents_by_workspace(
+    db: Session,
+    workspace_id: str,
+    form_type: Optional[str] = None,
+    cik: Optional[str] = None,
+    sic_code: Optional[str] = None,
+    filed_from: Optional[str] = None,
+    filed_to: Optional[str] = None,
+) -> List[Document]:
+    """Get documents for a workspace, optionally filtered by header fields (dates as YYYY/MM/DD)"""
+    query = db.query(Document).filter(Document.workspace_id == workspace_id)
+    if form_type is not None:
+        query = query.filter(Document.form_type == form_type)
+    if cik is not None:
+        query = query.filter(Document.cik == cik.zfill(10))
+    if sic_code is not None:
+        query = query.filter(Document.sic_code == sic_code)
+    if filed_from is not None:
+        query = query.filter(Document.filing_date >= filed_from)
+    if filed_to is not None:
+        query = query.filter(Document.filing_date <= filed_to)
+    return query.all()
 
 def create_document(db: Session, document_data: DocumentCreate) -> Document:
     """Create a new document"""
@@ -22,13 +57,36 @@ def create_document(db: Session, document_data: DocumentCreate) -> Document:
         file_path=document_data.file_path,
         filing_date=document_data.filing_date,
         reporting_date=document_data.reporting_date,
-        doc_id=document_data.doc_id
+        doc_id=document_data.doc_id,
+        accession_number=document_data.accession_number,
+        cik=document_data.cik,
+        company_name=document_data.company_name,
+        form_type=document_data.form_type,
+        sic_code=document_data.sic_code,
+        fiscal_year_end=document_data.fiscal_year_end
     )
     db.add(document)
     db.commit()
     db.refresh(document)
     return document
 
+def create_documents(db: Session, documents_data: List[DocumentCreate], commit: bool = True) -> List[Document]:
+    """Create many documents with one executemany INSERT ... RETURNING.
+
+    Pass commit=False to add more rows (e.g. their activities) to the same
+    transaction. Read what you need from the returned documents before
+    committing; a commit expires them and each would be reloaded.
+    """
+    if not documents_data:
+        return []
+    documents = db.scalars(
+        insert(Document).returning(Document, sort_by_parameter_order=True),
+        [data.model_dump() for data in documents_data],
+    ).all()
+    if commit:
+        db.commit()
+    return list(documents)
+
 def update_document(db: Session, document_id: str, document_data: DocumentUpdate) -> Optional[Document]:
     """Update document by ID"""
     document = get_document_by_id(db, document_id)
@@ -55,10 +113,38 @@ def update_document(db: Session, document_id: str, document_data: DocumentUpdate
 
 def delete_document(db: Session, document_id: str) -> bool:
     """Delete document by ID (cascade deletes parsed_documents)"""
+    from services import workspace_search
+
     document = get_document_by_id(db, document_id)
     if not document:
         return False
 
+    workspace_search.remove_document(db, document_id, commit=False)
     db.delete(document)
     db.commit()
     return True
+
+def backfill_header_fields(db: Session) -> int:
+    """Parse SEC headers for documents registered before they were stored"""
+    import os
+    from services.sec_header import parse_header
+
+    count = 0
+    documents = db.query(Document).filter(
+        Document.accession_number.is_(None), Document.file_path.like("%.txt")
+    ).all()
+    for document in documents:
+        if not os.path.exists(document.file_path):
+            continue
+        header = parse_header(document.file_path)
+        if not header.get("accession_number"):
+            continue
+        document.accession_number = header["accession_number"]
+        document.cik = header.get("cik")
+        document.company_name = header.get("company_name")
+        document.form_type = header.get("form_type")
+        document.sic_code = header.get("sic_code")
+        document.fiscal_year_end = header.get("fiscal_year_end")
+        count += 1
+    db.commit()
+    return count
@@ -0,0 +1,82 @@
+"""Canonical, deduplicated storage for filings and uploads.
+
+SEC filings are stored once per accession number under
+``{FILING_STORE_DIR}/filings/{accession}/full-submission.txt`` and uploaded
+files once per content hash under ``{FILING_STORE_DIR}/uploads``. Workspace
+folders hold hardlinks to these files (copies when the filesystem cannot
+link), so disk use scales with unique files rather than with workspaces.
+"""
+import os
+import re
+import shutil
+import threading
+
+from config import FILING_STORE_DIR
+from services.parse_cache import file_digest
+
+_ACCESSION_RE = re.compile(r"^[A-Za-z0-9-]+$")
+
+
+def filing_path(accession: str) -> str:
+    """Canonical path of a filing's full-submission.txt"""
+    if not _ACCESSION_RE.match(accession):
+        raise ValueError(f"Invalid accession number: {accession}")
+    return os.path.join(FILING_STORE_DIR, "filings", accession, "full-submission.txt")
+
+
+def has_filing(accession: str) -> bool:
+    return os.path.exists(filing_path(accession))
+
+
+def _place(source_path: str, dest_path: str, move: bool):
+    """Atomically put source at dest_path unless another writer got there first"""
+    os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+    if os.path.exists(dest_path):
+        return
+    tmp_path = f"{dest_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    if move:
+        shutil.move(source_path, tmp_path)
+    else:
+        shutil.copy2(source_path, tmp_path)
+    os.replace(tmp_path, dest_path)
+
+
+def store_filing(accession: str, source_path: str, move: bool = True) -> str:
+    """Add a downloaded filing to the store (no-op if already present)"""
+    path = filing_path(accession)
+    _place(source_path, path, move)
+    return path
+
+
+def store_filing_bytes(accession: str, content: bytes) -> str:
+    """Add a filing fetched into memory to the store"""
+    path = filing_path(accession)
+    if os.path.exists(path):
+        return path
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+    return path
+
+
+def store_upload(source_path: str, move: bool = False) -> str:
+    """Add an uploaded file to the store keyed by content hash"""
+    digest = file_digest(source_path)
+    ext = os.path.splitext(source_path)[1].lower()
+    path = os.path.join(FILING_STORE_DIR, "uploads", digest[:2], f"{digest}{ext}")
+    _place(source_path, path, move)
+    return path
+
+
+def link_into(store_path: str, dest_path: str) -> str:
+    """Hardlink a stored file into a workspace, copying if linking fails"""
+    os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+    if os.path.exists(dest_path):
+        os.remove(dest_path)
+    try:
+        os.link(store_path, dest_path)
+    except OSError:
+        shutil.copy2(store_path, dest_path)
+    return dest_path
@@ -1,67 +1,174 @@
 import os
 import pandas as pd
-import re
-import shutil
-from sec_edgar_downloader import Downloader
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Set, Tuple
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from models import FilingSync
+from services import filing_store, sec_client, sec_sections
+from services.sec_header import parse_header
 
-def extract_dates(file_path):
-    filing_date = None
-    reporting_date = None
-
-    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-        content = f.read(5000)
-
-        filing_match = re.search(r'FILED AS OF DATE:\s*(\d{8})', content)
-        if filing_match:
-            filing_date = filing_match.group(1)
+# Earliest filings pulled on a ticker's first sync
+SYNC_START_DATE = "2015-01-01"
 
-        reporting_match = re.search(r'CONFORMED PERIOD OF REPORT:\s*(\d{8})', content)
-        if reporting_match:
-            reporting_date = reporting_match.group(1)
+# Forms of one ticker are synced in parallel; the SEC rate limit is shared
+_form_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="sync")
 
-    return filing_date, reporting_date
-
-def download_filings(ticker: str, interval: str = "quarterly"):
+def extract_dates(file_path):
+    """(filing_date, reporting_date) as YYYYMMDD from a filing's header"""
+    header = parse_header(file_path)
+    return header.get("filing_date"), header.get("reporting_date")
+
+def get_sync_state(db: Session, ticker: str, form_type: str) -> FilingSync:
+    """Get (or start) the sync state for a ticker and form"""
+    state = db.query(FilingSync).filter(
+        FilingSync.ticker == ticker, FilingSync.form_type == form_type
+    ).first()
+    if not state:
+        state = FilingSync(ticker=ticker, form_type=form_type, filings={})
+        db.add(state)
+        try:
+            db.commit()
+        except IntegrityError:
+            # A concurrent first sync of the same ticker created it first
+            db.rollback()
+            return db.query(FilingSync).filter(
+                FilingSync.ticker == ticker, FilingSync.form_type == form_type
+            ).one()
+        db.refresh(state)
+    return state
+
+def _store_and_index(accession: str, content: bytes) -> str:
+    """Save a fetched filing and index its <DOCUMENT> sections"""
+    path = filing_store.store_filing_bytes(accession, content)
+    sec_sections.write_index(path, accession)
+    return path
+
+def fetch_filings(
+    ticker: str, form_type: str, after: str, skip: Set[str]
+) -> Tuple[Dict[str, str], Dict[str, Tuple[str, Exception]]]:
+    """Download filings filed on or after `after` into the filing store.
+
+    Accessions in skip are not listed and ones already in the store are
+    not downloaded again. Returns ({accession: canonical path} for every
+    new filing available, {accession: (filing_date, error)} for the ones
+    that could not be downloaded).
+    """
+    cik = sec_client.get_cik(ticker)
+    listed = {f["accession"]: f["filing_date"] for f in sec_client.list_filings(cik, form_type, after, skip)}
+    missing = [accession for accession in listed if not filing_store.has_filing(accession)]
+
+    errors = sec_client.fetch_many(cik, missing, _store_and_index)
+    failed = {accession: (listed[accession], error) for accession, error in errors.items()}
+
+    fetched = {
+        accession: filing_store.filing_path(accession)
+        for accession in listed
+        if accession not in errors
+    }
+    return fetched, failed
+
+def sync_many(db: Session, ticker: str, form_types: List[str]):
+    """Bring several forms of a ticker up to date, downloading them concurrently.
+
+    Only filings on or after the newest one seen so far are requested, so a
+    refresh costs one small pull instead of a decade of filings. Returns
+    ({form: filings}, {form: error}, {form: {accession: error}}); each filing
+    has accession, file_path, filing_date and reporting_date (YYYYMMDD) and
+    the other parsed header fields, oldest first. The last holds filings
+    that failed to download: the newest-seen date is kept at or before the
+    oldest of them, so the next sync lists and retries them.
+    """
+    ticker = ticker.upper()
+    states = {form_type: get_sync_state(db, ticker, form_type) for form_type in form_types}
+
+    # Network work runs off this thread; the session stays on it
+    futures = {
+        form_type: _form_pool.submit(
+            fetch_filings,
+            ticker,
+            form_type,
+            state.latest_filing_date or SYNC_START_DATE,
+            set(state.filings or {}),
+        )
+        for form_type, state in states.items()
+    }
+
+    results, errors, failures = {}, {}, {}
+    for form_type, future in futures.items():
+        state = states[form_type]
+        try:
+            fetched, failed = future.result()
+        except Exception as e:
+            errors[form_type] = e
+            continue
+        if failed:
+            failures[form_type] = {accession: error for accession, (_, error) in failed.items()}
+
+        # Header fields are kept with the sync state so registering a
+        # filing never has to reopen it
+        new_filings = {}
+        for accession, path in fetched.items():
+            header = parse_header(path)
+            new_filings[accession] = {
+                **header,
+                "filing_date": header.get("filing_date", ""),
+                "reporting_date": header.get("reporting_date", ""),
+            }
+
+        if new_filings:
+            # Merge with whatever a concurrent sync recorded meanwhile
+            db.refresh(state)
+            filings = dict(state.filings or {})
+            filings.update(new_filings)
+            state.filings = filings
+            dates = [f["filing_date"] for f in filings.values() if f["filing_date"]]
+            if dates:
+                latest = max(dates)
+                latest = f"{latest[:4]}-{latest[4:6]}-{latest[6:]}"
+                if failed:
+                    # Listing from the oldest failure again picks it up;
+                    # the ones fetched meanwhile are skipped as known
+                    latest = min(latest, min(date for date, _ in failed.values()))
+                state.latest_filing_date = latest
+        db.commit()
+
+        results[form_type] = sorted(
+            (
+                {"accession": accession, "file_path": filing_store.filing_path(accession), **meta}
+                for accession, meta in (state.filings or {}).items()
+                if filing_store.has_filing(accession)
+            ),
+            key=lambda f: (f["filing_date"], f["accession"]),
+        )
+
+    return results, errors, failures
+
+def sync_filings(db: Session, ticker: str, form_type: str) -> List[dict]:
+    """Bring one ticker/form up to date and return every known filing"""
+    results, errors, failures = sync_many(db, ticker, [form_type])
+    if form_type in errors:
+        raise errors[form_type]
+    for accession, error in failures.get(form_type, {}).items():
+        print(f"Error downloading filing {accession}: {str(error)}")
+    return results[form_type]
+
+def download_filings(db: Session, ticker: str, interval: str = "quarterly"):
     ticker = ticker.upper()
     base_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", ticker)
     os.makedirs(base_path, exist_ok=True)
 
-    dl = Downloader("CompanyName", "email@example.com", base_path)
-
-    filings_data = []
-
-    if interval == "yearly":
-        dl.get("10-K", ticker, after="2015-01-01")
-        form_type = "10-K"
-    else:
-        dl.get("10-Q", ticker, after="2015-01-01")
-        form_type = "10-Q"
-
-    temp_form_folder = os.path.join(base_path, "sec-edgar-filings", ticker, form_type)
-    final_form_folder = os.path.join(base_path, form_type)
-
-    if os.path.exists(temp_form_folder):
-        if os.path.exists(final_form_folder):
-            shutil.rmtree(final_form_folder)
-        shutil.move(temp_form_folder, final_form_folder)
-
-        for filing_dir in os.listdir(final_form_folder):
-            filing_path = os.path.join(final_form_folder, filing_dir)
-            if os.path.isdir(filing_path):
-                full_submission = os.path.join(filing_path, "full-submission.txt")
-                if os.path.exists(full_submission):
-                    filing_date, reporting_date = extract_dates(full_submission)
-
-                    filings_data.append({
-                        "form_type": form_type,
-                        "form_file": full_submission,
-                        "filing_date": filing_date or "",
-                        "reporting_date": reporting_date or ""
-                    })
-
-    sec_edgar_path = os.path.join(base_path, "sec-edgar-filings")
-    if os.path.exists(sec_edgar_path):
-        shutil.rmtree(sec_edgar_path)
+    form_type = "10-K" if interval == "yearly" else "10-Q"
+
+    filings_data = [
+        {
+            "form_type": form_type,
+            "form_file": filing["file_path"],
+            "filing_date": filing["filing_date"],
+            "reporting_date": filing["reporting_date"]
+        }
+        for filing in sync_filings(db, ticker, form_type)
+    ]
 
     df = pd.DataFrame(filings_data)
     csv_path = os.path.join(base_path, "data.csv")
@@ -0,0 +1,134 @@
+import heapq
+import time
+from typing import Dict, List, Sequence, Tuple
+
+from services.search_index import tokenize
+
+# Secondary listings rank below the primary equity of the same company
+_DERIVATIVE_WORDS = frozenset([
+    "warrant", "warrants", "right", "rights", "unit", "units",
+    "note", "notes", "debenture", "debentures", "depositary",
+])
+_PREFERRED_WORDS = frozenset(["preferred", "preference", "class b", "class c"])
+
+
+def listing_rank(name_lower: str) -> int:
+    """Popularity proxy from the security description: 0 primary, 1 secondary class, 2 derivative"""
+    suffix = name_lower.rsplit(" - ", 1)[-1] if " - " in name_lower else ""
+    words = set(tokenize(suffix))
+    if words & _DERIVATIVE_WORDS:
+        return 2
+    if any(word in suffix for word in _PREFERRED_WORDS):
+        return 1
+    return 0
+
+
+def edit_distance(a: str, b: str, max_distance: int) -> int:
+    """Optimal string alignment distance, or max_distance + 1 once it is exceeded"""
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    prev2 = None
+    prev = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        cur = [i] + [0] * len(b)
+        row_min = i
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if prev2 is not None and i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                cur[j] = min(cur[j], prev2[j - 2] + 1)
+            row_min = min(row_min, cur[j])
+        if row_min > max_distance:
+            return max_distance + 1
+        prev2, prev = prev, cur
+    return prev[-1]
+
+
+def _deletes(word: str, max_distance: int) -> set:
+    """All strings reachable from word by removing up to max_distance characters"""
+    result = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        frontier = {w[:i] + w[i + 1:] for w in frontier for i in range(len(w))}
+        result |= frontier
+    return result
+
+
+class FuzzyIndex:
+    """Symmetric-delete dictionary over company name tokens and symbols.
+
+    Lookups only touch the delete variants of the query (bounded by
+    prefix_length and max_distance), never the whole vocabulary, and stop
+    at a hard time budget.
+    """
+
+    def __init__(self, symbols_lower: Sequence[str], names_lower: Sequence[str],
+                 max_distance: int = 2, prefix_length: int = 7, min_length: int = 3):
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self.min_length = min_length
+        self.ranks = [listing_rank(name) for name in names_lower]
+
+        token_rows: Dict[str, List[int]] = {}
+        for row, (symbol, name) in enumerate(zip(symbols_lower, names_lower)):
+            for token in set(tokenize(name)) | {symbol}:
+                if len(token) >= min_length:
+                    token_rows.setdefault(token, []).append(row)
+        self.tokens = list(token_rows)
+        self.token_rows = [token_rows[token] for token in self.tokens]
+
+        self.deletes: Dict[str, List[int]] = {}
+        for token_id, token in enumerate(self.tokens):
+            for variant in _deletes(token[:prefix_length], self._max_distance_for(token)):
+                self.deletes.setdefault(variant, []).append(token_id)
+
+    def _max_distance_for(self, word: str) -> int:
+        # Short words tolerate fewer edits, otherwise everything matches
+        return min(self.max_distance, 1 if len(word) <= 5 else 2)
+
+    def _lookup(self, word: str, deadline: float) -> Dict[int, int]:
+        """Map token ids within edit distance of word to that distance"""
+        max_distance = self._max_distance_for(word)
+        found: Dict[int, int] = {}
+        for variant in _deletes(word[:self.prefix_length], max_distance):
+            for token_id in self.deletes.get(variant, ()):
+                if token_id in found:
+                    continue
+                distance = edit_distance(word, self.tokens[token_id], max_distance)
+                if distance <= max_distance:
+                    found[token_id] = distance
+            if time.perf_counter() > deadline:
+                break
+        return found
+
+    def search(self, query: str, visible, limit: int, budget_ms: float) -> List[Tuple[int, int]]:
+        """Return (row, distance) pairs ranked by distance, listing rank, then symbol.
+
+        Every query word must match some token of a row. visible(row) filters
+        rows out (e.g. ETFs). Work stops once budget_ms has elapsed.
+        """
+        deadline = time.perf_counter() + budget_ms / 1000.0
+        words = [w for w in tokenize(query) if len(w) >= self.min_length]
+        if not words or limit <= 0:
+            return []
+
+        scores = None
+        for word in words:
+            best: Dict[int, int] = {}
+            for token_id, distance in self._lookup(word, deadline).items():
+                for row in self.token_rows[token_id]:
+                    if distance < best.get(row, self.max_distance + 1):
+                        best[row] = distance
+            if scores is None:
+                scores = best
+            else:
+                scores = {row: scores[row] + d for row, d in best.items() if row in scores}
+            if not scores or time.perf_counter() > deadline:
+                break
+
+        ranked = heapq.nsmallest(
+            limit,
+            (row for row in scores if visible(row)),
+            key=lambda row: (scores[row], self.ranks[row], row),
+        )
+        return [(row, scores[row]) for row in ranked]
@@ -0,0 +1,11 @@
+from concurrent.futures import ThreadPoolExecutor
+from config import JOB_WORKERS
+
+_executor = ThreadPoolExecutor(max_workers=JOB_WORKERS, thread_name_prefix="job")
+
+def submit(fn, *args, **kwargs):
+    """Run fn on the background job pool"""
+    return _executor.submit(fn, *args, **kwargs)
+
+def shutdown(wait: bool = False):
+    _executor.shutdown(wait=wait, cancel_futures=not wait)
@@ -0,0 +1,109 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from models import Job, JobStage, JobStatus
+from typing import List, Optional
+
+# Keep the stored error list short; counts carry the totals
+MAX_STAGE_ERRORS = 50
+
+def _empty_stage():
+    return {"status": "pending", "total": 0, "done": 0, "failed": 0, "errors": []}
+
+def get_job_by_id(db: Session, job_id: str) -> Optional[Job]:
+    """Get job by ID"""
+    return db.query(Job).filter(Job.id == job_id).first()
+
+def get_jobs_by_workspace(db: Session, workspace_id: str) -> List[Job]:
+    """Get all jobs for a workspace"""
+    return db.query(Job).filter(Job.workspace_id == workspace_id).order_by(Job.created_at.desc()).all()
+
+def create_job(db: Session, workspace_id: str, kind: str, stages: List[JobStage]) -> Job:
+    """Create a queued job with an empty progress entry per stage"""
+    job = Job(
+        workspace_id=workspace_id,
+        kind=kind,
+        status=JobStatus.QUEUED.value,
+        progress={stage.value: _empty_stage() for stage in stages}
+    )
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+    return job
+
+async def create_job_async(db: AsyncSession, workspace_id: str, kind: str, stages: List[JobStage]) -> Job:
+    """Create a queued job with an empty progress entry per stage (async)"""
+    job = Job(
+        workspace_id=workspace_id,
+        kind=kind,
+        status=JobStatus.QUEUED.value,
+        progress={stage.value: _empty_stage() for stage in stages}
+    )
+    db.add(job)
+    await db.commit()
+    return job
+
+def _update_stage(db: Session, job: Job, stage: JobStage, **changes) -> Job:
+    # JSON columns only track reassignment, so rebuild the dict
+    progress = {name: dict(entry) for name, entry in (job.progress or {}).items()}
+    entry = progress.setdefault(stage.value, _empty_stage())
+    for key, value in changes.items():
+        entry[key] = value
+    job.progress = progress
+    db.commit()
+    return job
+
+def set_job_status(db: Session, job: Job, status: JobStatus, error: Optional[str] = None) -> Job:
+    """Set the overall job status"""
+    job.status = status.value
+    if status in (JobStatus.COMPLETED, JobStatus.FAILED):
+        job.stage = None
+    if error is not None:
+        job.error = error
+    db.commit()
+    return job
+
+def start_stage(db: Session, job: Job, stage: JobStage, total: int = 0) -> Job:
+    """Mark a stage as running with the given number of items"""
+    job.stage = stage.value
+    return _update_stage(db, job, stage, status="running", total=total)
+
+def add_stage_total(db: Session, job: Job, stage: JobStage, count: int) -> Job:
+    """Grow a running stage's item count"""
+    total = (job.progress or {}).get(stage.value, {}).get("total", 0)
+    return _update_stage(db, job, stage, total=total + count)
+
+def advance_stage(db: Session, job: Job, stage: JobStage, done: int = 0, failed: int = 0, error: Optional[str] = None) -> Job:
+    """Record finished and failed items for a stage"""
+    entry = (job.progress or {}).get(stage.value, _empty_stage())
+    errors = list(entry.get("errors", []))
+    if error and len(errors) < MAX_STAGE_ERRORS:
+        errors.append(error)
+    return _update_stage(
+        db, job, stage,
+        done=entry.get("done", 0) + done,
+        failed=entry.get("failed", 0) + failed,
+        errors=errors
+    )
+
+def fail_interrupted_jobs(db: Session, error: str = "interrupted by server restart") -> int:
+    """Fail queued/running jobs left over from a previous process (their threads are gone)"""
+    jobs = db.query(Job).filter(
+        Job.status.in_([JobStatus.QUEUED.value, JobStatus.RUNNING.value])
+    ).all()
+    for job in jobs:
+        progress = {name: dict(entry) for name, entry in (job.progress or {}).items()}
+        for entry in progress.values():
+            if entry.get("status") == "running":
+                entry["status"] = "failed"
+        if job.stage and job.stage in progress:
+            progress[job.stage]["status"] = "failed"
+        job.progress = progress
+        job.status = JobStatus.FAILED.value
+        job.stage = None
+        job.error = error
+    db.commit()
+    return len(jobs)
+
+def finish_stage(db: Session, job: Job, stage: JobStage, status: str = "done") -> Job:
+    """Mark a stage as done, skipped or failed"""
+    return _update_stage(db, job, stage, status=status)
@@ -0,0 +1,187 @@
+"""Keyset (cursor) pagination for list endpoints.
+
+Rows are ordered by a time column with the primary key as tie-breaker, and
+a cursor is the (time, id) of a row, so every page is one index range scan
+of `limit` rows however deep it is. Two ways to read:
+
+``cursor``  continue the listing in its own order after that row
+``since``   rows newer than that row, oldest first, for incremental polling
+
+Every page also returns ``latest_cursor``, the newest row in it (or the
+``since`` it was given when nothing is new), to pass as ``since`` next time.
+A ``next_cursor`` remembers the direction its page was read in, so following
+it from a ``since`` page keeps going forward in time.
+
+Lists are read with Core selects of just the requested columns, so rows
+come back as plain dicts ready to encode, without building ORM objects.
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Any, Callable, Iterator, List, NamedTuple, Optional, Sequence
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.orm import Session
+
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 1000
+# Rows per query when streaming a whole listing
+STREAM_BATCH = 1000
+
+
+class Page(NamedTuple):
+    items: List[Any]
+    next_cursor: Optional[str]
+    latest_cursor: Optional[str]
+
+    def to_dict(self, serialize: Callable[[Any], dict] = dict) -> dict:
+        return {
+            "items": [serialize(item) for item in self.items],
+            "next_cursor": self.next_cursor,
+            "latest_cursor": self.latest_cursor,
+        }
+
+
+class Listing(NamedTuple):
+    """What to read for a list endpoint: columns, filters and order"""
+    columns: list
+    filters: list
+    sort_column: Any
+    id_column: Any
+    descending: bool
+
+
+def encode_cursor(sort_value: datetime, row_id: str, forward: bool = False) -> str:
+    """Cursor after a row; forward marks one read oldest first"""
+    position = [sort_value.isoformat() if sort_value else None, row_id]
+    if forward:
+        position.append(1)
+    raw = json.dumps(position, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode(cursor: str) -> tuple:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        position = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if len(position) not in (2, 3):
+            raise ValueError("wrong length")
+        return datetime.fromisoformat(position[0]), str(position[1]), len(position) == 3
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor '{cursor}'") from e
+
+
+def decode_cursor(cursor: str) -> tuple:
+    """(datetime, id) of a cursor; ValueError if it is malformed"""
+    sort_value, row_id, _ = _decode(cursor)
+    return sort_value, row_id
+
+
+def select_columns(model, fields: Optional[str]) -> list:
+    """Model columns named in a comma-separated fields= list (all when empty)"""
+    columns = model.__table__.columns
+    if not fields:
+        return list(columns)
+    names = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in names if name not in columns]
+    if unknown:
+        raise ValueError(f"Unknown field(s) {', '.join(unknown)}; available: {', '.join(columns.keys())}")
+    return [columns[name] for name in dict.fromkeys(names)]
+
+
+def listing(
+    model,
+    sort_column,
+    fields: Optional[str] = None,
+    filters: Sequence = (),
+    descending: bool = False,
+) -> Listing:
+    table = model.__table__
+    return Listing(select_columns(model, fields), list(filters), table.c[sort_column.key], table.c.id, descending)
+
+
+def _direction(spec: Listing, cursor: Optional[str], since: Optional[str]) -> tuple:
+    if cursor and since:
+        raise ValueError("Pass either cursor or since, not both")
+    if since:
+        # Incremental reads always go forward in time
+        return since, False
+    if cursor and _decode(cursor)[2]:
+        # next_cursor of a page that was read forward
+        return cursor, False
+    return cursor, spec.descending
+
+
+def _statement(spec: Listing, cursor: Optional[str], descending: bool):
+    # The keys are always selected so a cursor can be built from any row
+    selected = {column.key for column in spec.columns}
+    keys = [c for c in (spec.sort_column, spec.id_column) if c.key not in selected]
+    statement = select(*spec.columns, *keys).where(*spec.filters)
+    if cursor:
+        key = tuple_(spec.sort_column, spec.id_column)
+        position = tuple_(*decode_cursor(cursor))
+        statement = statement.where(key < position if descending else key > position)
+    if descending:
+        return statement.order_by(spec.sort_column.desc(), spec.id_column.desc())
+    return statement.order_by(spec.sort_column.asc(), spec.id_column.asc())
+
+
+def _row_cursor(spec: Listing, row, forward: bool = False) -> str:
+    return encode_cursor(row._mapping[spec.sort_column.key], row._mapping[spec.id_column.key], forward)
+
+
+def _output(spec: Listing, rows) -> List[dict]:
+    # Selected columns come first, so zip leaves out the added key columns
+    names = [column.key for column in spec.columns]
+    return [dict(zip(names, row)) for row in rows]
+
+
+def paginate(
+    db: Session,
+    spec: Listing,
+    limit: int = DEFAULT_LIMIT,
+    cursor: Optional[str] = None,
+    since: Optional[str] = None,
+) -> Page:
+    """One page of a listing; items are dicts of the selected columns"""
+    position, descending = _direction(spec, cursor, since)
+    limit = max(1, min(limit, MAX_LIMIT))
+    rows = db.execute(_statement(spec, position, descending).limit(limit + 1)).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    next_cursor = _row_cursor(spec, rows[-1], forward=not descending) if has_more else None
+    if rows:
+        latest_cursor = _row_cursor(spec, rows[0] if descending else rows[-1])
+    else:
+        latest_cursor = since
+    return Page(_output(spec, rows), next_cursor, latest_cursor)
+
+
+def iter_rows(
+    session_factory: Callable[[], Session],
+    spec: Listing,
+    cursor: Optional[str] = None,
+    since: Optional[str] = None,
+    batch: int = STREAM_BATCH,
+) -> Iterator[Any]:
+    """Every row of a listing from a cursor on, read in keyset batches.
+
+    Each batch uses a fresh session, so no read transaction stays open for
+    the length of a large export. The cursor is checked before returning
+    (ValueError), so a bad one fails the request rather than the stream.
+    """
+    position, descending = _direction(spec, cursor, since)
+    if position:
+        decode_cursor(position)
+    return _batches(session_factory, spec, position, descending, batch)
+
+
+def _batches(session_factory, spec: Listing, position: Optional[str], descending: bool, batch: int):
+    while True:
+        with session_factory() as db:
+            rows = db.execute(_statement(spec, position, descending).limit(batch)).all()
+        yield from _output(spec, rows)
+        if len(rows) < batch:
+            return
+        position = _row_cursor(spec, rows[-1])
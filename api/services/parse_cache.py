@@ -0,0 +1,214 @@
+"""Content-addressed store of LandingAI parse outputs.
+
+Entries live at ``{PARSE_CACHE_DIR}/{model}/{sha256[:2]}/{sha256}.json`` and
+are shared by every workspace: ParsedDocument rows point straight at them.
+Each entry gets precompressed ``.gz`` and ``.br`` sidecars and a chunk
+index (see chunk_index) when it is written, so downloads and chunk lookups
+never re-serialize the JSON.
+An entry written by a different parser model is stale; it is served as-is
+while a background re-parse produces the entry for the current model, and
+rows pointing at the stale file are then moved to the new one.
+"""
+import glob
+import gzip
+import hashlib
+import json
+import os
+import re
+import threading
+from concurrent.futures import Future
+from typing import List, Optional
+
+from config import PARSE_CACHE_DIR
+from database import SessionLocal
+from models import ParsedDocument
+from services import chunk_index, workspace_search
+from services.parse_executor import parse_executor
+
+try:
+    import brotli
+except ImportError:  # gzip sidecars only
+    brotli = None
+
+# Sidecars are written once per parse, so spend CPU on ratio
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+
+_inflight = {}
+_inflight_lock = threading.Lock()
+_sidecars_pending = set()
+
+
+def file_digest(path: str) -> str:
+    """sha256 of a file's content"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _model_dir(model: str) -> str:
+    return re.sub(r"[^A-Za-z0-9._-]", "_", model)
+
+
+def cache_path(digest: str, model: Optional[str] = None) -> str:
+    """Entry path for digest; model defaults to the one the parse executor uses"""
+    model = model or parse_executor.model
+    return os.path.join(PARSE_CACHE_DIR, _model_dir(model), digest[:2], f"{digest}.json")
+
+
+def lookup(digest: str, model: Optional[str] = None) -> Optional[str]:
+    """Path of the entry for digest under model, if present"""
+    path = cache_path(digest, model)
+    return path if os.path.exists(path) else None
+
+
+def lookup_stale(digest: str, model: Optional[str] = None) -> Optional[str]:
+    """Path of an entry for digest written by any other model, if present"""
+    current = os.path.dirname(os.path.dirname(cache_path(digest, model)))
+    pattern = os.path.join(PARSE_CACHE_DIR, "*", digest[:2], f"{digest}.json")
+    for path in sorted(glob.glob(pattern), key=os.path.getmtime, reverse=True):
+        if os.path.dirname(os.path.dirname(path)) != current:
+            return path
+    return None
+
+
+def _write_atomic(path: str, data: bytes):
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def sidecar_encodings() -> List[str]:
+    """Content-Encodings a sidecar can exist for, best first"""
+    return ["br", "gzip"] if brotli is not None else ["gzip"]
+
+
+def sidecar_path(path: str, encoding: str) -> str:
+    return f"{path}.br" if encoding == "br" else f"{path}.gz"
+
+
+def write_sidecars(path: str, data: Optional[bytes] = None):
+    """Write the compressed copies of an entry"""
+    if data is None:
+        with open(path, "rb") as f:
+            data = f.read()
+    _write_atomic(sidecar_path(path, "gzip"), gzip.compress(data, GZIP_LEVEL, mtime=0))
+    if brotli is not None:
+        _write_atomic(sidecar_path(path, "br"), brotli.compress(data, quality=BROTLI_QUALITY))
+
+
+def ensure_sidecars(path: str):
+    """Write missing sidecars in the background (entries cached before they existed)"""
+    if all(os.path.exists(sidecar_path(path, e)) for e in sidecar_encodings()):
+        return
+    with _inflight_lock:
+        if path in _sidecars_pending:
+            return
+        _sidecars_pending.add(path)
+
+    def run():
+        try:
+            write_sidecars(path)
+        except Exception as e:
+            print(f"Error compressing parse output {path}: {str(e)}")
+        finally:
+            with _inflight_lock:
+                _sidecars_pending.discard(path)
+
+    threading.Thread(target=run, daemon=True).start()
+
+
+def store(digest: str, content: str, model: Optional[str] = None) -> str:
+    """Write an entry, its compressed sidecars and chunk index; return its path"""
+    path = cache_path(digest, model)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    data = content.encode("utf-8")
+    # Sidecars first, so an entry never exists without them
+    write_sidecars(path, data)
+    chunk_index.build(path, json.loads(content))
+    _write_atomic(path, data)
+    return path
+
+
+def repoint(old_path: str, new_path: str) -> int:
+    """Move ParsedDocument rows from one parse output to another.
+
+    The documents' search rows are rebuilt from the new output, since they
+    carry its chunk ids.
+    """
+    db = SessionLocal()
+    try:
+        document_ids = {
+            row.documents_id
+            for row in db.query(ParsedDocument.documents_id).filter(ParsedDocument.filepath == old_path)
+        }
+        count = db.query(ParsedDocument).filter(ParsedDocument.filepath == old_path).update(
+            {ParsedDocument.filepath: new_path}, synchronize_session=False
+        )
+        db.commit()
+        for document_id in document_ids:
+            workspace_search.index_parse(db, document_id)
+        return count
+    finally:
+        db.close()
+
+
+def _parse_into_cache(file_path: str, digest: str) -> Future:
+    """Queue a parse whose future resolves to the new cache entry path.
+
+    Concurrent requests for the same content share one API call.
+    """
+    with _inflight_lock:
+        existing = _inflight.get(digest)
+        if existing is not None:
+            return existing
+        result: Future = Future()
+        _inflight[digest] = result
+
+    def done(parse_future: Future):
+        try:
+            path = store(digest, parse_future.result().to_json())
+            result.set_result(path)
+        except Exception as e:
+            result.set_exception(e)
+        finally:
+            with _inflight_lock:
+                _inflight.pop(digest, None)
+
+    parse_executor.submit(file_path).add_done_callback(done)
+    return result
+
+
+def _refresh_stale(file_path: str, digest: str, stale_path: str):
+    def done(future: Future):
+        try:
+            repoint(stale_path, future.result())
+        except Exception as e:
+            print(f"Error refreshing stale parse {stale_path}: {str(e)}")
+
+    _parse_into_cache(file_path, digest).add_done_callback(done)
+
+
+def parse_cached(file_path: str) -> Future:
+    """Return a future resolving to the parse output path for file_path.
+
+    Fresh hits resolve immediately without calling LandingAI; stale hits
+    resolve immediately and re-parse in the background.
+    """
+    digest = file_digest(file_path)
+
+    hit = lookup(digest)
+    if hit is None:
+        stale = lookup_stale(digest)
+        if stale is not None:
+            _refresh_stale(file_path, digest, stale)
+            hit = stale
+    if hit is not None:
+        future: Future = Future()
+        future.set_result(hit)
+        return future
+
+    return _parse_into_cache(file_path, digest)
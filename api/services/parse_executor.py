@@ -0,0 +1,158 @@
+import os
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional
+
+from landingai_ade import LandingAIADE, APIConnectionError, APIStatusError
+
+from config import (
+    PARSE_CONCURRENCY,
+    PARSE_MAX_RETRIES,
+    PARSE_BACKOFF_BASE,
+    PARSE_BACKOFF_MAX,
+    PARSE_MODEL,
+)
+
+
+def _is_retryable(error: Exception) -> bool:
+    if isinstance(error, APIStatusError):
+        return error.status_code == 429 or error.status_code >= 500
+    return isinstance(error, APIConnectionError)
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    response = getattr(error, "response", None)
+    value = response.headers.get("retry-after") if response is not None else None
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class ParseExecutor:
+    """Runs LandingAI parses on a bounded pool sharing one client.
+
+    Up to `concurrency` parses run at once. Each 429/5xx halves the number of
+    parses allowed in flight and backs off exponentially (or per Retry-After);
+    successful parses grow it back one slot at a time.
+    """
+
+    def __init__(self, concurrency: int, max_retries: int, backoff_base: float, backoff_max: float, model: str):
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.model = model
+
+        self._pool = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="parse")
+        self._client = None
+        self._cond = threading.Condition()
+        self._limit = concurrency
+        self._successes = 0
+        self._queued = 0
+        self._in_flight = 0
+        self._completed = 0
+        self._failed = 0
+        self._retries = 0
+
+    def client(self) -> LandingAIADE:
+        """Shared LandingAI client, created on first use"""
+        with self._cond:
+            if self._client is None:
+                api_key = os.environ.get("LANDING_API_KEY")
+                if not api_key:
+                    raise RuntimeError("LANDING_API_KEY not found")
+                # Retries are handled here so throttling also shrinks concurrency
+                self._client = LandingAIADE(apikey=api_key, max_retries=0)
+            return self._client
+
+    @contextmanager
+    def _slot(self):
+        with self._cond:
+            while self._in_flight >= self._limit:
+                self._cond.wait()
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._in_flight -= 1
+                self._cond.notify_all()
+
+    def _on_success(self):
+        with self._cond:
+            self._successes += 1
+            if self._limit < self.concurrency and self._successes >= self._limit:
+                self._limit += 1
+                self._successes = 0
+                self._cond.notify_all()
+
+    def _on_throttle(self):
+        with self._cond:
+            self._limit = max(1, self._limit // 2)
+            self._successes = 0
+            self._retries += 1
+
+    def _run(self, file_path: str):
+        with self._cond:
+            self._queued -= 1
+        try:
+            client = self.client()
+            attempt = 0
+            while True:
+                try:
+                    with self._slot():
+                        response = client.parse(document=Path(file_path), model=self.model)
+                    self._on_success()
+                    break
+                except Exception as e:
+                    if attempt >= self.max_retries or not _is_retryable(e):
+                        raise
+                    self._on_throttle()
+                    delay = _retry_after(e)
+                    if delay is None:
+                        delay = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+                        delay *= random.uniform(0.5, 1.0)
+                    time.sleep(delay)
+                    attempt += 1
+        except Exception:
+            with self._cond:
+                self._failed += 1
+            raise
+        with self._cond:
+            self._completed += 1
+        return response
+
+    def submit(self, file_path: str) -> Future:
+        """Queue a parse; the future resolves to the LandingAI ParseResponse"""
+        with self._cond:
+            self._queued += 1
+        return self._pool.submit(self._run, file_path)
+
+    def parse(self, file_path: str):
+        """Parse a file, blocking until done"""
+        return self.submit(file_path).result()
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                "concurrency": self.concurrency,
+                "limit": self._limit,
+                "queue_depth": self._queued,
+                "in_flight": self._in_flight,
+                "completed": self._completed,
+                "failed": self._failed,
+                "retries": self._retries,
+            }
+
+    def shutdown(self, wait: bool = False):
+        self._pool.shutdown(wait=wait, cancel_futures=not wait)
+
+
+parse_executor = ParseExecutor(
+    PARSE_CONCURRENCY, PARSE_MAX_RETRIES, PARSE_BACKOFF_BASE, PARSE_BACKOFF_MAX, PARSE_MODEL
+)
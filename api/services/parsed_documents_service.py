@@ -1,11 +1,39 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from models import ParsedDocument, ParsedDocumentCreate, ParsedDocumentUpdate
 from typing import List, Optional
+from services.pagination import DEFAULT_LIMIT, Listing, Page, listing, paginate
 
 def get_all_parsed_documents(db: Session) -> List[ParsedDocument]:
     """Get all parsed documents"""
     return db.query(ParsedDocument).all()
 
+def parsed_document_listing(
+    workspace_id: Optional[str] = None,
+    document_id: Optional[str] = None,
+    fields: Optional[str] = None,
+) -> Listing:
+    """Parsed documents newest first, optionally for a workspace or document"""
+    filters = []
+    if workspace_id:
+        filters.append(ParsedDocument.workspace_id == workspace_id)
+    elif document_id:
+        filters.append(ParsedDocument.documents_id == document_id)
+    return listing(ParsedDocument, ParsedDocument.created_at, fields, filters, descending=True)
+
+def list_parsed_documents(
+    db: Session,
+    workspace_id: Optional[str] = None,
+    document_id: Optional[str] = None,
+    limit: int = DEFAULT_LIMIT,
+    cursor: Optional[str] = None,
+    since: Optional[str] = None,
+    fields: Optional[str] = None,
+) -> Page:
+    """A page of parsed documents, newest first, optionally for a workspace or document"""
+    return paginate(db, parsed_document_listing(workspace_id, document_id, fields), limit, cursor, since)
+
 def get_parsed_document_by_id(db: Session, parsed_document_id: str) -> Optional[ParsedDocument]:
     """Get parsed document by ID"""
     return db.query(ParsedDocument).filter(ParsedDocument.id == parsed_document_id).first()
@@ -60,3 +88,53 @@ def delete_parsed_document(db: Session, parsed_document_id: str) -> bool:
     db.delete(parsed_document)
     db.commit()
     return True
+
+def _chunk_context(filepaths, chunk_id: str, neighbors: int) -> Optional[str]:
+    import json
+    import os
+    from services import chunk_index
+
+    for filepath in filepaths:
+        if not os.path.exists(filepath):
+            continue
+        index = chunk_index.load(filepath)
+        position = index["positions"].get(chunk_id)
+        if position is None:
+            continue
+        chunks = json.loads(
+            chunk_index.read_range(filepath, index, position - neighbors, position + neighbors + 1)
+        )
+        return "\n\n".join(chunk.get("markdown") or "" for chunk in chunks)
+    return None
+
+def _parse_paths_query(workspace_id: str, document_id: Optional[str]):
+    query = select(ParsedDocument.filepath).where(
+        ParsedDocument.workspace_id == workspace_id, ParsedDocument.status.is_(True)
+    )
+    if document_id is not None:
+        query = query.where(ParsedDocument.documents_id == document_id)
+    return query.distinct()
+
+def resolve_chunk_context(
+    db: Session,
+    workspace_id: str,
+    chunk_id: str,
+    document_id: Optional[str] = None,
+    neighbors: int = 0,
+) -> Optional[str]:
+    """Markdown of a chunk (and `neighbors` chunks either side) from the workspace's parses"""
+    filepaths = db.scalars(_parse_paths_query(workspace_id, document_id)).all()
+    return _chunk_context(filepaths, chunk_id, neighbors)
+
+async def resolve_chunk_context_async(
+    db: AsyncSession,
+    workspace_id: str,
+    chunk_id: str,
+    document_id: Optional[str] = None,
+    neighbors: int = 0,
+) -> Optional[str]:
+    """resolve_chunk_context for async routes; the chunk files are read off the loop"""
+    import asyncio
+
+    filepaths = (await db.scalars(_parse_paths_query(workspace_id, document_id))).all()
+    return await asyncio.to_thread(_chunk_context, filepaths, chunk_id, neighbors)
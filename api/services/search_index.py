@@ -0,0 +1,195 @@
+import bisect
+import heapq
+import re
+import string
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_WORD_CHARS = frozenset(string.ascii_lowercase + string.digits)
+
+
+def tokenize(text: str) -> List[str]:
+    """Split lowercase text into alphanumeric word tokens"""
+    return _TOKEN_RE.findall(text)
+
+
+def trigrams(text: str) -> set:
+    """Return the set of 3-character substrings of text"""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def build_postings(symbols_lower: Sequence[str], names_lower: Sequence[str]) -> Tuple[Dict[str, List[int]], Dict[str, List[int]]]:
+    """(name word -> rows, trigram of symbol or name -> rows), row ids ascending"""
+    name_tokens: Dict[str, List[int]] = {}
+    grams: Dict[str, List[int]] = {}
+    for row, (symbol, name) in enumerate(zip(symbols_lower, names_lower)):
+        for token in set(tokenize(name)):
+            name_tokens.setdefault(token, []).append(row)
+        for gram in trigrams(symbol) | trigrams(name):
+            grams.setdefault(gram, []).append(row)
+    return name_tokens, grams
+
+
+def starts_word(text: str, query: str) -> bool:
+    """Check whether query occurs in text at the start of a word"""
+    idx = text.find(query)
+    while idx != -1:
+        if idx == 0 or text[idx - 1] not in _WORD_CHARS:
+            return True
+        idx = text.find(query, idx + 1)
+    return False
+
+
+class SearchIndex:
+    """Index over the listed ticker universe, searched in place.
+
+    The lowercase columns and postings come from the universe snapshot
+    (see universe_snapshot and build_postings), so workers share them
+    through the page cache. Rows are sorted by lowercase symbol, so a row
+    id doubles as its sort rank, exact and prefix symbol lookups are a
+    bisect, and top-k selection within a tier is a smallest-ids problem.
+    """
+
+    def __init__(self, universe):
+        self.symbols = universe.symbols
+        self.names = universe.names
+        self.etf = universe.etf
+        self.symbols_lower = universe.symbols_lower
+        self.names_lower = universe.names_lower
+        # name word -> rows, and trigram of symbol or name -> rows
+        self.name_tokens = universe.name_tokens
+        self.trigrams = universe.trigrams
+
+        # Typo-tolerant lookups over name tokens and symbols
+        from services.fuzzy_index import FuzzyIndex
+        self.fuzzy = FuzzyIndex(self.symbols_lower, self.names_lower)
+
+    def __len__(self):
+        return len(self.symbols)
+
+    def _visible(self, row: int, etf: bool) -> bool:
+        return etf or not self.etf[row]
+
+    @staticmethod
+    def _prefix_range(keys: Sequence[str], prefix: str):
+        lo = bisect.bisect_left(keys, prefix)
+        hi = bisect.bisect_left(keys, prefix + "\uffff")
+        return lo, hi
+
+    def _substring_candidates(self, query: str):
+        """Yield rows whose symbol or name contains query, in row order"""
+        needle = query.encode("utf-8")
+        if len(query) >= 3:
+            grams = sorted(trigrams(query), key=lambda g: len(self.trigrams.get(g, ())))
+            if not grams or grams[0] not in self.trigrams:
+                return
+            candidates = self.trigrams[grams[0]]
+            others = [set(self.trigrams[g]) for g in grams[1:] if g in self.trigrams]
+            if len(others) != len(grams) - 1:
+                return
+            for row in candidates:
+                if all(row in other for other in others) and self._contains(row, needle):
+                    yield row
+        else:
+            # Too short for trigrams: scan in symbol order, callers stop early
+            for row in range(len(self.symbols)):
+                if self._contains(row, needle):
+                    yield row
+
+    def _contains(self, row: int, needle: bytes) -> bool:
+        # Matching UTF-8 bytes matches the text: no decode per row
+        return self.symbols_lower.contains(row, needle) or self.names_lower.contains(row, needle)
+
+    def _tier(self, row: int, query: str) -> int:
+        symbol = self.symbols_lower[row]
+        if symbol == query:
+            return 0
+        if symbol.startswith(query):
+            return 1
+        if query[0] in _WORD_CHARS and starts_word(self.names_lower[row], query):
+            return 2
+        return 3
+
+    def match_all(self, query: str, etf: bool = False) -> List[int]:
+        """Return every visible row matching query, in row order"""
+        query = " ".join(query.lower().split())
+        if not query:
+            return []
+        return [row for row in self._substring_candidates(query) if self._visible(row, etf)]
+
+    def search_within(self, query: str, rows: Iterable[int], limit: int = 20) -> Tuple[List[Dict[str, str]], List[int]]:
+        """Rank the subset of rows matching query.
+
+        rows must be a superset of the matches (e.g. the match set of a prefix
+        of query). Returns the top `limit` results and the narrowed match set.
+        """
+        query = " ".join(query.lower().split())
+        if not query:
+            return [], []
+        needle = query.encode("utf-8")
+        matched = [row for row in rows if self._contains(row, needle)]
+        top = heapq.nsmallest(limit, matched, key=lambda row: (self._tier(row, query), row))
+        return [{"symbol": self.symbols[r], "name": self.names[r]} for r in top], matched
+
+    def search(self, query: str, etf: bool = False, limit: int = 20) -> List[Dict[str, str]]:
+        """Return the top `limit` matches ranked by match tier, then symbol"""
+        query = " ".join(query.lower().split())
+        if not query or limit <= 0:
+            return []
+
+        seen = set()
+        results: List[int] = []
+
+        def take(rows, tier_limit):
+            for row in heapq.nsmallest(tier_limit, rows):
+                if row not in seen:
+                    seen.add(row)
+                    results.append(row)
+
+        # Exact symbol
+        lo = bisect.bisect_left(self.symbols_lower, query)
+        hi = bisect.bisect_right(self.symbols_lower, query, lo)
+        take([r for r in range(lo, hi) if self._visible(r, etf)], limit)
+
+        # Symbol prefix (keys are already in row order)
+        if len(results) < limit:
+            lo, hi = self._prefix_range(self.symbols_lower, query)
+            rows = []
+            for row in range(lo, hi):
+                if row not in seen and self._visible(row, etf):
+                    rows.append(row)
+                    if len(rows) >= limit - len(results):
+                        break
+            take(rows, limit - len(results))
+
+        # Name word prefix (multi-word queries are narrowed by their first word)
+        words = tokenize(query)
+        if len(results) < limit and words and query.startswith(words[0]):
+            lo, hi = self._prefix_range(self.name_tokens.keys, words[0])
+            rows = {
+                row for i in range(lo, hi) for row in self.name_tokens.rows(i)
+                if row not in seen and self._visible(row, etf)
+            }
+            if len(words) > 1 or query != words[0]:
+                rows = {row for row in rows if starts_word(self.names_lower[row], query)}
+            take(rows, limit - len(results))
+
+        # Substring anywhere
+        if len(results) < limit:
+            rows = []
+            for row in self._substring_candidates(query):
+                if row not in seen and self._visible(row, etf):
+                    rows.append(row)
+                    if len(rows) >= limit - len(results):
+                        break
+            take(rows, limit - len(results))
+
+        return [{"symbol": self.symbols[r], "name": self.names[r]} for r in results]
+
+    def search_fuzzy(self, query: str, etf: bool = False, limit: int = 20, budget_ms: float = 25.0) -> List[Dict[str, str]]:
+        """Return typo-tolerant matches ranked by edit distance, then popularity"""
+        hits = self.fuzzy.search(query.lower(), lambda row: self._visible(row, etf), limit, budget_ms)
+        return [
+            {"symbol": self.symbols[row], "name": self.names[row], "distance": distance}
+            for row, distance in hits
+        ]
@@ -0,0 +1,53 @@
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from typing import Optional
+
+from config import SEARCH_SESSION_LIMIT, SEARCH_SESSION_TTL
+
+
+class TypeaheadSessions:
+    """Remembers the full match set of each session's last query.
+
+    A follow-up query that extends the previous one can only match a subset
+    of its rows, so it is answered by filtering those instead of the whole
+    universe. State is purely an optimization: a stale, foreign or evicted
+    session simply falls back to a full search.
+    """
+
+    def __init__(self, max_sessions: int, ttl: float):
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self._sessions: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def candidates(self, session: str, generation: int, query: str, etf: bool) -> Optional[array]:
+        """Return the prior match set if query extends the session's last query"""
+        now = time.monotonic()
+        with self._lock:
+            state = self._sessions.get(session)
+            if state is None:
+                return None
+            expires, prev_generation, prev_query, prev_etf, rows = state
+            if expires < now:
+                del self._sessions[session]
+                return None
+            if prev_generation != generation or prev_etf != etf or not query.startswith(prev_query):
+                return None
+            return rows
+
+    def update(self, session: str, generation: int, query: str, etf: bool, rows):
+        with self._lock:
+            self._sessions[session] = (
+                time.monotonic() + self.ttl, generation, query, etf, array("I", rows)
+            )
+            self._sessions.move_to_end(session)
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+
+    def __len__(self):
+        return len(self._sessions)
+
+
+typeahead_sessions = TypeaheadSessions(SEARCH_SESSION_LIMIT, SEARCH_SESSION_TTL)
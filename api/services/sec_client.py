@@ -0,0 +1,176 @@
+"""Minimal SEC EDGAR client with a host-wide rate limit.
+
+Every request goes through one token bucket whose state lives in a locked
+file, so all threads and all uvicorn workers on the host share the SEC's
+10 requests/second budget. Filing lists come from the submissions API and
+raw filings are fetched concurrently up to SEC_DOWNLOAD_CONCURRENCY.
+"""
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set
+
+import requests
+
+from config import (
+    SEC_USER_AGENT,
+    SEC_WWW_URL,
+    SEC_DATA_URL,
+    SEC_RATE_LIMIT,
+    SEC_RATE_LIMIT_FILE,
+    SEC_DOWNLOAD_CONCURRENCY,
+)
+
+try:
+    import fcntl
+except ImportError:  # Windows: the bucket is only shared within the process
+    fcntl = None
+
+# Ticker -> CIK mapping is refreshed at most this often
+CIK_MAPPING_TTL = 24 * 60 * 60
+MAX_ATTEMPTS = 4
+
+
+class SharedTokenBucket:
+    """Token bucket persisted in a file and guarded by flock.
+
+    Capacity is a single token, so requests are spaced 1/rate apart and no
+    one-second window ever exceeds the rate.
+    """
+
+    def __init__(self, rate: float, path: str):
+        self.rate = rate
+        self.capacity = 1.0
+        self.path = path
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    def _take(self) -> float:
+        """Take a token if one is available; otherwise return seconds to wait"""
+        with open(self.path, "a+") as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                try:
+                    tokens, last = json.loads(f.read() or "null") or (self.capacity, 0.0)
+                except ValueError:
+                    tokens, last = self.capacity, 0.0
+                now = time.time()
+                tokens = min(self.capacity, tokens + max(0.0, now - last) * self.rate)
+                wait = 0.0
+                if tokens >= 1:
+                    tokens -= 1
+                else:
+                    wait = (1 - tokens) / self.rate
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps([tokens, now]))
+                f.flush()
+                return wait
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def acquire(self):
+        """Block until a request may be sent"""
+        while True:
+            with self._lock:
+                wait = self._take()
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+
+rate_limiter = SharedTokenBucket(SEC_RATE_LIMIT, SEC_RATE_LIMIT_FILE)
+
+_session = requests.Session()
+_session.headers.update({"User-Agent": SEC_USER_AGENT, "Accept-Encoding": "gzip, deflate"})
+_fetch_pool = ThreadPoolExecutor(max_workers=SEC_DOWNLOAD_CONCURRENCY, thread_name_prefix="sec")
+
+_cik_mapping: Dict[str, str] = {}
+_cik_mapping_at = 0.0
+_cik_lock = threading.Lock()
+
+
+def _get(url: str) -> requests.Response:
+    """Rate-limited GET that retries 429/5xx with backoff"""
+    for attempt in range(MAX_ATTEMPTS):
+        rate_limiter.acquire()
+        resp = _session.get(url, timeout=60)
+        if resp.status_code == 429 or resp.status_code >= 500:
+            if attempt < MAX_ATTEMPTS - 1:
+                time.sleep(min(10.0, 0.5 * (2 ** attempt)))
+                continue
+        resp.raise_for_status()
+        return resp
+    raise RuntimeError(f"Unreachable: {url}")
+
+
+def get_cik(ticker: str) -> str:
+    """Resolve a ticker to its zero-padded CIK"""
+    global _cik_mapping, _cik_mapping_at
+    with _cik_lock:
+        if not _cik_mapping or time.time() - _cik_mapping_at > CIK_MAPPING_TTL:
+            data = _get(f"{SEC_WWW_URL}/files/company_tickers_exchange.json").json()
+            cik_idx = data["fields"].index("cik")
+            ticker_idx = data["fields"].index("ticker")
+            _cik_mapping = {
+                str(row[ticker_idx]).upper(): str(row[cik_idx]).zfill(10)
+                for row in data["data"]
+            }
+            _cik_mapping_at = time.time()
+    cik = _cik_mapping.get(ticker.upper())
+    if not cik:
+        raise ValueError(f"Ticker {ticker} not found in SEC ticker mapping")
+    return cik
+
+
+def list_filings(cik: str, form_type: str, after: str, skip: Optional[Set[str]] = None) -> List[dict]:
+    """List filings of form_type filed on or after `after` (YYYY-MM-DD), newest first.
+
+    Amendments are excluded. Older submission pages are only requested
+    while they can still contain filings in range.
+    """
+    skip = skip or set()
+    filings = []
+    resp = _get(f"{SEC_DATA_URL}/submissions/CIK{cik}.json").json()
+    page = resp["filings"]["recent"]
+    more_pages = [f["name"] for f in resp["filings"].get("files", [])]
+
+    while True:
+        dates = page["filingDate"]
+        for accession, form, f_date in zip(page["accessionNumber"], page["form"], dates):
+            if form == form_type and f_date >= after and accession not in skip:
+                filings.append({"accession": accession, "filing_date": f_date})
+        if not more_pages or (dates and min(dates) < after):
+            break
+        page = _get(f"{SEC_DATA_URL}/submissions/{more_pages.pop(0)}").json()
+
+    return filings
+
+
+def download_filing(cik: str, accession: str) -> bytes:
+    """Fetch a filing's full submission text"""
+    url = f"{SEC_WWW_URL}/Archives/edgar/data/{cik.lstrip('0')}/{accession.replace('-', '')}/{accession}.txt"
+    return _get(url).content
+
+
+def fetch_many(cik: str, accessions: List[str], save) -> Dict[str, Exception]:
+    """Download filings concurrently, calling save(accession, content) for each.
+
+    Returns {accession: error} for the ones that failed.
+    """
+    def fetch(accession):
+        save(accession, download_filing(cik, accession))
+
+    futures = {accession: _fetch_pool.submit(fetch, accession) for accession in accessions}
+    errors = {}
+    for accession, future in futures.items():
+        try:
+            future.result()
+        except Exception as e:
+            errors[accession] = e
+    return errors
@@ -0,0 +1,103 @@
+"""Single-pass parser for the SGML header of an EDGAR full-submission file.
+
+The header is read line by line and parsing stops at ``</SEC-HEADER>`` (or
+the first ``<DOCUMENT>``), so the size of the filing body doesn't matter and
+no header field is cut off by a fixed read window.
+"""
+from typing import Dict, Optional
+
+# Header label -> field name; the first occurrence wins, which for company
+# fields is the primary filer
+HEADER_FIELDS = {
+    "ACCESSION NUMBER": "accession_number",
+    "CONFORMED SUBMISSION TYPE": "form_type",
+    "PUBLIC DOCUMENT COUNT": "document_count",
+    "CONFORMED PERIOD OF REPORT": "reporting_date",
+    "FILED AS OF DATE": "filing_date",
+    "COMPANY CONFORMED NAME": "company_name",
+    "CENTRAL INDEX KEY": "cik",
+    "STANDARD INDUSTRIAL CLASSIFICATION": "sic",
+    "STATE OF INCORPORATION": "state_of_incorporation",
+    "FISCAL YEAR END": "fiscal_year_end",
+}
+
+# Stop reading a file that has not closed its header after this many bytes
+MAX_HEADER_BYTES = 1 << 20
+
+
+def parse_header_lines(lines) -> Dict[str, str]:
+    """Extract HEADER_FIELDS from an iterable of header lines (str)"""
+    header: Dict[str, str] = {}
+    remaining = len(HEADER_FIELDS)
+    for line in lines:
+        stripped = line.strip()
+        if not stripped:
+            continue
+        if stripped[0] == "<":
+            if stripped.startswith("</SEC-HEADER>") or stripped.startswith("<DOCUMENT>"):
+                break
+            continue
+        label, sep, value = stripped.partition(":")
+        if not sep:
+            continue
+        name = HEADER_FIELDS.get(label)
+        if name is None or name in header:
+            continue
+        value = value.strip()
+        if value:
+            header[name] = value
+            remaining -= 1
+            if remaining == 0:
+                break
+
+    sic = header.pop("sic", None)
+    if sic:
+        # e.g. "SERVICES-PREPACKAGED SOFTWARE [7372]"
+        description, _, code = sic.rpartition("[")
+        code = code.rstrip("]").strip()
+        if code.isdigit():
+            header["sic_code"] = code
+            header["sic_description"] = description.strip()
+        else:
+            header["sic_description"] = sic
+    return header
+
+
+def _read_lines(f, max_bytes: int):
+    read = 0
+    for raw in f:
+        read += len(raw)
+        if read > max_bytes:
+            return
+        yield raw.decode("latin-1")
+
+
+def parse_header(file_path: str, max_bytes: int = MAX_HEADER_BYTES) -> Dict[str, str]:
+    """Parse the header of a full-submission file; empty if it has none.
+
+    Dates are returned as YYYYMMDD, as they appear in the header.
+    """
+    with open(file_path, "rb") as f:
+        first = f.readline(64)
+        if not first.lstrip().startswith((b"<SEC-DOCUMENT>", b"<SEC-HEADER>", b"<IMS-DOCUMENT>")):
+            return {}
+        return parse_header_lines(_read_lines(f, max_bytes))
+
+
+def format_date(value: Optional[str]) -> Optional[str]:
+    """YYYYMMDD -> YYYY/MM/DD (the format stored on documents)"""
+    if not value or len(value) != 8 or not value.isdigit():
+        return None
+    return f"{value[:4]}/{value[4:6]}/{value[6:]}"
+
+
+def document_fields(header: Dict[str, str], form_type: Optional[str] = None) -> Dict[str, Optional[str]]:
+    """Document column values for a parsed header"""
+    return {
+        "accession_number": header.get("accession_number"),
+        "cik": header.get("cik"),
+        "company_name": header.get("company_name"),
+        "form_type": header.get("form_type") or form_type,
+        "sic_code": header.get("sic_code"),
+        "fiscal_year_end": header.get("fiscal_year_end"),
+    }
@@ -0,0 +1,182 @@
+"""Byte-offset index of the <DOCUMENT> sections in a full-submission file.
+
+A submission bundles the primary report with every exhibit, XBRL file and
+uuencoded graphic. The index records where each section's content starts
+and how long it is, so one section can be served by seeking instead of
+shipping the whole submission. Filings in the store get their index as a
+``sections.json`` sidecar next to ``full-submission.txt`` when they are
+downloaded; other files get ``{file}.sections.json`` on first use.
+"""
+import binascii
+import json
+import mmap
+import os
+import threading
+from typing import Iterator, List, Optional
+
+from services import filing_store
+
+INDEX_VERSION = 1
+
+_META_TAGS = {
+    b"<TYPE>": "type",
+    b"<SEQUENCE>": "sequence",
+    b"<FILENAME>": "filename",
+    b"<DESCRIPTION>": "description",
+}
+# Wrappers EDGAR puts inside <TEXT> around the actual file content
+_WRAPPERS = [(b"<XBRL>", b"</XBRL>"), (b"<XML>", b"</XML>"), (b"<PDF>", b"</PDF>")]
+
+
+def _skip_newline(m, pos: int) -> int:
+    if m[pos:pos + 2] == b"\r\n":
+        return pos + 2
+    if m[pos:pos + 1] == b"\n":
+        return pos + 1
+    return pos
+
+
+def _trim_newline(m, start: int, end: int) -> int:
+    if end > start and m[end - 1:end] == b"\n":
+        end -= 1
+        if end > start and m[end - 1:end] == b"\r":
+            end -= 1
+    return end
+
+
+def _unwrap(m, start: int, end: int):
+    """Narrow [start, end) to the inside of an <XBRL>/<XML>/<PDF> wrapper"""
+    for open_tag, close_tag in _WRAPPERS:
+        if m[start:start + len(open_tag)] == open_tag:
+            close = m.rfind(close_tag, start, end)
+            if close != -1:
+                inner = _skip_newline(m, start + len(open_tag))
+                return inner, _trim_newline(m, inner, close)
+    return start, end
+
+
+def build_index(file_path: str) -> List[dict]:
+    """Scan a submission and return one entry per <DOCUMENT> section"""
+    sections = []
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return sections
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            pos = m.find(b"<DOCUMENT>")
+            while pos != -1:
+                doc_end = m.find(b"</DOCUMENT>", pos)
+                if doc_end == -1:
+                    doc_end = len(m)
+                text_tag = m.find(b"<TEXT>", pos, doc_end)
+                meta_end = text_tag if text_tag != -1 else doc_end
+
+                entry = {"sequence": None, "type": None, "filename": None, "description": None}
+                for line in m[pos:meta_end].splitlines():
+                    line = line.strip()
+                    for tag, name in _META_TAGS.items():
+                        if line.startswith(tag):
+                            entry[name] = line[len(tag):].decode("latin-1").strip()
+                            break
+
+                if text_tag != -1:
+                    start = _skip_newline(m, text_tag + len(b"<TEXT>"))
+                    end = m.rfind(b"</TEXT>", start, doc_end)
+                    end = _trim_newline(m, start, end if end != -1 else doc_end)
+                    start, end = _unwrap(m, start, end)
+                else:
+                    start = end = meta_end
+
+                entry["sequence"] = int(entry["sequence"]) if (entry["sequence"] or "").isdigit() else len(sections) + 1
+                entry["offset"] = start
+                entry["length"] = end - start
+                entry["encoding"] = "uuencode" if m[start:start + 6] == b"begin " else None
+                sections.append(entry)
+                pos = m.find(b"<DOCUMENT>", doc_end)
+    return sections
+
+
+def index_path(file_path: str, accession: Optional[str] = None) -> str:
+    """Sidecar location: next to the stored filing when there is one"""
+    if accession and filing_store.has_filing(accession):
+        return os.path.join(os.path.dirname(filing_store.filing_path(accession)), "sections.json")
+    return f"{file_path}.sections.json"
+
+
+def write_index(file_path: str, accession: Optional[str] = None) -> List[dict]:
+    """Build the index for file_path and save its sidecar atomically"""
+    stat = os.stat(file_path)
+    sections = build_index(file_path)
+    path = index_path(file_path, accession)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({
+            "version": INDEX_VERSION,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sections": sections,
+        }, f)
+    os.replace(tmp_path, path)
+    return sections
+
+
+def load_index(file_path: str, accession: Optional[str] = None) -> List[dict]:
+    """Sections of file_path, (re)building the sidecar if missing or stale"""
+    path = index_path(file_path, accession)
+    try:
+        with open(path) as f:
+            data = json.load(f)
+        stat = os.stat(file_path)
+        # Store sidecars describe an immutable file; others must match size/mtime
+        fresh = data.get("version") == INDEX_VERSION and data.get("size") == stat.st_size and (
+            path != f"{file_path}.sections.json" or data.get("mtime_ns") == stat.st_mtime_ns
+        )
+        if fresh:
+            return data["sections"]
+    except (OSError, ValueError):
+        pass
+    return write_index(file_path, accession)
+
+
+def find_section(sections: List[dict], sequence: int) -> Optional[dict]:
+    for section in sections:
+        if section["sequence"] == sequence:
+            return section
+    return None
+
+
+def primary_section(sections: List[dict]) -> Optional[dict]:
+    """The main report: the first section, which EDGAR numbers 1"""
+    return find_section(sections, 1) or (sections[0] if sections else None)
+
+
+def iter_section(file_path: str, section: dict, chunk_size: int = 1 << 16) -> Iterator[bytes]:
+    """Yield a section's raw bytes by seeking to its offset"""
+    remaining = section["length"]
+    with open(file_path, "rb") as f:
+        f.seek(section["offset"])
+        while remaining > 0:
+            chunk = f.read(min(chunk_size, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def read_section(file_path: str, section: dict) -> bytes:
+    """A section's content, uudecoded if it was uuencoded"""
+    data = b"".join(iter_section(file_path, section))
+    if section.get("encoding") != "uuencode":
+        return data
+    decoded = bytearray()
+    for line in data.splitlines()[1:]:
+        if line.strip() == b"end":
+            break
+        if not line:
+            continue
+        # Trim padding some filers leave past the declared line length
+        length = (((line[0] - 32) & 63) * 4 + 5) // 3
+        try:
+            decoded += binascii.a2b_uu(line[:length])
+        except binascii.Error:
+            continue
+    return bytes(decoded)
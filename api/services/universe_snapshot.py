@@ -0,0 +1,258 @@
+"""Compiled, memory-mapped snapshot of the listed ticker universe.
+
+Layout (little endian, every section padded to 4 bytes):
+
+    header          magic, version, row count, CSV mtime_ns, CSV size, CSV sha256
+    symbols         u32 offsets[n + 1] followed by the UTF-8 blob
+    names           u32 offsets[n + 1] followed by the UTF-8 blob
+    etf             bitmap, bit i set when row i is an ETF
+    symbols_lower   lowercase symbols, laid out like symbols
+    names_lower     lowercase names, laid out like names
+    name_tokens     postings: name word -> rows containing it
+    trigrams        postings: trigram of symbol or name -> rows containing it
+
+Postings are a u32 key count, the sorted keys laid out like symbols, u32
+offsets[keys + 1] into the rows, then the u32 row ids, ascending per key.
+
+Rows are stored sorted by lowercase symbol. Workers open the file with a
+read-only mmap and search it in place, so the columns and postings are
+shared through the OS page cache instead of rebuilt in every worker.
+
+Build ahead of a deploy with ``python -m services.universe_snapshot``.
+"""
+import csv
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from typing import Dict, List, Optional
+
+from config import DATA_PATH, UNIVERSE_PATH
+from services.search_index import build_postings
+
+MAGIC = b"KENU"
+VERSION = 2
+_COUNT = struct.Struct("<I")
+_HEADER = struct.Struct("<4sIIQQ32s")
+
+
+def _pad(n: int) -> int:
+    return (n + 3) & ~3
+
+
+def _file_sha256(path: str) -> bytes:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.digest()
+
+
+def _encode_u32(values) -> bytes:
+    numbers = array("I", values)
+    if sys.byteorder != "little":
+        numbers.byteswap()
+    return numbers.tobytes()
+
+
+def _encode_strings(values) -> bytes:
+    offsets = array("I", [0])
+    blob = bytearray()
+    for value in values:
+        blob += value.encode("utf-8")
+        offsets.append(len(blob))
+    blob += b"\0" * (_pad(len(blob)) - len(blob))
+    return _encode_u32(offsets) + bytes(blob)
+
+
+def _encode_postings(postings: Dict[str, List[int]]) -> bytes:
+    keys = sorted(postings)
+    offsets = array("I", [0])
+    rows = array("I")
+    for key in keys:
+        rows.extend(postings[key])
+        offsets.append(len(rows))
+    return _COUNT.pack(len(keys)) + _encode_strings(keys) + _encode_u32(offsets) + _encode_u32(rows)
+
+
+def build_snapshot(csv_path: str = DATA_PATH, out_path: str = UNIVERSE_PATH) -> str:
+    """Compile listed.csv into a binary snapshot, replacing any existing one atomically"""
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        rows = [(r["symbol"], r["name"], r["ETF"] == "Y") for r in csv.DictReader(f)]
+    rows.sort(key=lambda r: (r[0].lower(), r[0]))
+
+    n = len(rows)
+    bitmap = bytearray(_pad((n + 7) // 8))
+    for i, (_, _, is_etf) in enumerate(rows):
+        if is_etf:
+            bitmap[i >> 3] |= 1 << (i & 7)
+
+    symbols_lower = [r[0].lower() for r in rows]
+    names_lower = [r[1].lower() for r in rows]
+    name_tokens, grams = build_postings(symbols_lower, names_lower)
+
+    stat = os.stat(csv_path)
+    header = _HEADER.pack(MAGIC, VERSION, n, stat.st_mtime_ns, stat.st_size, _file_sha256(csv_path))
+
+    tmp_path = f"{out_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        f.write(b"\0" * (_pad(len(header)) - len(header)))
+        f.write(_encode_strings(r[0] for r in rows))
+        f.write(_encode_strings(r[1] for r in rows))
+        f.write(bytes(bitmap))
+        f.write(_encode_strings(symbols_lower))
+        f.write(_encode_strings(names_lower))
+        f.write(_encode_postings(name_tokens))
+        f.write(_encode_postings(grams))
+    os.replace(tmp_path, out_path)
+    return out_path
+
+
+class StringTable:
+    """Read-only sequence of strings backed by an offsets array and a blob"""
+
+    def __init__(self, buf: memoryview, start: int, count: int):
+        offsets_size = 4 * (count + 1)
+        self._offsets = buf[start:start + offsets_size].cast("I")
+        self._blob_start = start + offsets_size
+        self._buf = buf
+        # The mmap itself, whose find() searches a range without copying
+        self._data = buf.obj
+        self._count = count
+        self.end = self._blob_start + _pad(self._offsets[count])
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, i: int) -> str:
+        if not 0 <= i < self._count:
+            raise IndexError(i)
+        a = self._blob_start + self._offsets[i]
+        b = self._blob_start + self._offsets[i + 1]
+        return str(self._buf[a:b], "utf-8")
+
+    def __iter__(self):
+        for i in range(self._count):
+            yield self[i]
+
+    def contains(self, i: int, needle: bytes) -> bool:
+        """Whether string i contains needle (UTF-8) without decoding it"""
+        a = self._blob_start + self._offsets[i]
+        return self._data.find(needle, a, self._blob_start + self._offsets[i + 1]) != -1
+
+
+class Postings:
+    """Read-only map from sorted string keys to ascending row ids"""
+
+    def __init__(self, buf: memoryview, start: int):
+        (count,) = _COUNT.unpack_from(buf, start)
+        self.keys = StringTable(buf, start + _COUNT.size, count)
+        offsets_start = self.keys.end
+        rows_start = offsets_start + 4 * (count + 1)
+        self._offsets = buf[offsets_start:rows_start].cast("I")
+        self.end = rows_start + 4 * self._offsets[count]
+        self._rows = buf[rows_start:self.end].cast("I")
+
+    def __len__(self):
+        return len(self.keys)
+
+    def rows(self, i: int) -> memoryview:
+        """Row ids of the i-th key"""
+        return self._rows[self._offsets[i]:self._offsets[i + 1]]
+
+    def _find(self, key: str) -> int:
+        i = bisect_left(self.keys, key)
+        return i if i < len(self.keys) and self.keys[i] == key else -1
+
+    def get(self, key: str, default=None):
+        i = self._find(key)
+        return self.rows(i) if i != -1 else default
+
+    def __contains__(self, key: str) -> bool:
+        return self._find(key) != -1
+
+    def __getitem__(self, key: str) -> memoryview:
+        i = self._find(key)
+        if i == -1:
+            raise KeyError(key)
+        return self.rows(i)
+
+
+class Bitmap:
+    """Read-only bit array"""
+
+    def __init__(self, buf: memoryview, start: int, count: int):
+        self._bits = buf[start:start + (count + 7) // 8]
+        self._count = count
+        self.end = start + (count + 7) // 8
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, i: int) -> bool:
+        if not 0 <= i < self._count:
+            raise IndexError(i)
+        return bool(self._bits[i >> 3] & (1 << (i & 7)))
+
+    def __iter__(self):
+        for i in range(self._count):
+            yield self[i]
+
+
+class Universe:
+    """Memory-mapped view over a compiled snapshot"""
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        buf = memoryview(self._mmap)
+
+        magic, version, count, mtime_ns, size, sha256 = _HEADER.unpack_from(buf, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Unsupported universe snapshot: {path}")
+        self.path = path
+        self.csv_mtime_ns = mtime_ns
+        self.csv_size = size
+        self.csv_sha256 = sha256
+
+        self.symbols = StringTable(buf, _pad(_HEADER.size), count)
+        self.names = StringTable(buf, self.symbols.end, count)
+        self.etf = Bitmap(buf, self.names.end, count)
+        self.symbols_lower = StringTable(buf, _pad(self.etf.end), count)
+        self.names_lower = StringTable(buf, self.symbols_lower.end, count)
+        self.name_tokens = Postings(buf, self.names_lower.end)
+        self.trigrams = Postings(buf, self.name_tokens.end)
+
+    def __len__(self):
+        return len(self.symbols)
+
+    def matches(self, csv_path: str) -> bool:
+        """Check whether the snapshot was compiled from the current CSV"""
+        stat = os.stat(csv_path)
+        if stat.st_size != self.csv_size:
+            return False
+        if stat.st_mtime_ns == self.csv_mtime_ns:
+            return True
+        return _file_sha256(csv_path) == self.csv_sha256
+
+
+def open_universe(csv_path: str = DATA_PATH, snapshot_path: str = UNIVERSE_PATH) -> Universe:
+    """Map the snapshot for csv_path, compiling it first if missing or stale"""
+    universe: Optional[Universe] = None
+    if os.path.exists(snapshot_path):
+        try:
+            universe = Universe(snapshot_path)
+        except (ValueError, struct.error):
+            universe = None
+    if universe is None or not universe.matches(csv_path):
+        build_snapshot(csv_path, snapshot_path)
+        universe = Universe(snapshot_path)
+    return universe
+
+
+if __name__ == "__main__":
+    print(build_snapshot())
@@ -0,0 +1,297 @@
+"""Full-text search over a workspace's filings and parsed chunks (SQLite FTS5).
+
+Rows are added as documents arrive: when a raw filing is registered its
+primary report is indexed in passages, and once its parse completes those
+passages are replaced by the parse's chunks (which carry chunk ids). Hits
+are ranked with BM25 and come with highlighted snippets. FTS5 is SQLite
+only; on other databases indexing is skipped and searches return nothing.
+
+    python -m services.workspace_search --reindex   # rebuild from disk
+"""
+import html
+import json
+import os
+import re
+from typing import List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from models import Document, ParsedDocument
+
+# Passages indexed per raw filing before its parse exists
+PASSAGE_CHARS = 1500
+
+SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS search_chunks USING fts5(
+    content,
+    scope,
+    workspace_id UNINDEXED,
+    document_id UNINDEXED,
+    chunk_id UNINDEXED,
+    source UNINDEXED,
+    filing_date UNINDEXED,
+    form_type UNINDEXED,
+    tokenize = 'porter unicode61'
+)
+"""
+
+_DROP_BLOCKS = re.compile(r"<(script|style|head|ix:header)\b.*?</\1>", re.IGNORECASE | re.DOTALL)
+_BREAK_TAGS = re.compile(r"<(?:br|/p|/div|/tr|/li|/h[1-6]|/table)\b[^>]*>", re.IGNORECASE)
+_TAGS = re.compile(r"<[^>]+>")
+_SPACES = re.compile(r"[ \t\r\f\v\xa0]+")
+_BLANK_LINES = re.compile(r"\n\s*\n+")
+_TERMS = re.compile(r'"([^"]*)"|(\S+)')
+# snippet() delimiters, swapped for <mark> once the text is HTML-escaped;
+# control characters that html_to_text keeps out of indexed content
+_MARK_START = "\x02"
+_MARK_END = "\x03"
+_CONTROL = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+
+def supported(bind) -> bool:
+    """Whether bind (connection, engine or session) is on SQLite"""
+    if isinstance(bind, Session):
+        bind = bind.get_bind()
+    return bind.dialect.name == "sqlite"
+
+
+def ensure_schema(conn):
+    """Create the FTS table (conn is a SQLAlchemy connection)"""
+    if supported(conn):
+        conn.execute(text(SCHEMA))
+
+
+def _token(prefix: str, value: str) -> str:
+    # Ids are case sensitive but FTS folds case, so filter tokens are the
+    # hex of the id (bracketed so the stemmer leaves them alone)
+    return f"{prefix}{value.encode().hex()}z"
+
+
+def _scope(workspace_id: str) -> str:
+    return _token("w", workspace_id)
+
+
+def _document_scope(document_id: str) -> str:
+    return _token("d", document_id)
+
+
+def html_to_text(markup: str) -> str:
+    """Readable text from filing HTML or chunk markdown"""
+    markup = _DROP_BLOCKS.sub(" ", markup)
+    markup = _BREAK_TAGS.sub("\n", markup)
+    plain = html.unescape(_TAGS.sub(" ", markup))
+    plain = _SPACES.sub(" ", _CONTROL.sub(" ", plain))
+    return _BLANK_LINES.sub("\n\n", plain).strip()
+
+
+def passages(plain: str, size: int = PASSAGE_CHARS) -> List[str]:
+    """Split text into passages of about `size` characters at whitespace"""
+    result = []
+    start = 0
+    while start < len(plain):
+        end = min(len(plain), start + size)
+        if end < len(plain):
+            cut = plain.rfind(" ", start + size // 2, end)
+            end = cut if cut != -1 else end
+        passage = plain[start:end].strip()
+        if passage:
+            result.append(passage)
+        start = end
+    return result
+
+
+def _insert(db: Session, document: Document, rows):
+    db.execute(
+        text(
+            "INSERT INTO search_chunks "
+            "(content, scope, workspace_id, document_id, chunk_id, source, filing_date, form_type) "
+            "VALUES (:content, :scope, :workspace_id, :document_id, :chunk_id, :source, :filing_date, :form_type)"
+        ),
+        [
+            {
+                "content": content,
+                "scope": f"{_scope(document.workspace_id)} {_document_scope(document.id)}",
+                "workspace_id": document.workspace_id,
+                "document_id": document.id,
+                "chunk_id": chunk_id,
+                "source": source,
+                "filing_date": document.filing_date,
+                "form_type": document.form_type,
+            }
+            for content, chunk_id, source in rows
+        ],
+    )
+
+
+def remove_document(db: Session, document_id: str, commit: bool = True):
+    if not supported(db):
+        return
+    db.execute(
+        text("DELETE FROM search_chunks WHERE search_chunks MATCH :scope"),
+        {"scope": f'scope:"{_document_scope(document_id)}"'},
+    )
+    if commit:
+        db.commit()
+
+
+def remove_workspace(db: Session, workspace_id: str, commit: bool = True):
+    if not supported(db):
+        return
+    db.execute(
+        text("DELETE FROM search_chunks WHERE search_chunks MATCH :scope"),
+        {"scope": f'scope:"{_scope(workspace_id)}"'},
+    )
+    if commit:
+        db.commit()
+
+
+def filing_rows(file_path: str, accession: Optional[str] = None) -> list:
+    """Passages of a raw filing's primary report, ready for index_filing"""
+    from services import sec_sections
+
+    if not file_path.lower().endswith(".txt") or not os.path.exists(file_path):
+        return []
+    sections = sec_sections.load_index(file_path, accession)
+    primary = sec_sections.primary_section(sections)
+    if primary is None or primary.get("encoding"):
+        return []
+    markup = sec_sections.read_section(file_path, primary).decode("utf-8", errors="ignore")
+    return [(passage, None, "filing") for passage in passages(html_to_text(markup))]
+
+
+def index_filing(db: Session, document: Document, rows: Optional[list] = None, commit: bool = True) -> int:
+    """Index the primary report of a raw filing in passages (until it is parsed).
+
+    rows may be prepared beforehand with filing_rows, so the text extraction
+    happens outside the write transaction.
+    """
+    if not supported(db):
+        return 0
+    if rows is None:
+        rows = filing_rows(document.file_path, document.accession_number)
+
+    remove_document(db, document.id, commit=False)
+    if rows:
+        _insert(db, document, rows)
+    if commit:
+        db.commit()
+    return len(rows)
+
+
+def index_parse(db: Session, document_id: str) -> int:
+    """Replace a document's rows with the chunks of its completed parse"""
+    from services import chunk_index
+
+    if not supported(db):
+        return 0
+    document = db.query(Document).filter(Document.id == document_id).first()
+    parsed = db.query(ParsedDocument).filter(
+        ParsedDocument.documents_id == document_id, ParsedDocument.status.is_(True)
+    ).first()
+    if document is None or parsed is None or not os.path.exists(parsed.filepath):
+        return 0
+
+    index = chunk_index.load(parsed.filepath)
+    chunks = json.loads(chunk_index.read_range(parsed.filepath, index, 0, index["count"]))
+    rows = []
+    for chunk in chunks:
+        content = html_to_text(chunk.get("markdown") or "")
+        if content:
+            rows.append((content, chunk.get("id"), "parse"))
+
+    remove_document(db, document.id, commit=False)
+    if rows:
+        _insert(db, document, rows)
+    db.commit()
+    return len(rows)
+
+
+def match_expression(query: str) -> Optional[str]:
+    """FTS5 query from user input: words are ANDed, "quoted text" is a phrase"""
+    terms = []
+    for phrase, word in _TERMS.findall(query):
+        term = (phrase or word).strip()
+        if term:
+            terms.append('content:"' + term.replace('"', '""') + '"')
+    return " AND ".join(terms) if terms else None
+
+
+def _highlight(snippet: str) -> str:
+    """HTML-escaped snippet text; the <mark> tags around hits are the only markup"""
+    return html.escape(snippet or "").replace(_MARK_START, "<mark>").replace(_MARK_END, "</mark>")
+
+
+def search(
+    db: Session,
+    workspace_id: str,
+    query: str,
+    limit: int = 20,
+    form_type: Optional[str] = None,
+) -> List[dict]:
+    """BM25-ranked hits with snippets for a workspace"""
+    expression = match_expression(query)
+    if expression is None or not supported(db):
+        return []
+    expression = f'scope:"{_scope(workspace_id)}" AND ({expression})'
+
+    sql = (
+        "SELECT document_id, chunk_id, source, filing_date, form_type, "
+        "snippet(search_chunks, 0, :mark_start, :mark_end, '…', 24) AS snippet, "
+        "bm25(search_chunks, 1.0, 0.0) AS score "
+        "FROM search_chunks WHERE search_chunks MATCH :expression"
+    )
+    params = {"expression": expression, "limit": limit, "mark_start": _MARK_START, "mark_end": _MARK_END}
+    if form_type is not None:
+        sql += " AND form_type = :form_type"
+        params["form_type"] = form_type
+    sql += " ORDER BY score LIMIT :limit"
+
+    return [
+        {
+            "document_id": row.document_id,
+            "chunk_id": row.chunk_id,
+            "source": row.source,
+            "filing_date": row.filing_date,
+            "form_type": row.form_type,
+            "snippet": _highlight(row.snippet),
+            "score": round(row.score, 4),
+        }
+        for row in db.execute(text(sql), params)
+    ]
+
+
+def reindex(db: Session) -> int:
+    """Rebuild the index for every document from files on disk"""
+    if not supported(db):
+        return 0
+    db.execute(text("DELETE FROM search_chunks"))
+    db.commit()
+    parsed_ids = {
+        row.documents_id
+        for row in db.query(ParsedDocument.documents_id).filter(ParsedDocument.status.is_(True))
+    }
+    count = 0
+    for document in db.query(Document).all():
+        if document.id in parsed_ids:
+            count += index_parse(db, document.id)
+        else:
+            count += index_filing(db, document)
+    return count
+
+
+if __name__ == "__main__":
+    import argparse
+    from database import SessionLocal, init_db
+
+    parser = argparse.ArgumentParser(description="Workspace full-text index")
+    parser.add_argument("--reindex", action="store_true", help="rebuild the index from disk")
+    args = parser.parse_args()
+
+    init_db()
+    if args.reindex:
+        session = SessionLocal()
+        try:
+            print(f"Indexed {reindex(session)} rows")
+        finally:
+            session.close()
@@ -1,8 +1,12 @@
+import asyncio
 import os
 import random
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from models import Workspace, WorkspaceCreate, WorkspaceUpdate, generate_workspace_id
 from typing import List, Optional
+from services.pagination import DEFAULT_LIMIT, Listing, Page, listing, paginate
 
 # Word lists for generating random workspace names
 ADJECTIVES = [
@@ -36,6 +40,20 @@ def get_all_workspaces(db: Session) -> List[Workspace]:
     """Get all workspaces"""
     return db.query(Workspace).all()
 
+def workspace_listing(fields: Optional[str] = None) -> Listing:
+    """Workspaces newest first"""
+    return listing(Workspace, Workspace.created_at, fields, descending=True)
+
+def list_workspaces(
+    db: Session,
+    limit: int = DEFAULT_LIMIT,
+    cursor: Optional[str] = None,
+    since: Optional[str] = None,
+    fields: Optional[str] = None,
+) -> Page:
+    """A page of workspaces, newest first"""
+    return paginate(db, workspace_listing(fields), limit, cursor, since)
+
 def get_workspace_by_id(db: Session, workspace_id: str) -> Optional[Workspace]:
     """Get workspace by ID"""
     return db.query(Workspace).filter(Workspace.id == workspace_id).first()
@@ -67,6 +85,29 @@ def create_workspace(db: Session, workspace_data: WorkspaceCreate) -> Workspace:
 
     return workspace
 
+async def get_workspace_by_id_async(db: AsyncSession, workspace_id: str) -> Optional[Workspace]:
+    """Get workspace by ID (async)"""
+    return await db.get(Workspace, workspace_id)
+
+async def create_workspace_async(db: AsyncSession, workspace_data: WorkspaceCreate) -> Workspace:
+    """Create a new workspace (async)"""
+    workspace_id = workspace_data.id if workspace_data.id else generate_workspace_id()
+
+    result = await db.execute(select(Workspace.id).where(Workspace.id == workspace_id))
+    if result.first() is not None:
+        raise ValueError(f"Workspace with ID '{workspace_id}' already exists")
+
+    workspace = Workspace(
+        id=workspace_id,
+        name=workspace_data.name if workspace_data.name else generate_random_name(),
+        ticker=workspace_data.ticker
+    )
+    db.add(workspace)
+    await db.commit()
+
+    await asyncio.to_thread(create_workspace_folder, workspace_id)
+    return workspace
+
 def update_workspace(db: Session, workspace_id: str, workspace_data: WorkspaceUpdate) -> Optional[Workspace]:
     """Update workspace by ID"""
     workspace = get_workspace_by_id(db, workspace_id)
@@ -99,6 +140,9 @@ def delete_workspace(db: Session, workspace_id: str) -> bool:
         import shutil
         shutil.rmtree(workspace_dir)
 
+    from services import workspace_search
+    workspace_search.remove_workspace(db, workspace_id, commit=False)
+
     db.delete(workspace)
     db.commit()
     return True
@@ -3,7 +3,7 @@
 import { useEffect, useState, useRef } from "react";
 import { useParams } from "next/navigation";
 import { useWorkspaceStore } from "@/store/workspaceStore";
-import { createWorkspace, getWorkspaceById, getDocuments } from "@/lib/api";
+import { createWorkspace, getWorkspaceById, getDocuments, getJob } from "@/lib/api";
 import ResizablePanels from "@/components/ResizablePanels";
 import WorkspaceLeftPanel from "@/components/WorkspaceLeftPanel";
 import WorkspaceRightPanel from "@/components/WorkspaceRightPanel";
@@ -61,15 +61,34 @@ export default function WorkspacePage() {
       );
 
       setWorkspace(result.response.workspace);
-      setDocuments(result.response.documents || []);
       setStatus("success");
       removePendingWorkspace(workspaceId);
+
+      // Filings are downloaded and parsed by a background job; refresh
+      // the document list as it makes progress
+      await pollJob(result.response.workspace.id, result.response.job.id);
     } catch (err: any) {
       setStatus("error");
       setError(err.message || "Failed to create workspace");
     }
   };
 
+  const pollJob = async (id: string, jobId: string) => {
+    while (true) {
+      const job = (await getJob(jobId)).response;
+      const documentsData = await getDocuments(id);
+      setDocuments(documentsData.response || []);
+
+      if (job.status === "completed" || job.status === "failed") {
+        if (job.status === "failed") {
+          setError(job.error || "Failed to process workspace");
+        }
+        return;
+      }
+      await new Promise((resolve) => setTimeout(resolve, 2000));
+    }
+  };
+
   const loadExistingWorkspace = async () => {
     try {
       setStatus("creating");
@@ -44,7 +44,7 @@ export default function ChunkDetailPanel({ chunk, workspaceId, onClose }: ChunkD
           agent_id: agentId,
           prompt: userMessage,
           chunk_id: chunk.id,
-          chunk_content: chunk.markdown
+          document_id: chunk.document_id
         })
       });
 
@@ -1,7 +1,7 @@
 "use client";
 
 import { useState, useEffect, useRef, useMemo } from "react";
-import { downloadDocument } from "@/lib/api";
+import { downloadDocument, downloadDocumentSection, getDocumentSections } from "@/lib/api";
 
 interface Document {
   id: string;
@@ -13,6 +13,16 @@ interface Document {
   doc_id: string | null;
 }
 
+interface DocumentSection {
+  sequence: number;
+  type: string | null;
+  filename: string | null;
+  description: string | null;
+  offset: number;
+  length: number;
+  encoding: string | null;
+}
+
 interface DocumentViewerProps {
   document: Document | null;
   onClose: () => void;
@@ -24,8 +34,12 @@ export default function DocumentViewer({ document, onClose }: DocumentViewerProp
   const [content, setContent] = useState<string | null>(null);
   const [fileType, setFileType] = useState<"pdf" | "text" | null>(null);
   const [pdfUrl, setPdfUrl] = useState<string | null>(null);
+  const [sections, setSections] = useState<DocumentSection[]>([]);
+  const [activeSection, setActiveSection] = useState<number | null>(null);
 
   useEffect(() => {
+    setSections([]);
+    setActiveSection(null);
     if (!document) {
       setContent(null);
       setPdfUrl(null);
@@ -39,12 +53,27 @@ export default function DocumentViewer({ document, onClose }: DocumentViewerProp
   const loadDocument = async () => {
     if (!document) return;
 
+    const filename = document.file_path.split("/").pop() || "";
+    if (filename.toLowerCase().endsWith(".txt")) {
+      // EDGAR submissions: load only the primary report, exhibits on demand
+      try {
+        const result = await getDocumentSections(document.id);
+        const found: DocumentSection[] = result.response || [];
+        if (found.length > 0) {
+          setSections(found);
+          await loadSection(found[0]);
+          return;
+        }
+      } catch {
+        // Fall back to the whole file
+      }
+    }
+
     try {
       setLoading(true);
       setError(null);
 
       const blob = await downloadDocument(document.id);
-      const filename = document.file_path.split("/").pop() || "";
       const ext = filename.split(".").pop()?.toLowerCase();
 
       if (ext === "pdf") {
@@ -66,6 +95,36 @@ export default function DocumentViewer({ document, onClose }: DocumentViewerProp
     }
   };
 
+  const loadSection = async (section: DocumentSection) => {
+    if (!document) return;
+
+    try {
+      setLoading(true);
+      setError(null);
+      setActiveSection(section.sequence);
+
+      const blob = await downloadDocumentSection(document.id, section.sequence);
+      const ext = (section.filename || "").split(".").pop()?.toLowerCase();
+
+      if (ext === "pdf") {
+        setFileType("pdf");
+        setPdfUrl(URL.createObjectURL(blob));
+      } else if (blob.type.startsWith("image/")) {
+        setFileType("text");
+        const url = URL.createObjectURL(blob);
+        setContent(`<img src="${url}" alt="${section.filename || ""}" />`);
+      } else {
+        setFileType("text");
+        setContent(await blob.text());
+      }
+
+      setLoading(false);
+    } catch (err: any) {
+      setError(err.message || "Failed to load section");
+      setLoading(false);
+    }
+  };
+
   useEffect(() => {
     return () => {
       if (pdfUrl) {
@@ -123,6 +182,23 @@ export default function DocumentViewer({ document, onClose }: DocumentViewerProp
               Filed: {document.filing_date}
             </div>
           )}
+          {sections.length > 1 && (
+            <select
+              className="mt-2 text-sm bg-background-primary border border-border rounded px-2 py-1 text-text-primary"
+              value={activeSection ?? undefined}
+              onChange={(e) => {
+                const section = sections.find((s) => s.sequence === Number(e.target.value));
+                if (section) loadSection(section);
+              }}
+            >
+              {sections.map((section) => (
+                <option key={section.sequence} value={section.sequence}>
+                  {section.type || "Section"} {section.description ? `- ${section.description}` : ""}
+                  {section.filename ? ` (${section.filename})` : ""}
+                </option>
+              ))}
+            </select>
+          )}
         </div>
         <button
           onClick={onClose}
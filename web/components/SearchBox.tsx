@@ -18,6 +18,8 @@ export default function SearchBox() {
   const [results, setResults] = useState<SearchResult[]>([]);
   const [loading, setLoading] = useState(false);
   const abortControllerRef = useRef<AbortController | null>(null);
+  // Lets the server narrow the previous keystroke's matches instead of rescanning
+  const searchSessionRef = useRef<string>(generateWorkspaceId());
 
   useEffect(() => {
     const performSearch = async () => {
@@ -35,7 +37,7 @@ export default function SearchBox() {
       setLoading(true);
 
       try {
-        const data = await searchCompanies(query, abortControllerRef.current.signal);
+        const data = await searchCompanies(query, abortControllerRef.current.signal, searchSessionRef.current);
         setResults(data.response || []);
       } catch (error: any) {
         if (error.name !== "AbortError") {
@@ -1,8 +1,8 @@
 "use client";
 
-import { useState, useMemo, useEffect, useRef } from "react";
+import { useState, useMemo, useEffect, useRef, UIEvent } from "react";
 import { getFileIcon } from "@/lib/utils";
-import { downloadDocument } from "@/lib/api";
+import { getDocumentChunkRange, getDocumentChunks } from "@/lib/api";
 
 interface Document {
   id: string;
@@ -33,6 +33,9 @@ type TabType = "finder" | "ai-agents";
 type FilterType = "all" | "10-K" | "10-Q" | "other";
 type ViewMode = "grid" | "viewer";
 
+// Parsed documents are rendered a batch of chunks at a time
+const CHUNK_BATCH = 200;
+
 export default function WorkspaceLeftPanel({
   status,
   error,
@@ -50,6 +53,8 @@ export default function WorkspaceLeftPanel({
   const [pdfUrl, setPdfUrl] = useState<string | null>(null);
   const [loading, setLoading] = useState(false);
   const [loadError, setLoadError] = useState<string | null>(null);
+  const [chunkTotal, setChunkTotal] = useState(0);
+  const loadingMoreRef = useRef(false);
 
   const getFileName = (filePath: string) => {
     return filePath.split("/").pop() || filePath;
@@ -75,8 +80,27 @@ export default function WorkspaceLeftPanel({
     setLoading(true);
     setLoadError(null);
     setDocumentContent(null);
+    setDocumentChunks(null);
+    setChunkTotal(0);
     setPdfUrl(null);
 
+    // Parsed documents: fetch chunk metadata, then only the first batch of chunks
+    try {
+      const listing = await getDocumentChunks(doc.id, 0, 0);
+      const total = listing.response?.total || 0;
+      if (total > 0) {
+        const chunks = await getDocumentChunkRange(doc.id, 0, Math.min(total, CHUNK_BATCH));
+        setChunkTotal(total);
+        setFileType("text");
+        setDocumentChunks(chunks);
+        setDocumentContent(chunks.map((chunk) => chunk.markdown).join("\n\n"));
+        setLoading(false);
+        return;
+      }
+    } catch {
+      // Not parsed yet: fall back to the raw file
+    }
+
     try {
       const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || "http://127.0.0.1:8000"}/documents/${doc.id}/download`, {
         headers: {
@@ -118,7 +142,31 @@ export default function WorkspaceLeftPanel({
   };
 
   const handleChunkClick = (chunk: any) => {
-    onChunkSelect?.(chunk);
+    // The agent resolves the chunk's content server-side from these ids
+    onChunkSelect?.({ ...chunk, document_id: selectedDocument?.id });
+  };
+
+  const loadMoreChunks = async () => {
+    if (!selectedDocument || !documentChunks || loadingMoreRef.current) return;
+    if (documentChunks.length >= chunkTotal) return;
+
+    loadingMoreRef.current = true;
+    try {
+      const start = documentChunks.length;
+      const more = await getDocumentChunkRange(
+        selectedDocument.id,
+        start,
+        Math.min(chunkTotal, start + CHUNK_BATCH)
+      );
+      setDocumentChunks([...documentChunks, ...more]);
+      setDocumentContent(
+        (documentContent || "") + "\n\n" + more.map((chunk) => chunk.markdown).join("\n\n")
+      );
+    } catch (err: any) {
+      setLoadError(err.message || "Failed to load document");
+    } finally {
+      loadingMoreRef.current = false;
+    }
   };
 
   const handleBackToGrid = () => {
@@ -126,6 +174,7 @@ export default function WorkspaceLeftPanel({
     setSelectedDocument(null);
     setDocumentContent(null);
     setDocumentChunks(null);
+    setChunkTotal(0);
     setFileType(null);
     if (pdfUrl) {
       URL.revokeObjectURL(pdfUrl);
@@ -212,6 +261,7 @@ export default function WorkspaceLeftPanel({
               content={documentContent}
               chunks={documentChunks}
               onChunkClick={handleChunkClick}
+              onNearEnd={loadMoreChunks}
             />
           ) : null}
         </div>
@@ -317,9 +367,32 @@ export default function WorkspaceLeftPanel({
   );
 }
 
-function TextViewer({ content, chunks, onChunkClick }: { content: string; chunks?: any[] | null; onChunkClick?: (chunk: any) => void }) {
+function TextViewer({
+  content,
+  chunks,
+  onChunkClick,
+  onNearEnd,
+}: {
+  content: string;
+  chunks?: any[] | null;
+  onChunkClick?: (chunk: any) => void;
+  onNearEnd?: () => void;
+}) {
   const containerRef = useRef<HTMLDivElement>(null);
 
+  const chunksById = useMemo(() => {
+    const byId = new Map<string, any>();
+    chunks?.forEach((chunk) => byId.set(chunk.id, chunk));
+    return byId;
+  }, [chunks]);
+
+  const handleScroll = (e: UIEvent<HTMLDivElement>) => {
+    const el = e.currentTarget;
+    if (onNearEnd && el.scrollHeight - el.scrollTop - el.clientHeight < 2 * el.clientHeight) {
+      onNearEnd();
+    }
+  };
+
   const isHTML = content.trim().startsWith("<") || content.includes("<table") || content.includes("<a id=");
 
   useEffect(() => {
@@ -364,7 +437,7 @@ function TextViewer({ content, chunks, onChunkClick }: { content: string; chunks
 
       // If we found an anchor ID, find the corresponding chunk
       if (foundAnchorId) {
-        const chunk = chunks.find((c) => c.id === foundAnchorId);
+        const chunk = chunksById.get(foundAnchorId);
         if (chunk) {
           console.log('Clicked chunk:', chunk);
           onChunkClick(chunk);
@@ -378,11 +451,11 @@ function TextViewer({ content, chunks, onChunkClick }: { content: string; chunks
     return () => {
       container.removeEventListener('click', handleClick);
     };
-  }, [chunks, isHTML, onChunkClick]);
+  }, [chunks, chunksById, isHTML, onChunkClick]);
 
   if (isHTML) {
     return (
-      <div ref={containerRef} className="h-full overflow-auto bg-background-primary">
+      <div ref={containerRef} onScroll={handleScroll} className="h-full overflow-auto bg-background-primary">
         <div
           className="text-sm text-text-primary p-6 prose prose-sm max-w-none cursor-pointer"
           dangerouslySetInnerHTML={{ __html: content }}
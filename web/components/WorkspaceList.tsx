@@ -1,6 +1,6 @@
 "use client";
 
-import { useEffect, useState } from "react";
+import { useEffect, useRef, useState } from "react";
 import { useRouter } from "next/navigation";
 import { getWorkspaces } from "@/lib/api";
 
@@ -14,7 +14,10 @@ interface Workspace {
 export default function WorkspaceList() {
   const router = useRouter();
   const [workspaces, setWorkspaces] = useState<Workspace[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const loadingMoreRef = useRef(false);
 
   useEffect(() => {
     loadWorkspaces();
@@ -23,15 +26,41 @@ export default function WorkspaceList() {
   const loadWorkspaces = async () => {
     try {
       const data = await getWorkspaces();
-      setWorkspaces(data.response || []);
+      setWorkspaces(data.response?.items || []);
+      setNextCursor(data.response?.next_cursor || null);
     } catch (error) {
       console.error("Failed to load workspaces:", error);
       setWorkspaces([]);
+      setNextCursor(null);
     } finally {
       setLoading(false);
     }
   };
 
+  const loadMoreWorkspaces = async () => {
+    if (!nextCursor || loadingMoreRef.current) return;
+
+    loadingMoreRef.current = true;
+    setLoadingMore(true);
+    try {
+      const data = await getWorkspaces(nextCursor);
+      setWorkspaces((current) => [...current, ...(data.response?.items || [])]);
+      setNextCursor(data.response?.next_cursor || null);
+    } catch (error) {
+      console.error("Failed to load more workspaces:", error);
+    } finally {
+      loadingMoreRef.current = false;
+      setLoadingMore(false);
+    }
+  };
+
+  const handleScroll = (event: React.UIEvent<HTMLDivElement>) => {
+    const el = event.currentTarget;
+    if (el.scrollHeight - el.scrollTop - el.clientHeight < el.clientHeight) {
+      loadMoreWorkspaces();
+    }
+  };
+
   if (loading) {
     return (
       <div className="flex items-center justify-center h-full">
@@ -41,7 +70,7 @@ export default function WorkspaceList() {
   }
 
   return (
-    <div className="h-full overflow-y-auto">
+    <div className="h-full overflow-y-auto" onScroll={handleScroll}>
       {workspaces.length === 0 ? (
         <div className="text-text-secondary text-center py-8">
           No workspaces yet. Create one to get started.
@@ -60,6 +89,15 @@ export default function WorkspaceList() {
               </div>
             </div>
           ))}
+          {nextCursor && (
+            <button
+              onClick={loadMoreWorkspaces}
+              disabled={loadingMore}
+              className="w-full p-3 text-sm text-text-secondary border border-border hover:bg-golden-light transition-colors disabled:opacity-50"
+            >
+              {loadingMore ? "Loading..." : "Load more"}
+            </button>
+          )}
         </div>
       )}
     </div>
@@ -1,6 +1,6 @@
 "use client";
 
-import { useState, useEffect } from "react";
+import { useState, useEffect, useRef } from "react";
 import { getActivities } from "@/lib/api";
 import ChunkDetailPanel from "./ChunkDetailPanel";
 
@@ -23,7 +23,10 @@ interface WorkspaceRightPanelProps {
 export default function WorkspaceRightPanel({ workspaceId, selectedChunk, onCloseChunk }: WorkspaceRightPanelProps) {
   const [showActivity, setShowActivity] = useState(false);
   const [activities, setActivities] = useState<Activity[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const [loading, setLoading] = useState(false);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const loadingMoreRef = useRef(false);
 
   useEffect(() => {
     if (showActivity && workspaceId) {
@@ -37,7 +40,8 @@ export default function WorkspaceRightPanel({ workspaceId, selectedChunk, onClos
     try {
       setLoading(true);
       const response = await getActivities(workspaceId);
-      setActivities(response.response || []);
+      setActivities(response.response?.items || []);
+      setNextCursor(response.response?.next_cursor || null);
     } catch (error) {
       console.error("Failed to load activities:", error);
     } finally {
@@ -45,6 +49,30 @@ export default function WorkspaceRightPanel({ workspaceId, selectedChunk, onClos
     }
   };
 
+  const loadMoreActivities = async () => {
+    if (!workspaceId || !nextCursor || loadingMoreRef.current) return;
+
+    loadingMoreRef.current = true;
+    setLoadingMore(true);
+    try {
+      const response = await getActivities(workspaceId, nextCursor);
+      setActivities((current) => [...current, ...(response.response?.items || [])]);
+      setNextCursor(response.response?.next_cursor || null);
+    } catch (error) {
+      console.error("Failed to load more activities:", error);
+    } finally {
+      loadingMoreRef.current = false;
+      setLoadingMore(false);
+    }
+  };
+
+  const handleActivityScroll = (event: React.UIEvent<HTMLDivElement>) => {
+    const el = event.currentTarget;
+    if (el.scrollHeight - el.scrollTop - el.clientHeight < el.clientHeight) {
+      loadMoreActivities();
+    }
+  };
+
   const formatDate = (dateString: string) => {
     const date = new Date(dateString);
     const now = new Date();
@@ -87,7 +115,7 @@ export default function WorkspaceRightPanel({ workspaceId, selectedChunk, onClos
         </button>
 
         {showActivity && (
-          <div className="max-h-96 overflow-y-auto bg-background-secondary">
+          <div className="max-h-96 overflow-y-auto bg-background-secondary" onScroll={handleActivityScroll}>
             {loading ? (
               <div className="p-6 text-center text-text-secondary text-sm">
                 Loading activities...
@@ -131,6 +159,15 @@ export default function WorkspaceRightPanel({ workspaceId, selectedChunk, onClos
                     </div>
                   </div>
                 ))}
+                {nextCursor && (
+                  <button
+                    onClick={loadMoreActivities}
+                    disabled={loadingMore}
+                    className="w-full py-2 text-xs text-text-secondary hover:text-text-primary transition-colors disabled:opacity-50"
+                  >
+                    {loadingMore ? "Loading..." : "Load more"}
+                  </button>
+                )}
               </div>
             )}
           </div>
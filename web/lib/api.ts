@@ -36,12 +36,20 @@ async function apiRequest<T = any>(
   return response.json();
 }
 
-export async function searchCompanies(query: string, signal?: AbortSignal) {
-  return apiRequest(`/search_listed?query=${encodeURIComponent(query)}`, { signal });
+export async function searchCompanies(query: string, signal?: AbortSignal, session?: string) {
+  const sessionParam = session ? `&session=${encodeURIComponent(session)}` : "";
+  return apiRequest(`/search_listed?query=${encodeURIComponent(query)}${sessionParam}`, { signal });
 }
 
-export async function getWorkspaces() {
-  return apiRequest("/data/workspace");
+export interface Page<T = any> {
+  items: T[];
+  next_cursor: string | null;
+  latest_cursor: string | null;
+}
+
+export async function getWorkspaces(cursor?: string) {
+  const cursorParam = cursor ? `?cursor=${encodeURIComponent(cursor)}` : "";
+  return apiRequest<Page>(`/data/workspace${cursorParam}`);
 }
 
 export async function getWorkspaceById(workspaceId: string) {
@@ -68,6 +76,10 @@ export async function createWorkspace(
   });
 }
 
+export async function getJob(jobId: string) {
+  return apiRequest(`/jobs/${jobId}`);
+}
+
 export async function getDocuments(workspaceId: string) {
   return apiRequest(`/documents?workspace_id=${encodeURIComponent(workspaceId)}`);
 }
@@ -89,6 +101,55 @@ export async function downloadDocument(documentId: string): Promise<Blob> {
   return response.blob();
 }
 
-export async function getActivities(workspaceId: string) {
-  return apiRequest(`/data/activity?workspace_id=${encodeURIComponent(workspaceId)}`);
+export async function getDocumentSections(documentId: string) {
+  return apiRequest(`/documents/${documentId}/sections`);
+}
+
+export async function downloadDocumentSection(documentId: string, sequence: number): Promise<Blob> {
+  const url = `${API_URL}/documents/${documentId}/sections/${sequence}`;
+
+  const headers: Record<string, string> = {};
+  if (API_SECRET) {
+    headers["Authorization"] = `Bearer ${API_SECRET}`;
+  }
+
+  const response = await fetch(url, { headers });
+
+  if (!response.ok) {
+    throw new Error(`Failed to download section: ${response.statusText}`);
+  }
+
+  return response.blob();
+}
+
+export async function getDocumentChunks(documentId: string, offset = 0, limit = 100) {
+  return apiRequest(`/documents/${documentId}/chunks?offset=${offset}&limit=${limit}`);
+}
+
+export async function getDocumentChunkRange(documentId: string, start: number, end: number): Promise<any[]> {
+  const url = `${API_URL}/documents/${documentId}/chunks/range?start=${start}&end=${end}`;
+
+  const headers: Record<string, string> = {};
+  if (API_SECRET) {
+    headers["Authorization"] = `Bearer ${API_SECRET}`;
+  }
+
+  const response = await fetch(url, { headers });
+
+  if (!response.ok) {
+    throw new Error(`Failed to load chunks: ${response.statusText}`);
+  }
+
+  return response.json();
+}
+
+export async function searchWorkspace(workspaceId: string, query: string, limit = 20) {
+  return apiRequest(
+    `/search_workspace?workspace_id=${encodeURIComponent(workspaceId)}&query=${encodeURIComponent(query)}&limit=${limit}`
+  );
+}
+
+export async function getActivities(workspaceId: string, cursor?: string) {
+  const cursorParam = cursor ? `&cursor=${encodeURIComponent(cursor)}` : "";
+  return apiRequest<Page>(`/data/activity?workspace_id=${encodeURIComponent(workspaceId)}${cursorParam}`);
 }